@@ -9,12 +9,15 @@ Usage:
     python examples/basic_line.py
 
 This should open a window showing a sine wave plot.
+
+Requires numpy.
 """
 
-import math
 import sys
 import os
 
+import numpy as np
+
 # Allow running from repo root without installing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -22,7 +25,7 @@ import spectra as sp
 
 frequency = 5.0 # Hz
 amplitude = 2.0
-w = 2 * math.pi * frequency
+w = 2 * np.pi * frequency
 
 
 sample_rate = 200.0 # Hz
@@ -30,8 +33,8 @@ sampling_time = 4.0 # Seconds
 
 # Generate data: sine wave
 n = int(sample_rate * sampling_time)
-x = [i / sample_rate for i in range(n)]
-y = [amplitude * math.sin(w * xi) for xi in x]
+x = np.arange(n) / sample_rate
+y = amplitude * np.sin(w * x)
 
 # Create session (auto-launches backend if needed)
 s = sp.Session()
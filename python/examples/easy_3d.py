@@ -2,25 +2,27 @@
 """3D plotting one-liners — helix, scatter cloud, surface.
 
 Uses GPU-accelerated 3D rendering via the Spectra Axes3D backend.
+Requires numpy.
 
 Usage:
     python examples/easy_3d.py
 """
 
-import math
 import os
-import random
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import numpy as np
+
 import spectra as sp
 
 # ─── Example 1: 3D Helix ─────────────────────────────────────────────────────
-t = [i * 0.05 for i in range(200)]
-x = [math.cos(ti * 2) for ti in t]
-y = [math.sin(ti * 2) for ti in t]
-z = list(t)
+t = np.arange(200) * 0.05
+two_t = 2.0 * t
+x = np.cos(two_t)
+y = np.sin(two_t)
+z = t
 
 sp.plot3(x, y, z, color="cyan", label="helix")
 sp.title("3D Helix")
@@ -28,26 +30,22 @@ sp.grid()
 
 # ─── Example 2: 3D Scatter Cloud (new window) ────────────────────────────────
 sp.figure("3D Scatter Cloud")
-random.seed(42)
+rng = np.random.default_rng(42)
 n = 500
-sx = [random.gauss(0, 1) for _ in range(n)]
-sy = [random.gauss(0, 1) for _ in range(n)]
-sz = [random.gauss(0, 1) for _ in range(n)]
+sx, sy, sz = rng.standard_normal((3, n))
 
 sp.scatter3(sx, sy, sz, color="orange", size=3, label="random cloud")
 sp.title("3D Scatter")
 
-# ─── Example 3: Surface (new window, requires numpy) ─────────────────────────
-try:
-    import numpy as np
-
-    sp.figure("Surface Plot")
-    X, Y = np.meshgrid(np.linspace(-3, 3, 40), np.linspace(-3, 3, 40))
-    Z = np.sin(X) * np.cos(Y)
-    sp.surf(X.ravel().tolist(), Y.ravel().tolist(), Z.ravel().tolist(), color="purple")
-    sp.title("sin(x) * cos(y)")
-except ImportError:
-    print("numpy not installed — skipping surface example")
+# ─── Example 3: Surface (new window) ─────────────────────────────────────────
+sp.figure("Surface Plot")
+# float32 matches the GPU vertex format, so nothing is widened or narrowed
+# on the way to the renderer.
+grid = np.linspace(-3, 3, 40, dtype=np.float32)
+X, Y = np.meshgrid(grid, grid)
+Z = np.sin(X) * np.cos(Y)
+sp.surf(X, Y, Z, color="purple")
+sp.title("sin(x) * cos(y)")
 
 # ─── Block ────────────────────────────────────────────────────────────────────
 print("Close all windows to exit.")
@@ -70,12 +70,11 @@ def demo_custom_size():
 def demo_scatter():
     """Scatter plot."""
     print("🔵 Scatter plot")
-    import random
+    import numpy as np
     
     # Generate random scatter data
-    random.seed(42)
-    x = [random.random() * 10 for _ in range(100)]
-    y = [random.random() * 10 for _ in range(100)]
+    rng = np.random.default_rng(42)
+    x, y = rng.uniform(0, 10, size=(2, 100))
     
     spe.scatter(x, y, save="scatter_demo.png")
     print("   Scatter plot with 100 points saved to scatter_demo.png")
@@ -85,12 +84,12 @@ def demo_scatter():
 def demo_multi_series():
     """Multiple series on one plot."""
     print("📊 Multi-series plot")
-    import math
+    import numpy as np
     
-    x = [i * 0.1 for i in range(100)]
-    y1 = [math.sin(v) for v in x]
-    y2 = [math.cos(v) for v in x]
-    y3 = [v * 0.5 for v in x]  # Linear
+    x = np.arange(100, dtype=np.float32) * np.float32(0.1)
+    y1 = np.sin(x)
+    y2 = np.cos(x)
+    y3 = 0.5 * x  # Linear
     
     spe.render_multi([
         (x, y1, "b-", "sin(x)"),
@@ -106,13 +105,14 @@ def demo_multi_series():
 def demo_histogram():
     """Histogram plot."""
     print("📊 Histogram")
-    import random
+    import numpy as np
     
     # Generate normal distribution data
-    random.seed(123)
-    data = [random.gauss(0, 1) for _ in range(1000)]
+    data = np.random.default_rng(123).standard_normal(1000)
     
-    spe.histogram(data, bins=30, save="histogram_demo.png")
+    # Bin in NumPy and hand only the 30 bins to the renderer
+    counts, edges = np.histogram(data, bins=30)
+    spe.histogram_counts(edges, counts, save="histogram_demo.png")
     print("   Histogram of 1000 normal samples (30 bins)")
     print("   Saved to histogram_demo.png")
     print()
@@ -163,8 +163,9 @@ def demo_performance():
     
     # Large dataset
     n = 50000
-    x = np.linspace(0, 100, n)
-    y = np.sin(x * 0.5) + np.random.normal(0, 0.1, n)
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 100, n, dtype=np.float32)
+    y = np.sin(0.5 * x) + rng.normal(0, 0.1, n).astype(np.float32)
     
     start = time.time()
     img = spe.render(x, y, width=1600, height=900)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """Easy Embed + PyQt5 example.
 
-This example uses the high-level `spectra.embed` API to render offscreen frames
-and display them inside a Qt widget.
+This example renders offscreen frames with the in-process embed renderer and
+displays them inside a Qt widget. The surface and its series are created once;
+each frame only swaps the y data and renders straight into a persistent QImage.
 
 Requirements:
-    pip install PyQt5
+    pip install PyQt5 numpy
 
 Build requirements (from project root):
     cmake -S . -B build -DSPECTRA_BUILD_EMBED_SHARED=ON
@@ -24,130 +25,175 @@ Controls:
 
 from __future__ import annotations
 
+import ctypes
 import math
 import os
 import sys
 from pathlib import Path
 
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QImage, QKeyEvent, QPainter
-from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
-
 # Ensure `import spectra` works when run from the source tree.
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import spectra.embed as spe
-
-
-class EasyEmbedCanvas(QWidget):
-    """Qt widget that displays frames rendered via spectra.embed."""
-
-    def __init__(self, parent: QWidget | None = None) -> None:
-        super().__init__(parent)
-        self.setMinimumSize(480, 320)
-        self.setFocusPolicy(Qt.StrongFocus)
-
-        self._phase = 0.0
-        self._playing = True
-        self._image: QImage | None = None
-
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_tick)
-        self._timer.start(33)  # ~30 FPS
-
-        self._render_frame()
-
-    def _build_series(self, phase: float):
-        x = [i * 0.02 for i in range(700)]
-        y1 = [math.sin(v + phase) for v in x]
-        y2 = [0.5 * math.cos(v * 0.7 - phase * 1.3) for v in x]
-        y3 = [0.15 * math.sin(v * 2.5 + phase * 0.4) for v in x]
-        return x, y1, y2, y3
-
-    def _render_frame(self) -> None:
-        w = max(2, self.width())
-        h = max(2, self.height())
-
-        x, y1, y2, y3 = self._build_series(self._phase)
-        img = spe.render_multi(
-            [
-                (x, y1, "sin(x + t)"),
-                (x, y2, "0.5 cos(0.7x - 1.3t)"),
-                (x, y3, "0.15 sin(2.5x + 0.4t)"),
-            ],
-            width=w,
-            height=h,
-            title="Spectra Easy Embed in PyQt5",
-        )
-
-        # Convert RGBA bytes to QImage. copy() detaches from Python-owned bytes.
-        self._image = QImage(
-            img.data,
-            img.width,
-            img.height,
-            img.stride,
-            QImage.Format_RGBA8888,
-        ).copy()
-        self.update()
-
-    def _on_tick(self) -> None:
-        if not self._playing:
-            return
-        self._phase += 0.06
-        self._render_frame()
-
-    def paintEvent(self, event) -> None:  # noqa: N802 (Qt naming)
-        if not self._image or self._image.isNull():
-            return
-        painter = QPainter(self)
-        painter.drawImage(self.rect(), self._image)
-        painter.end()
-
-    def resizeEvent(self, event) -> None:  # noqa: N802 (Qt naming)
-        super().resizeEvent(event)
-        self._render_frame()
-
-    def keyPressEvent(self, event: QKeyEvent) -> None:  # noqa: N802 (Qt naming)
-        if event.key() == Qt.Key_Space:
-            self._playing = not self._playing
-            self._render_frame()
-            return
-
-        if event.key() == Qt.Key_S and self._image and not self._image.isNull():
-            out = "easy_embed_pyqt_frame.png"
-            if self._image.save(out):
-                print(f"Saved frame to {os.path.abspath(out)}")
-            else:
-                print("Failed to save frame")
-            return
-
-        super().keyPressEvent(event)
-
+from spectra._embed import EmbedSurface
+
+
+def _define_widgets():
+    """Import Qt and numpy and build the widget classes.
+
+    Kept out of module scope so importing this file (e.g. for inspection or
+    from scripts) does not load the Qt shared libraries.
+    """
+    import numpy as np
+    from PyQt5.QtCore import QTimer, Qt
+    from PyQt5.QtGui import QImage, QKeyEvent, QPainter
+    from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+    class EasyEmbedCanvas(QWidget):
+        """Qt widget that displays frames rendered via spectra.embed."""
+
+        def __init__(self, parent: QWidget | None = None) -> None:
+            super().__init__(parent)
+            self.setMinimumSize(480, 320)
+            self.setFocusPolicy(Qt.StrongFocus)
+
+            self._phase = 0.0
+            self._playing = True
+            # Only render when something changed: a new phase or a new size.
+            self._dirty = True
+
+            # The x grid never changes and time only enters as a phase shift, so
+            # precompute the sin/cos tables once (amplitudes folded in) and expand
+            # each frame with sin(a + b) = sin(a)cos(b) + cos(a)sin(b). float32
+            # keeps the hand-off to the embed renderer zero-copy.
+            self._x = np.arange(700, dtype=np.float32) * np.float32(0.02)
+            self._sin_x = np.sin(self._x)
+            self._cos_x = np.cos(self._x)
+            self._cos_07x = 0.5 * np.cos(0.7 * self._x)
+            self._sin_07x = 0.5 * np.sin(0.7 * self._x)
+            self._sin_25x = 0.15 * np.sin(2.5 * self._x)
+            self._cos_25x = 0.15 * np.cos(2.5 * self._x)
+
+            # One persistent surface + series; frames only update the y data.
+            w, h = self._widget_size()
+            self._surface = EmbedSurface(w, h)
+            self._ax = self._surface.figure().subplot(1, 1, 1)
+            _, y1, y2, y3 = self._build_series(self._phase)
+            self._lines = (
+                self._ax.line(self._x, y1, label="sin(x + t)"),
+                self._ax.line(self._x, y2, label="0.5 cos(0.7x - 1.3t)"),
+                self._ax.line(self._x, y3, label="0.15 sin(2.5x + 0.4t)"),
+            )
+            self._ax.set_title("Spectra Easy Embed in PyQt5")
+            self._ax.set_grid(True)
+
+            # Frames are rendered directly into this image's pixel memory.
+            self._image = QImage(w, h, QImage.Format_RGBA8888)
+            self._last_size = (w, h)
+
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self._on_tick)
+            self._timer.start(33)  # ~30 FPS
 
-class MainWindow(QWidget):
-    def __init__(self) -> None:
-        super().__init__()
-        self.setWindowTitle("Spectra — Easy Embed PyQt5 Demo")
-        self.resize(1100, 700)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        help_text = QLabel(
-            "  Spectra easy embed (offscreen Vulkan)  |  Space: play/pause  |  S: save frame"
-        )
-        help_text.setStyleSheet(
-            "background:#0f172a; color:#cbd5e1; padding:6px; font-size:12px;"
-        )
-        layout.addWidget(help_text)
+            self._render_frame()
 
-        self.canvas = EasyEmbedCanvas(self)
-        layout.addWidget(self.canvas)
+        def _build_series(self, phase: float):
+            p2 = phase * 1.3
+            p3 = phase * 0.4
+            y1 = self._sin_x * math.cos(phase) + self._cos_x * math.sin(phase)
+            y2 = self._cos_07x * math.cos(p2) + self._sin_07x * math.sin(p2)
+            y3 = self._sin_25x * math.cos(p3) + self._cos_25x * math.sin(p3)
+            return self._x, y1, y2, y3
+
+        def _widget_size(self) -> tuple[int, int]:
+            return max(2, self.width()), max(2, self.height())
+
+        def _render_frame(self) -> None:
+            size = self._widget_size()
+            if size != self._last_size:
+                if not self._surface.resize(*size):
+                    return
+                self._image = QImage(size[0], size[1], QImage.Format_RGBA8888)
+                self._last_size = size
+
+            _, y1, y2, y3 = self._build_series(self._phase)
+            for line, y in zip(self._lines, (y1, y2, y3)):
+                line.set_y(y)
+            self._ax.auto_fit()
+
+            # bits() detaches the image if it is shared, so writing through the
+            # returned address never touches another QImage's pixels.
+            n = self._image.byteCount()
+            target = (ctypes.c_uint8 * n).from_address(int(self._image.bits()))
+            if self._surface.render_into(target):
+                self._dirty = False
+                self.update()
+
+        def _on_tick(self) -> None:
+            if self._playing:
+                self._phase += 0.06
+                self._dirty = True
+            if self._dirty:
+                self._render_frame()
+
+        def paintEvent(self, event) -> None:  # noqa: N802 (Qt naming)
+            if self._image.isNull():
+                return
+            painter = QPainter(self)
+            painter.drawImage(self.rect(), self._image)
+            painter.end()
+
+        def resizeEvent(self, event) -> None:  # noqa: N802 (Qt naming)
+            super().resizeEvent(event)
+            # Defer to the next tick so a resize storm costs a single render;
+            # until then paintEvent scales the previous frame.
+            if self._widget_size() != self._last_size:
+                self._dirty = True
+
+        def keyPressEvent(self, event: QKeyEvent) -> None:  # noqa: N802 (Qt naming)
+            if event.key() == Qt.Key_Space:
+                # The current frame stays valid; nothing to re-render.
+                self._playing = not self._playing
+                return
+
+            if event.key() == Qt.Key_S and not self._image.isNull():
+                out = "easy_embed_pyqt_frame.png"
+                if self._image.save(out):
+                    print(f"Saved frame to {os.path.abspath(out)}")
+                else:
+                    print("Failed to save frame")
+                return
+
+            super().keyPressEvent(event)
+
+    class MainWindow(QWidget):
+        def __init__(self) -> None:
+            super().__init__()
+            self.setWindowTitle("Spectra — Easy Embed PyQt5 Demo")
+            self.resize(1100, 700)
+
+            layout = QVBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(0)
+
+            help_text = QLabel(
+                "  Spectra easy embed (offscreen Vulkan)  |  Space: play/pause  |  S: save frame"
+            )
+            help_text.setStyleSheet(
+                "background:#0f172a; color:#cbd5e1; padding:6px; font-size:12px;"
+            )
+            layout.addWidget(help_text)
+
+            self.canvas = EasyEmbedCanvas(self)
+            layout.addWidget(self.canvas)
+
+    return MainWindow
 
 
 def main() -> None:
+    from PyQt5.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
+    MainWindow = _define_widgets()
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
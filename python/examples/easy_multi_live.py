@@ -2,6 +2,7 @@
 """Multi-signal live streaming — multiple series updating in real-time.
 
 Shows how to use sp.live() with manual series control for multiple signals.
+Requires numpy.
 
 Usage:
     python examples/easy_multi_live.py
@@ -13,6 +14,8 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import numpy as np
+
 import spectra as sp
 
 sp.set_log_level("INFO")  # set to DEBUG for more details on IPC and backend
@@ -29,27 +32,39 @@ cos_line = sp.plot([], [], color="blue", label="cos(3t)")
 saw_line = sp.plot([], [], color="green", label="sawtooth")
 sp.legend()
 
-# Buffers for sliding window
-t_buf = []
-sin_buf = []
-cos_buf = []
-saw_buf = []
+# Preallocated ring buffer for the sliding window. Each sample is written
+# twice (at i and i + WINDOW) so the latest WINDOW samples are always one
+# contiguous slice — no per-frame allocation or reordering.
 WINDOW = 300  # 10 seconds at 30 FPS
+ring = np.empty((4, 2 * WINDOW))  # rows: t, sin, cos, saw
+count = 0
 
 
 def update(t, dt):
-    t_buf.append(t)
-    sin_buf.append(math.sin(t * 2.0))
-    cos_buf.append(math.cos(t * 3.0) * 0.7)
-    saw_buf.append((t % 2.0) - 1.0)
-
-    # Sliding window
-    if len(t_buf) > WINDOW:
-        del t_buf[0], sin_buf[0], cos_buf[0], saw_buf[0]
-
-    sin_line.set_data(t_buf, sin_buf)
-    cos_line.set_data(t_buf, cos_buf)
-    saw_line.set_data(t_buf, saw_buf)
+    global count
+    i = count % WINDOW
+    sample = (t, math.sin(t * 2.0), math.cos(t * 3.0) * 0.7, (t % 2.0) - 1.0)
+    ring[:, i] = sample
+    ring[:, i + WINDOW] = sample
+    count += 1
+
+    n = min(count, WINDOW)
+    t_buf, sin_buf, cos_buf, saw_buf = ring[:, i + 1 + WINDOW - n:i + 1 + WINDOW]
+
+    # live() runs each tick inside sp.batch(), so everything below goes out
+    # as one socket write per frame.
+    if count > WINDOW and count % WINDOW == 0:
+        # Once per window, resend the visible samples so the backend
+        # copy never grows past 2 * WINDOW points.
+        sin_line.set_data(t_buf, sin_buf)
+        cos_line.set_data(t_buf, cos_buf)
+        saw_line.set_data(t_buf, saw_buf)
+    else:
+        # Otherwise only ship the new sample; older points scroll out
+        # of view through xlim.
+        sin_line.append([sample[0]], [sample[1]])
+        cos_line.append([sample[0]], [sample[2]])
+        saw_line.append([sample[0]], [sample[3]])
 
     # Auto-scroll x axis
     if len(t_buf) > 1:
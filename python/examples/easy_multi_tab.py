@@ -8,20 +8,23 @@ Demonstrates:
   - Mixing tabs with subplots
   - Advanced API: fig.show(window_id=other_fig.window_id)
 
+Requires numpy.
+
 Usage:
     python examples/easy_multi_tab.py
 """
 
 import math
 import os
-import random
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import numpy as np
+
 import spectra as sp
 
-random.seed(42)
+rng = np.random.default_rng(42)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tab 1: Sine & Cosine (auto-created with first plot)
@@ -31,11 +34,7 @@ x = [i * 0.05 for i in range(200)]
 
 sp.plot(x, [math.sin(xi) for xi in x], color="red", label="sin(x)")
 sp.plot(x, [math.cos(xi) for xi in x], color="blue", label="cos(x)")
-sp.title("Trigonometry")
-sp.xlabel("x")
-sp.ylabel("y")
-sp.legend()
-sp.grid()
+sp.axes(title="Trigonometry", xlabel="x", ylabel="y", legend=True, grid=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tab 2: Scatter plot (new tab in SAME window)
@@ -43,13 +42,10 @@ sp.grid()
 
 sp.tab("Scatter")
 
-sx = [random.gauss(0, 1) for _ in range(300)]
-sy = [0.7 * xi + random.gauss(0, 0.5) for xi in sx]
+sx = rng.standard_normal(300)
+sy = 0.7 * sx + rng.normal(0, 0.5, size=sx.shape)
 sp.scatter(sx, sy, color="orange", size=3, label="correlated")
-sp.title("Scatter with Correlation")
-sp.xlabel("x")
-sp.ylabel("y")
-sp.grid()
+sp.axes(title="Scatter with Correlation", xlabel="x", ylabel="y", grid=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tab 3: Histogram + statistics (new tab, same window)
@@ -57,13 +53,10 @@ sp.grid()
 
 sp.tab("Distribution")
 
-data = [random.gauss(5, 2) for _ in range(2000)]
+data = rng.normal(5.0, 2.0, size=2000)
 sp.hist(data, bins=50, color="green")
-sp.title("Normal Distribution (μ=5, σ=2)")
-sp.xlabel("value")
-sp.ylabel("frequency")
 sp.vline(5.0, color="red")  # mean
-sp.grid()
+sp.axes(title="Normal Distribution (μ=5, σ=2)", xlabel="value", ylabel="frequency", grid=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tab 4: Subplots inside a tab (new tab, same window)
@@ -71,17 +64,15 @@ sp.grid()
 
 sp.tab("Multi-Panel")
 
-x2 = [i * 0.02 for i in range(500)]
+x2 = np.arange(500) * 0.02
 
 sp.subplot(2, 1, 1)
-sp.plot(x2, [math.exp(-xi) * math.cos(xi * 10) for xi in x2], color="magenta", width=2)
-sp.title("Damped Oscillation")
-sp.grid()
+sp.plot(x2, np.exp(-x2) * np.cos(10.0 * x2), color="magenta", width=2)
+sp.axes(title="Damped Oscillation", grid=True)
 
 sp.subplot(2, 1, 2)
-sp.plot(x2, [xi ** 0.5 * math.sin(xi * 5) for xi in x2], color="cyan", width=2)
-sp.title("sqrt(x) · sin(5x)")
-sp.grid()
+sp.plot(x2, np.sqrt(x2) * np.sin(5.0 * x2), color="cyan", width=2)
+sp.axes(title="sqrt(x) · sin(5x)", grid=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tab 5: Bar chart (new tab, same window)
@@ -92,10 +83,7 @@ sp.tab("Bar Chart")
 categories = [1, 2, 3, 4, 5, 6, 7, 8]
 values = [23, 45, 12, 67, 34, 56, 78, 41]
 sp.bar(categories, values, color="purple")
-sp.title("Monthly Sales")
-sp.xlabel("Month")
-sp.ylabel("Units Sold")
-sp.grid()
+sp.axes(title="Monthly Sales", xlabel="Month", ylabel="Units Sold", grid=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 print("1 window with 5 tabs. Close to exit.")
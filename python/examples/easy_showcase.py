@@ -9,6 +9,8 @@ Demonstrates:
   - Live streaming
   - Horizontal/vertical lines
 
+Requires numpy.
+
 Usage:
     python examples/easy_showcase.py
 """
@@ -20,9 +22,12 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import numpy as np
+
 import spectra as sp
 
 random.seed(42)
+rng = np.random.default_rng(42)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Window 1: Classic plots
@@ -34,24 +39,23 @@ x = [i * 0.05 for i in range(200)]
 sp.subplot(2, 2, 1)
 sp.plot(x, [math.sin(xi) for xi in x], color="red", label="sin")
 sp.plot(x, [math.cos(xi) for xi in x], color="blue", label="cos")
-    sp.hline(0.0)
-    sp.vline(0.0, color="gray")
-    sp.fplot(lambda xi: xi * xi, -3, 3, color="green", label="x²")
+sp.hline(0.0)
+sp.vline(0.0, color="gray")
+sp.fplot(lambda xi: xi * xi, -3, 3, color="green", label="x²")
 sp.title("Line Plot")
 sp.legend()
 sp.grid()
 
 # Top-right: Scatter plot
 sp.subplot(2, 2, 2)
-sx = [random.gauss(0, 1) for _ in range(200)]
-sy = [random.gauss(0, 1) for _ in range(200)]
+sx, sy = rng.standard_normal((2, 200))
 sp.scatter(sx, sy, color="orange", size=3, label="gaussian")
 sp.title("Scatter Plot")
 sp.grid()
 
 # Bottom-left: Histogram
 sp.subplot(2, 2, 3)
-data = [random.gauss(5, 2) for _ in range(1000)]
+data = rng.normal(5.0, 2.0, size=1000)
 sp.hist(data, bins=40, color="green")
 sp.title("Histogram")
 sp.xlabel("value")
@@ -83,19 +87,23 @@ sig1 = sp.plot([], [], color="red", label="sensor A")
 sig2 = sp.plot([], [], color="cyan", label="sensor B")
 sp.legend()
 
-t_buf = []
-s1_buf = []
-s2_buf = []
+# Keep last 10 seconds in a preallocated ring; each sample is mirrored at
+# i + WINDOW so the window is always one contiguous slice.
+WINDOW = 300
+ring = np.empty((3, 2 * WINDOW))  # rows: t, sensor A, sensor B
+count = 0
 
 
 def stream(t, dt):
-    t_buf.append(t)
-    s1_buf.append(math.sin(t * 2) + random.gauss(0, 0.1))
-    s2_buf.append(math.cos(t * 1.5) * 0.8 + random.gauss(0, 0.05))
+    global count
+    i = count % WINDOW
+    sample = (t, math.sin(t * 2) + random.gauss(0, 0.1), math.cos(t * 1.5) * 0.8 + random.gauss(0, 0.05))
+    ring[:, i] = sample
+    ring[:, i + WINDOW] = sample
+    count += 1
 
-    # Keep last 10 seconds
-    while len(t_buf) > 300:
-        del t_buf[0], s1_buf[0], s2_buf[0]
+    n = min(count, WINDOW)
+    t_buf, s1_buf, s2_buf = ring[:, i + 1 + WINDOW - n:i + 1 + WINDOW]
 
     sig1.set_data(t_buf, s1_buf)
     sig2.set_data(t_buf, s2_buf)
@@ -114,13 +122,13 @@ sp.live(stream, fps=30)
 sp.figure("Math Functions")
 
 sp.subplot(2, 1, 1)
-x2 = [i * 0.02 for i in range(500)]
-sp.plot(x2, [math.exp(-xi) * math.cos(xi * 10) for xi in x2], color="magenta", width=2)
+x2 = np.arange(500) * 0.02
+sp.plot(x2, np.exp(-x2) * np.cos(10.0 * x2), color="magenta", width=2)
 sp.title("Damped Oscillation: e^(-x) * cos(10x)")
 sp.grid()
 
 sp.subplot(2, 1, 2)
-sp.plot(x2, [xi ** 0.5 * math.sin(xi * 5) for xi in x2], color="orange", width=2)
+sp.plot(x2, np.sqrt(x2) * np.sin(5.0 * x2), color="orange", width=2)
 sp.title("sqrt(x) * sin(5x)")
 sp.grid()
 
@@ -1,24 +1,27 @@
 #!/usr/bin/env python3
 """Subplot examples — multiple plots in one window.
 
+Requires numpy.
+
 Usage:
     python examples/easy_subplots.py
 """
 
-import math
 import os
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import numpy as np
+
 import spectra as sp
 
 # Generate data
-x = [i * 0.05 for i in range(200)]
-sin_y = [math.sin(xi) for xi in x]
-cos_y = [math.cos(xi) for xi in x]
-tan_y = [max(-5, min(5, math.tan(xi))) for xi in x]
-exp_y = [math.exp(-xi * 0.3) * math.sin(xi * 3) for xi in x]
+x = np.arange(200) * 0.05
+sin_y = np.sin(x)
+cos_y = np.cos(x)
+tan_y = np.clip(np.tan(x), -5.0, 5.0)
+exp_y = np.exp(-0.3 * x) * np.sin(3.0 * x)
 
 # ─── 2x2 subplot grid ────────────────────────────────────────────────────────
 sp.subplot(2, 2, 1)
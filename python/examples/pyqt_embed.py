@@ -2,7 +2,7 @@
 """PyQt5 example: embed a GPU-accelerated Spectra plot inside a QWidget.
 
 Requirements:
-    pip install PyQt5
+    pip install PyQt5 numpy
     # Build the shared library first:
     cd build && cmake .. -DSPECTRA_BUILD_EMBED_SHARED=ON && make spectra_embed
 
@@ -14,10 +14,11 @@ using QImage + QPainter. Pan with left-drag, zoom with scroll wheel,
 reset with 'R' key.
 """
 
-import math
 import sys
 import os
 
+import numpy as np
+
 # Add parent directory so we can import spectra
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -31,16 +32,25 @@ from spectra._embed import (
     MOD_SHIFT,
     MOD_CONTROL,
     MOD_ALT,
-    KEY_R,
-    KEY_G,
-    KEY_A,
     KEY_ESCAPE,
 )
 
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
 from PyQt5.QtGui import QImage, QPainter, QMouseEvent, QWheelEvent, QKeyEvent
 from PyQt5.QtCore import Qt, QTimer
-import ctypes
+
+
+_BUTTON_MAP = {
+    Qt.LeftButton: MOUSE_LEFT,
+    Qt.RightButton: MOUSE_RIGHT,
+    Qt.MiddleButton: MOUSE_MIDDLE,
+}
+
+# Letters A-Z (65-90) and digits 0-9 (48-57) match between Qt and GLFW;
+# the table is built once so each key event is a single lookup.
+_KEY_MAP = {k: k for k in range(Qt.Key_A, Qt.Key_Z + 1)}
+_KEY_MAP.update({k: k for k in range(Qt.Key_0, Qt.Key_9 + 1)})
+_KEY_MAP[Qt.Key_Escape] = KEY_ESCAPE
 
 
 class SpectraWidget(QWidget):
@@ -62,52 +72,55 @@ class SpectraWidget(QWidget):
 
         # Generate sample data: sin, cos, and a damped wave
         N = 300
-        x = [i * 0.05 for i in range(N)]
-        y_sin = [math.sin(v) for v in x]
-        y_cos = [math.cos(v) for v in x]
-        y_damp = [math.exp(-v * 0.1) * math.sin(v * 2) for v in x]
+        x = np.arange(N, dtype=np.float32) * np.float32(0.05)
+        y_sin = np.sin(x)
+        y_cos = np.cos(x)
+        y_damp = np.exp(-0.1 * x) * np.sin(2.0 * x)
 
         ax.line(x, y_sin, label="sin(x)")
         ax.line(x, y_cos, label="cos(x)")
         ax.line(x, y_damp, label="damped")
 
-        # Pre-allocate pixel buffer for zero-copy rendering
-        buf_size = self.width() * self.height() * 4
-        self._pixel_buf = (ctypes.c_uint8 * buf_size)()
-        self._qimage = None
+        # Pre-allocate pixel buffer + QImage wrapper for zero-copy rendering
+        self._alloc_buffer(self.width(), self.height())
 
-        # Initial render
-        self._render_frame()
+        # Rendering happens in paintEvent; event handlers only call update(),
+        # which Qt coalesces so a burst of input costs one render per paint.
 
-        # Timer for animation updates (~60 FPS)
+        # Animation timer at the display refresh rate (60 Hz if unknown)
+        screen = QApplication.primaryScreen()
+        hz = (screen.refreshRate() if screen is not None else 0.0) or 60.0
+        self._frame_dt = 1.0 / hz
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
         self._timer.timeout.connect(self._on_timer)
-        self._timer.start(16)
+        self._timer.start(max(1, round(1000.0 / hz)))
+
+    def _alloc_buffer(self, w, h):
+        """(Re)allocate the pixel buffer and the QImage that wraps it.
+
+        Only called on construction and resize: the buffer address is stable
+        between resizes, so the same QImage shows every rendered frame.
+        """
+        self._pixel_buf = np.empty((h, w, 4), dtype=np.uint8)
+        # The plot background is opaque, so RGBX lets Qt copy instead of blend
+        self._qimage = QImage(self._pixel_buf, w, h, w * 4, QImage.Format_RGBX8888)
+        self._frame_ok = False
 
     def _render_frame(self):
-        """Render Spectra plot into the pixel buffer and schedule repaint."""
-        w = self._surface.width
-        h = self._surface.height
-        buf_size = w * h * 4
-        if len(self._pixel_buf) != buf_size:
-            self._pixel_buf = (ctypes.c_uint8 * buf_size)()
-
-        if self._surface.render_into(self._pixel_buf):
-            # Wrap the ctypes buffer in a QImage (no copy)
-            self._qimage = QImage(
-                self._pixel_buf, w, h, w * 4, QImage.Format_RGBA8888
-            )
-            self.update()
+        """Render Spectra plot into the pixel buffer (called from paintEvent)."""
+        self._frame_ok = self._surface.render_into(self._pixel_buf)
 
     def _on_timer(self):
-        """Advance animations and re-render."""
-        self._surface.update(1.0 / 60.0)
-        self._render_frame()
+        """Advance animations and schedule a repaint."""
+        self._surface.update(self._frame_dt)
+        self.update()
 
     # ── Qt event handlers → Spectra input ────────────────────────────────
 
     def paintEvent(self, event):
-        if self._qimage and not self._qimage.isNull():
+        self._render_frame()
+        if self._frame_ok:
             painter = QPainter(self)
             painter.drawImage(0, 0, self._qimage)
             painter.end()
@@ -117,12 +130,13 @@ class SpectraWidget(QWidget):
         w, h = self.width(), self.height()
         if w > 0 and h > 0:
             self._surface.resize(w, h)
-            self._render_frame()
+            self._alloc_buffer(w, h)
+            self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent):
         pos = event.pos()
         self._surface.mouse_move(float(pos.x()), float(pos.y()))
-        self._render_frame()
+        self.update()
 
     def mousePressEvent(self, event: QMouseEvent):
         pos = event.pos()
@@ -130,7 +144,7 @@ class SpectraWidget(QWidget):
         mods = self._qt_mods(event.modifiers())
         self._surface.mouse_button(btn, ACTION_PRESS, mods,
                                    float(pos.x()), float(pos.y()))
-        self._render_frame()
+        self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         pos = event.pos()
@@ -138,21 +152,21 @@ class SpectraWidget(QWidget):
         mods = self._qt_mods(event.modifiers())
         self._surface.mouse_button(btn, ACTION_RELEASE, mods,
                                    float(pos.x()), float(pos.y()))
-        self._render_frame()
+        self.update()
 
     def wheelEvent(self, event: QWheelEvent):
         pos = event.pos()
         dy = event.angleDelta().y() / 120.0
         dx = event.angleDelta().x() / 120.0
         self._surface.scroll(dx, dy, float(pos.x()), float(pos.y()))
-        self._render_frame()
+        self.update()
 
     def keyPressEvent(self, event: QKeyEvent):
         key = self._qt_key(event.key())
         mods = self._qt_mods(event.modifiers())
         if key:
             self._surface.key(key, ACTION_PRESS, mods)
-            self._render_frame()
+            self.update()
 
     def keyReleaseEvent(self, event: QKeyEvent):
         key = self._qt_key(event.key())
@@ -164,13 +178,7 @@ class SpectraWidget(QWidget):
 
     @staticmethod
     def _qt_button(btn):
-        if btn == Qt.LeftButton:
-            return MOUSE_LEFT
-        elif btn == Qt.RightButton:
-            return MOUSE_RIGHT
-        elif btn == Qt.MiddleButton:
-            return MOUSE_MIDDLE
-        return 0
+        return _BUTTON_MAP.get(btn, 0)
 
     @staticmethod
     def _qt_mods(mods):
@@ -186,19 +194,7 @@ class SpectraWidget(QWidget):
     @staticmethod
     def _qt_key(qt_key):
         """Convert Qt key code to Spectra key constant."""
-        # Letters A-Z match between Qt and GLFW (both 65-90)
-        if Qt.Key_A <= qt_key <= Qt.Key_Z:
-            return qt_key
-        # Numbers 0-9 match (both 48-57)
-        if Qt.Key_0 <= qt_key <= Qt.Key_9:
-            return qt_key
-        mapping = {
-            Qt.Key_Escape: KEY_ESCAPE,
-            Qt.Key_R: KEY_R,
-            Qt.Key_G: KEY_G,
-            Qt.Key_A: KEY_A,
-        }
-        return mapping.get(qt_key, 0)
+        return _KEY_MAP.get(qt_key, 0)
 
 
 def main():
@@ -66,8 +66,8 @@ class ApplicationWindow(QMainWindow):
 
         # ── Static plot: tan(t) ────────────────────────────────────────
         self._static_ax = static_canvas.axes()
-        t = np.linspace(0, 10, 501)
-        self._static_ax.scatter(t.tolist(), np.tan(t).tolist(), label="tan(t)")
+        t = np.linspace(0, 10, 501, dtype=np.float32)
+        self._static_ax.scatter(t, np.tan(t), label="tan(t)")
         self._static_ax.set_title("Static: tan(t)")
         self._static_ax.set_ylim(-5.0, 5.0)
         static_canvas.draw()
@@ -78,16 +78,19 @@ class ApplicationWindow(QMainWindow):
         self._dynamic_canvas = dynamic_canvas
 
         # Set up initial data
-        self.xdata = np.linspace(0, 10, 101)
+        # float32 arrays are handed to the renderer without conversion
+        self.xdata = np.linspace(0, 10, 101, dtype=np.float32)
+        self.ydata = np.empty_like(self.xdata)
+        self._tmp = np.empty_like(self.xdata)  # scratch for x + phase
         self._update_ydata()
-        self._line = self._dynamic_ax.line(
-            self.xdata.tolist(), self.ydata.tolist(), label="sin(x + t)"
-        )
+        self._line = self._dynamic_ax.line(self.xdata, self.ydata, label="sin(x + t)")
 
         # ── Timers (exactly like matplotlib) ───────────────────────────
 
-        # Data retrieval timer — as fast as possible (1 ms)
-        self.data_timer = dynamic_canvas.new_timer(1)
+        # Data retrieval timer — 10 ms, twice the drawing rate so every
+        # frame sees fresh data (matplotlib's demo uses 1 ms, but 19 of
+        # every 20 updates would never be drawn)
+        self.data_timer = dynamic_canvas.new_timer(10)
         self.data_timer.add_callback(self._update_ydata)
         self.data_timer.start()
 
@@ -98,7 +101,10 @@ class ApplicationWindow(QMainWindow):
 
     def _update_ydata(self):
         """Shift the sinusoid as a function of time."""
-        self.ydata = np.sin(self.xdata + time.time())
+        # Wrap the phase first: float32 cannot resolve time.time() itself
+        phase = time.time() % (2.0 * np.pi)
+        np.add(self.xdata, phase, out=self._tmp)
+        np.sin(self._tmp, out=self.ydata)
 
     def _update_canvas(self):
         """Push new data to the line and request a repaint."""
@@ -26,7 +26,7 @@ Spectra equivalent::
     canvas.draw()
 
 Requirements:
-    pip install PyQt6   # or PyQt5, PySide6, PySide2
+    pip install PyQt6 numpy   # or PyQt5, PySide6, PySide2
     cmake -S . -B build -DSPECTRA_BUILD_EMBED_SHARED=ON
     cmake --build build --target spectra_embed
 
@@ -36,10 +36,11 @@ Run:
 
 from __future__ import annotations
 
-import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # ─── Spectra imports (mirrors matplotlib pattern) ────────────────────────────
@@ -63,9 +64,9 @@ def main() -> None:
 
     # Add data (like matplotlib's ax.plot)
     ax = canvas.axes()
-    x = [i * 0.05 for i in range(300)]
-    ax.line(x, [math.sin(v) for v in x], label="sin(x)")
-    ax.line(x, [math.cos(v) for v in x], label="cos(x)")
+    x = np.arange(300, dtype=np.float32) * np.float32(0.05)
+    ax.line(x, np.sin(x), label="sin(x)")
+    ax.line(x, np.cos(x), label="cos(x)")
     canvas.draw()
 
     # Assemble window (same as matplotlib)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Streaming data update example — demonstrates Series.append() and FramePacer.
+"""Streaming data update example — demonstrates Series.append_point() and FramePacer.
 
 Simulates a live sensor stream: appends new data points at 60 FPS.
 
@@ -23,9 +23,11 @@ ax.set_xlabel("Time (s)")
 ax.set_ylabel("Value")
 ax.set_title("Live Sensor Stream")
 
-# Create two series
-line1 = ax.line([], [], label="sin")
-line2 = ax.line([], [], label="cos")
+window_sec = 10.0  # visible time window (seconds)
+
+# Create two ring-buffered series holding just over one window of points
+line1 = ax.line([], [], label="sin", max_points=int(window_sec * 61))
+line2 = ax.line([], [], label="cos", max_points=int(window_sec * 61))
 
 # Show the figure
 fig.show()
@@ -34,7 +36,6 @@ fig.show()
 pacer = sp.FramePacer(fps=60.0)  # target 60 FPS for smooth updates
 t = 0.0
 dt_step = 1.0 / 60.0
-window_sec = 10.0  # visible time window (seconds)
 
 ax.set_ylim(-1.2, 1.2)
 ax.set_xlim(0.0, window_sec)
@@ -43,16 +44,15 @@ print("Streaming data at 60 FPS. Close the window to stop.")
 
 while fig.is_visible:
     t += dt_step
-    x_new = [t]
-    y1_new = [math.sin(t * 2.0)]
-    y2_new = [math.cos(t * 2.0) * 0.5]
 
-    line1.append(x_new, y1_new)
-    line2.append(x_new, y2_new)
+    # One write per frame: both points and the axis slide go out together
+    with s.batch():
+        line1.append_point(t, math.sin(t * 2.0))
+        line2.append_point(t, math.cos(t * 2.0) * 0.5)
 
-    # Slide x-axis to follow the stream
-    if t > window_sec:
-        ax.set_xlim(t - window_sec, t)
+        # Slide x-axis to follow the stream
+        if t > window_sec:
+            ax.set_xlim(t - window_sec, t)
 
     pacer.pace(s)
 
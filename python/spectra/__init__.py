@@ -76,6 +76,8 @@ from ._easy import (
     ylim,
     grid,
     legend,
+    axes,
+    batch,
     live,
     stop_live,
     append,
@@ -133,6 +135,8 @@ __all__ = [
     "ylim",
     "grid",
     "legend",
+    "axes",
+    "batch",
     "live",
     "stop_live",
     "append",
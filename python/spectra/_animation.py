@@ -8,26 +8,36 @@ Two animation modes:
   2. Backend-driven: Backend sends ANIM_TICK at fixed rate, Python responds
 """
 
+from __future__ import annotations
+
 import time
 from typing import TYPE_CHECKING, Callable, Optional
 
+from . import _protocol as P
+from . import _codec as codec
+
 if TYPE_CHECKING:
     from ._session import Session
 
 
-def ipc_sleep(session: "Session", duration: float) -> None:
+def ipc_sleep(session: Session, duration: float) -> None:
     """Sleep for `duration` seconds while draining IPC events.
 
     Unlike time.sleep(), this keeps the IPC connection alive by
     processing incoming events (e.g. EVT_WINDOW_CLOSED) during the wait.
 
+    Waits with a single blocking selector call per event (or until the
+    deadline), so incoming events are handled as soon as they arrive.
+
     Thread-safe: acquires the session lock before reading from the socket.
     Falls back to plain sleep if the lock is held by another thread
     (e.g. the main thread doing a _request() or show() recv).
     """
-    import select
-
-    if session._transport is None or not session._transport.is_open:
+    flush = getattr(session, "_flush_pending", None)
+    if flush is not None:
+        flush()
+    transport = session._transport
+    if transport is None or not transport.is_open:
         time.sleep(duration)
         return
 
@@ -37,26 +47,22 @@ def ipc_sleep(session: "Session", duration: float) -> None:
         if remaining <= 0:
             break
 
-        timeout = min(remaining, 0.05)  # poll at 20 Hz
+        if not transport.wait_readable(remaining):
+            break  # deadline reached (or socket closed)
+
+        # Try to acquire the lock without blocking — if another thread
+        # is doing a _request() send+recv, just skip this read.
+        acquired = session._lock.acquire(blocking=False)
+        if not acquired:
+            time.sleep(min(remaining, 0.01))
+            continue
         try:
-            ready, _, _ = select.select([session._transport.fileno()], [], [], timeout)
-        except (ValueError, OSError):
+            msg = transport.recv()
+        finally:
+            session._lock.release()
+        if msg is None:
             break
-
-        if ready:
-            # Try to acquire the lock without blocking — if another thread
-            # is doing a _request() send+recv, just skip this read.
-            acquired = session._lock.acquire(blocking=False)
-            if not acquired:
-                time.sleep(min(remaining, 0.01))
-                continue
-            try:
-                msg = session._transport.recv()
-            finally:
-                session._lock.release()
-            if msg is None:
-                break
-            session._handle_event(msg)
+        session._handle_event(msg)
 
 
 class FramePacer:
@@ -71,11 +77,12 @@ class FramePacer:
             pacer.pace(session)
     """
 
-    __slots__ = ("_interval", "_last_time")
+    __slots__ = ("_interval", "_last_time", "_next")
 
     def __init__(self, fps: float = 30.0) -> None:
         self._interval = 1.0 / max(fps, 1.0)
         self._last_time = time.monotonic()
+        self._next = self._last_time + self._interval
 
     @property
     def fps(self) -> float:
@@ -85,14 +92,27 @@ class FramePacer:
     def fps(self, value: float) -> None:
         self._interval = 1.0 / max(value, 1.0)
 
-    def pace(self, session: "Session") -> float:
-        """Wait until the next frame time, draining events. Returns dt since last call."""
-        now = time.monotonic()
-        elapsed = now - self._last_time
-        remaining = self._interval - elapsed
+    def pace(self, session: Session) -> float:
+        """Wait until the next frame time, draining events. Returns dt since last call.
+
+        Frames are scheduled on an absolute grid (previous target + interval),
+        so a slow frame does not delay every later one. If the loop falls a
+        whole frame behind, the grid is re-anchored to now instead of bursting
+        to catch up.
+
+        Updates queued by an enclosing ``session.batch()`` are sent before
+        waiting.
+        """
+        flush = getattr(session, "_flush_pending", None)
+        if flush is not None:
+            flush()
+        remaining = self._next - time.monotonic()
         if remaining > 0:
             ipc_sleep(session, remaining)
         now = time.monotonic()
+        self._next += self._interval
+        if self._next < now:
+            self._next = now + self._interval
         dt = now - self._last_time
         self._last_time = now
         return dt
@@ -123,7 +143,7 @@ class BackendAnimator:
 
     def __init__(
         self,
-        session: "Session",
+        session: Session,
         figure_id: int,
         fps: float = 60.0,
         duration: float = 0.0,
@@ -149,9 +169,6 @@ class BackendAnimator:
 
     def start(self) -> None:
         """Request the backend to start sending ANIM_TICK events."""
-        from . import _protocol as P
-        from . import _codec as codec
-
         if self._running:
             return
         payload = codec.encode_req_anim_start(
@@ -164,9 +181,6 @@ class BackendAnimator:
 
     def stop(self) -> None:
         """Request the backend to stop sending ANIM_TICK events."""
-        from . import _protocol as P
-        from . import _codec as codec
-
         if not self._running:
             return
         payload = codec.encode_req_anim_stop(self._figure_id)
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from . import _protocol as P
 from . import _codec as codec
+from ._series import Series
 
 if TYPE_CHECKING:
     from ._session import Session
-    from ._series import Series
 
 
 class Axes:
@@ -18,14 +18,15 @@ class Axes:
     All mutations are sent to the backend via IPC.
     """
 
-    __slots__ = ("_session", "_figure_id", "_index", "_series_list", "_is_3d")
+    __slots__ = ("_session", "_figure_id", "_index", "_series_by_index", "_is_3d", "_texts")
 
     def __init__(self, session: Session, figure_id: int, axes_index: int, is_3d: bool = False) -> None:
         self._session = session
         self._figure_id = figure_id
         self._index = axes_index
-        self._series_list: List[Series] = []
+        self._series_by_index: Dict[int, Series] = {}  # insertion-ordered
         self._is_3d = is_3d
+        self._texts: Dict[str, str] = {}  # last label/title sent, by prop
 
     @property
     def index(self) -> int:
@@ -40,18 +41,30 @@ class Axes:
         x: Union[List[float], "object"],
         y: Union[List[float], "object"],
         label: str = "",
+        max_points: Optional[int] = None,
     ) -> Series:
-        """Add a line series to this axes."""
-        return self._add_series("line", x, y, label)
+        """Add a line series to this axes.
+
+        With *max_points* set the series acts as a ring buffer keeping the
+        newest *max_points* points; appends may run ``max_points // 8``
+        points over before the oldest ones are discarded.
+        """
+        return self._add_series("line", x, y, label, max_points)
 
     def scatter(
         self,
         x: Union[List[float], "object"],
         y: Union[List[float], "object"],
         label: str = "",
+        max_points: Optional[int] = None,
     ) -> Series:
-        """Add a scatter series to this axes."""
-        return self._add_series("scatter", x, y, label)
+        """Add a scatter series to this axes.
+
+        With *max_points* set the series acts as a ring buffer keeping the
+        newest *max_points* points; appends may run ``max_points // 8``
+        points over before the oldest ones are discarded.
+        """
+        return self._add_series("scatter", x, y, label, max_points)
 
     def _add_series(
         self,
@@ -59,8 +72,10 @@ class Axes:
         x: Union[List[float], "object"],
         y: Union[List[float], "object"],
         label: str = "",
+        max_points: Optional[int] = None,
     ) -> Series:
-        from ._series import Series
+        if max_points is not None and max_points < 1:
+            raise ValueError(f"max_points must be positive, got {max_points}")
 
         # Request series creation
         payload = codec.encode_req_add_series(
@@ -72,11 +87,14 @@ class Axes:
         resp = self._session._request(P.REQ_ADD_SERIES, payload)
         _, series_index = codec.decode_resp_series_added(resp["payload"])
 
-        series = Series(self._session, self._figure_id, series_index, series_type, label)
-        self._series_list.append(series)
+        series = Series(
+            self._session, self._figure_id, series_index, series_type, label, max_points
+        )
+        self._series_by_index[series_index] = series
 
-        # Set initial data
-        series.set_data(x, y)
+        # Set initial data; any rejection is raised from this call
+        with self._session.batch():
+            series.set_data(x, y)
 
         return series
 
@@ -89,8 +107,6 @@ class Axes:
         label: str = "",
     ) -> Series:
         """Add a 3D series and set XYZ data."""
-        from ._series import Series
-
         payload = codec.encode_req_add_series(
             figure_id=self._figure_id,
             axes_index=self._index,
@@ -101,91 +117,65 @@ class Axes:
         _, series_index = codec.decode_resp_series_added(resp["payload"])
 
         series = Series(self._session, self._figure_id, series_index, series_type, label)
-        self._series_list.append(series)
+        self._series_by_index[series_index] = series
 
-        series.set_data_xyz(x, y, z)
+        with self._session.batch():
+            series.set_data_xyz(x, y, z)
 
         return series
 
     @property
     def series(self) -> List[Series]:
-        return list(self._series_list)
+        return list(self._series_by_index.values())
 
     def set_xlim(self, xmin: float, xmax: float) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="xlim",
-            f1=xmin,
-            f2=xmax,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        self._update(prop="xlim", f1=xmin, f2=xmax)
 
     def set_ylim(self, ymin: float, ymax: float) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="ylim",
-            f1=ymin,
-            f2=ymax,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        self._update(prop="ylim", f1=ymin, f2=ymax)
 
     def set_zlim(self, zmin: float, zmax: float) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="zlim",
-            f1=zmin,
-            f2=zmax,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        self._update(prop="zlim", f1=zmin, f2=zmax)
 
     def set_xlabel(self, label: str) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="xlabel",
-            str_val=label,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        if self._text_changed("xlabel", label):
+            self._update(prop="xlabel", str_val=label)
 
     def set_ylabel(self, label: str) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="ylabel",
-            str_val=label,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        if self._text_changed("ylabel", label):
+            self._update(prop="ylabel", str_val=label)
 
     def set_title(self, title: str) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="axes_title",
-            str_val=title,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        if self._text_changed("axes_title", title):
+            self._update(prop="axes_title", str_val=title)
 
     def grid(self, visible: bool = True) -> None:
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="grid",
-            bool_val=visible,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        self._update(prop="grid", bool_val=visible)
 
     def legend(self, visible: bool = True) -> None:
         """Toggle legend visibility on this axes."""
-        payload = codec.encode_req_update_property(
-            figure_id=self._figure_id,
-            axes_index=self._index,
-            prop="legend",
-            bool_val=visible,
-        )
-        self._session._request(P.REQ_UPDATE_PROPERTY, payload)
+        self._update(prop="legend", bool_val=visible)
+
+    def _text_changed(self, prop: str, text: str) -> bool:
+        """Record *text* for *prop*; False if it matches what was last sent.
+
+        Dashboards re-apply the same labels every refresh; those repeats
+        are dropped client-side. Limits, grid and legend are always sent
+        since they can also be changed interactively in the window. The
+        session clears the record when a send fails or it reconnects.
+        """
+        texts = self._texts
+        if texts.get(prop) == text:
+            return False
+        texts[prop] = text
+        return True
+
+    def _update(self, **kwargs) -> None:
+        """Queue a property update; consecutive setters are coalesced
+        into one REQ_UPDATE_BATCH by the session."""
+        kwargs["figure_id"] = self._figure_id
+        kwargs["axes_index"] = self._index
+        self._session._queue_property_update(kwargs)
 
     def remove_series(self, index: int) -> None:
         """Remove a series by index from this axes."""
@@ -194,22 +184,30 @@ class Axes:
             series_index=index,
         )
         self._session._request(P.REQ_REMOVE_SERIES, payload)
-        self._series_list = [s for s in self._series_list if s._index != index]
+        self._series_by_index.pop(index, None)
 
     def clear(self) -> None:
-        """Remove all series from this axes."""
+        """Remove all series from this axes.
+
+        The removals are pipelined as one write with a single pass over
+        the acknowledgements, rather than one round-trip per series.
+        """
         # Remove in reverse order so indices stay valid
-        for s in reversed(list(self._series_list)):
-            payload = codec.encode_req_remove_series(
-                figure_id=self._figure_id,
-                series_index=s._index,
-            )
-            self._session._request(P.REQ_REMOVE_SERIES, payload)
-        self._series_list.clear()
+        with self._session.batch():
+            for s in reversed(self._series_by_index.values()):
+                payload = codec.encode_req_remove_series(
+                    figure_id=self._figure_id,
+                    series_index=s._index,
+                )
+                self._session._request(P.REQ_REMOVE_SERIES, payload)
+        self._series_by_index.clear()
 
     def batch(self) -> "_AxesBatchContext":
         """Context manager for batching multiple property updates into one IPC call.
 
+        Plain setters are already coalesced by the session; the context
+        makes the grouping explicit and sends it on exit.
+
         Usage::
 
             with ax.batch() as b:
@@ -249,8 +247,9 @@ class _AxesBatchContext:
         self._updates.clear()
 
     def _add(self, **kwargs) -> None:
-        kwargs.setdefault("figure_id", self._axes._figure_id)
-        kwargs.setdefault("axes_index", self._axes._index)
+        # No setter passes these, so plain stores replace two setdefault calls
+        kwargs["figure_id"] = self._axes._figure_id
+        kwargs["axes_index"] = self._axes._index
         self._updates.append(kwargs)
 
     def set_xlim(self, xmin: float, xmax: float) -> None:
@@ -260,13 +259,16 @@ class _AxesBatchContext:
         self._add(prop="ylim", f1=ymin, f2=ymax)
 
     def set_xlabel(self, label: str) -> None:
-        self._add(prop="xlabel", str_val=label)
+        if self._axes._text_changed("xlabel", label):
+            self._add(prop="xlabel", str_val=label)
 
     def set_ylabel(self, label: str) -> None:
-        self._add(prop="ylabel", str_val=label)
+        if self._axes._text_changed("ylabel", label):
+            self._add(prop="ylabel", str_val=label)
 
     def set_title(self, title: str) -> None:
-        self._add(prop="axes_title", str_val=title)
+        if self._axes._text_changed("axes_title", title):
+            self._add(prop="axes_title", str_val=title)
 
     def grid(self, visible: bool = True) -> None:
         self._add(prop="grid", bool_val=visible)
@@ -12,39 +12,124 @@ Memory lifetime:
   - If Python crashes before unlink: backend unlinks after TTL (60s)
 """
 
+import errno
+import itertools
+import mmap
 import os
 import time
 import threading
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 
 # Shared memory threshold: use shm for arrays > 1 MB
 SHM_THRESHOLD = 1 * 1024 * 1024
 
 # TTL for unreleased blobs (seconds)
 BLOB_TTL = 60.0
+_BLOB_TTL_NS = int(BLOB_TTL * 1_000_000_000)
+
+# POSIX shm segments live here on Linux; shm_open(name) maps to this path
+_SHM_DIR = "/dev/shm"
+
+# Pre-fault mapped pages up front (Linux, Python >= 3.10)
+_MAP_POPULATE = getattr(mmap, "MAP_POPULATE", 0)
 
 # Counter for unique blob names
-_blob_counter = 0
-_blob_lock = threading.Lock()
+# (next() on itertools.count is atomic under the GIL, so no lock is needed)
+_blob_counter = itertools.count(1)
+_pid = os.getpid()
+
+
+def _reset_pid() -> None:
+    global _pid
+    _pid = os.getpid()
+
+
+# A forked child must not reuse the parent's segment names
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pid)
+
+
+def _byte_view(data: Union[bytes, memoryview, "object"]) -> memoryview:
+    """Flat unsigned-byte view of any buffer-protocol object.
+
+    Contiguous buffers (bytes, memoryview, numpy arrays of any dtype) are
+    viewed in place; only non-contiguous ones are gathered into a copy.
+    """
+    view = memoryview(data)
+    if not view.c_contiguous:
+        return memoryview(view.tobytes())
+    return view.cast("B")
 
 
 def _next_blob_name() -> str:
     """Generate a unique shm segment name."""
-    global _blob_counter
-    with _blob_lock:
-        _blob_counter += 1
-        return f"/spectra-blob-{os.getpid()}-{_blob_counter}"
+    return f"/spectra-blob-{_pid}-{next(_blob_counter)}"
+
+
+class _FastShm:
+    """Shared memory segment created directly under /dev/shm.
+
+    Same interface as ``multiprocessing.shared_memory.SharedMemory`` as
+    used here (``buf``, ``close()``, ``unlink()``), but without the
+    resource-tracker round-trip: open, fallocate and a pre-populated mmap
+    are the only syscalls, so writing the payload takes no page faults.
+    """
+
+    __slots__ = ("name", "_path", "_mmap", "buf")
+
+    def __init__(self, name: str, size: int) -> None:
+        if size <= 0:
+            raise ValueError("'size' must be a positive number different from zero")
+        self.name = name
+        self._path = os.path.join(_SHM_DIR, name.lstrip("/"))
+        fd = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+        try:
+            os.posix_fallocate(fd, 0, size)
+            self._mmap = mmap.mmap(
+                fd, size, flags=mmap.MAP_SHARED | _MAP_POPULATE,
+                prot=mmap.PROT_READ | mmap.PROT_WRITE,
+            )
+        except BaseException:
+            os.close(fd)
+            os.unlink(self._path)
+            raise
+        # The mapping stays valid after the descriptor is closed
+        os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+            self._mmap.close()
+
+    def unlink(self) -> None:
+        os.unlink(self._path)
+
+
+def _create_shm(name: str, size: int):
+    """Create a shm segment, preferring _FastShm where /dev/shm is usable."""
+    if hasattr(os, "posix_fallocate") and os.path.isdir(_SHM_DIR):
+        try:
+            return _FastShm(name, size)
+        except OSError as exc:
+            if exc.errno not in (errno.ENOSYS, errno.EACCES, errno.EPERM,
+                                 errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    from multiprocessing import shared_memory
+
+    return shared_memory.SharedMemory(name=name, create=True, size=size)
 
 
 class BlobRef:
     """Reference to a shared memory blob."""
 
-    __slots__ = ("name", "size", "created_at", "_shm", "_released")
+    __slots__ = ("name", "size", "created_at_ns", "_shm", "_released")
 
     def __init__(self, name: str, size: int) -> None:
         self.name = name
         self.size = size
-        self.created_at = time.monotonic()
+        self.created_at_ns = time.monotonic_ns()
         self._shm = None
         self._released = False
 
@@ -63,7 +148,7 @@ class BlobRef:
 
     @property
     def is_expired(self) -> bool:
-        return (time.monotonic() - self.created_at) > BLOB_TTL
+        return time.monotonic_ns() - self.created_at_ns > _BLOB_TTL_NS
 
     def __del__(self) -> None:
         self.release()
@@ -79,28 +164,32 @@ class BlobStore:
         self._blobs: Dict[str, BlobRef] = {}
         self._lock = threading.Lock()
 
-    def create_blob(self, data: bytes) -> Optional[BlobRef]:
+    def create_blob(self, data: Union[bytes, memoryview, "object"]) -> Optional[BlobRef]:
         """Create a shared memory segment and write data into it.
 
+        *data* may be any buffer (bytes, memoryview, numpy array); it is
+        copied into the segment with a single memcpy straight from the
+        caller's memory, without an intermediate ``bytes`` object.
+
         Returns a BlobRef on success, None if shm is not available.
         """
-        try:
-            from multiprocessing import shared_memory
-        except ImportError:
-            return None
-
+        view = _byte_view(data)
+        size = view.nbytes
         name = _next_blob_name()
         try:
-            shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
-            shm.buf[:len(data)] = data
-            ref = BlobRef(name, len(data))
+            shm = _create_shm(name, size)
+            shm.buf[:size] = view
+            ref = BlobRef(name, size)
             ref._shm = shm
 
             with self._lock:
+                # Stamp under the lock so creation times are monotonic in
+                # _blobs order, which cleanup_expired relies on.
+                ref.created_at_ns = time.monotonic_ns()
                 self._blobs[name] = ref
 
             return ref
-        except (OSError, ValueError):
+        except (OSError, ValueError, ImportError):
             return None
 
     def release_blob(self, name: str) -> None:
@@ -111,32 +200,35 @@ class BlobStore:
             ref.release()
 
     def cleanup_expired(self) -> int:
-        """Release all expired blobs. Returns count of cleaned blobs."""
-        expired = []
-        with self._lock:
-            for name, ref in list(self._blobs.items()):
-                if ref.is_expired:
-                    expired.append(name)
-                    del self._blobs[name]
+        """Release all expired blobs. Returns count of cleaned blobs.
 
-        for name in expired:
-            # Try to unlink even if BlobRef is gone
-            try:
-                from multiprocessing import shared_memory
-                shm = shared_memory.SharedMemory(name=name, create=False)
-                shm.close()
-                shm.unlink()
-            except Exception:
-                pass
+        Blobs are stamped and inserted under the same lock, so the expired
+        ones form a prefix of ``_blobs``; the scan stops at the first live
+        blob and costs O(expired) rather than O(active).
+        """
+        cutoff = time.monotonic_ns() - _BLOB_TTL_NS
+        with self._lock:
+            names = []
+            for name, ref in self._blobs.items():
+                if ref.created_at_ns >= cutoff:
+                    break
+                names.append(name)
+            expired = [self._blobs.pop(name) for name in names]
+
+        # The refs still own their mappings, so unlink through them rather
+        # than re-opening and re-mapping each segment by name.
+        for ref in expired:
+            ref.release()
 
         return len(expired)
 
     def cleanup_all(self) -> None:
         """Release all blobs (called on session close)."""
+        # Swap in a fresh dict rather than copying the values out
         with self._lock:
-            refs = list(self._blobs.values())
-            self._blobs.clear()
-        for ref in refs:
+            refs = self._blobs
+            self._blobs = {}
+        for ref in refs.values():
             ref.release()
 
     @property
@@ -145,9 +237,11 @@ class BlobStore:
             return len(self._blobs)
 
 
-def try_create_shm_blob(data: bytes, store: BlobStore) -> Optional[BlobRef]:
+def try_create_shm_blob(
+    data: Union[bytes, memoryview, "object"], store: BlobStore
+) -> Optional[BlobRef]:
     """Try to create a shm blob for data. Returns None if data is too small
     or shm is not available on this platform."""
-    if len(data) < SHM_THRESHOLD:
+    if memoryview(data).nbytes < SHM_THRESHOLD:
         return None
     return store.create_blob(data)
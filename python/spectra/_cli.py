@@ -3,6 +3,31 @@
 import os
 import platform as _platform
 import sys
+from typing import Dict, Optional
+
+# Resolved native backend path, reused for later spawns from this process so
+# the hot path skips the multi-directory search in _find_backend_binary.
+_CACHED_BINARY: Optional[str] = None
+
+# Interpreter-only variables the native backend never reads.
+_STRIPPED_ENV_PREFIXES = ("PYTHON", "PIP_")
+
+
+def _backend_binary() -> Optional[str]:
+    """Return the backend binary path, cached after the first lookup."""
+    global _CACHED_BINARY
+    cached = _CACHED_BINARY
+    if cached is not None and os.path.isfile(cached):
+        return cached
+    from ._launcher import _find_backend_binary
+    _CACHED_BINARY = _find_backend_binary()
+    return _CACHED_BINARY
+
+
+def _backend_env() -> Dict[str, str]:
+    """Return the environment for the backend, minus Python-only variables."""
+    return {k: v for k, v in os.environ.items()
+            if not k.startswith(_STRIPPED_ENV_PREFIXES)}
 
 
 def backend_main():
@@ -22,16 +47,14 @@ def backend_main():
             sys.exit(1)
         sys.exit(0)
 
-    from ._launcher import _find_backend_binary
-
-    binary = _find_backend_binary()
+    binary = _backend_binary()
 
     # If not found locally, try auto-download
     if binary is None:
         try:
             from ._download import download_backend
             download_backend()
-            binary = _find_backend_binary()
+            binary = _backend_binary()
         except Exception as exc:
             print(f"Auto-download failed: {exc}", file=sys.stderr)
 
@@ -65,4 +88,4 @@ def backend_main():
         import subprocess
         sys.exit(subprocess.call([binary] + sys.argv[1:]))
     else:
-        os.execv(binary, [binary] + sys.argv[1:])
+        os.execve(binary, [binary] + sys.argv[1:], _backend_env())
@@ -6,10 +6,33 @@ Decode functions auto-detect FlatBuffers vs legacy TLV and delegate to _codec_fb
 """
 
 import struct
-from typing import List, Optional, Tuple
+import sys
+from array import array
+from typing import List, Optional, Tuple, Union
 
 from . import _protocol as P
 from . import _codec_fb as fb_codec
+from ._floatpack import pack_float32
+
+# Pre-compiled layouts: a TLV field is [tag u8][len u32][value], so each
+# fixed-width put is a single pack call with no format-string parsing.
+_S_TAG_U16 = struct.Struct("<BIH")
+_S_TAG_U32 = struct.Struct("<BII")
+_S_TAG_U64 = struct.Struct("<BIQ")
+_S_TAG_F32 = struct.Struct("<BIf")
+_S_TAG_F64 = struct.Struct("<BId")
+_S_TAG_LEN = struct.Struct("<BI")
+_S_TAG_LEN_COUNT = struct.Struct("<BII")
+_S_U16 = struct.Struct("<H")
+_S_U32 = struct.Struct("<I")
+_S_U64 = struct.Struct("<Q")
+_S_F32 = struct.Struct("<f")
+_S_F64 = struct.Struct("<d")
+_S_HEADER = struct.Struct(P.HEADER_FMT)
+
+# ANIM_TICK as the backend writes it: figure_id u64, frame u32, t f32, dt f32
+_S_ANIM_TICK = struct.Struct("<BIQ BII BIf BIf")
+_ANIM_TICK_LAYOUT = (P.TAG_FIGURE_ID, 8, P.TAG_F1, 4, P.TAG_F2, 4, P.TAG_F3, 4)
 
 
 # ─── Encoder ──────────────────────────────────────────────────────────────────
@@ -23,79 +46,93 @@ class PayloadEncoder:
         self._buf = bytearray()
 
     def put_u16(self, tag: int, val: int) -> None:
-        self._buf.append(tag & 0xFF)
-        self._buf.extend(struct.pack("<I", 2))
-        self._buf.extend(struct.pack("<H", val & 0xFFFF))
+        self._buf += _S_TAG_U16.pack(tag & 0xFF, 2, val & 0xFFFF)
 
     def put_u32(self, tag: int, val: int) -> None:
-        self._buf.append(tag & 0xFF)
-        self._buf.extend(struct.pack("<I", 4))
-        self._buf.extend(struct.pack("<I", val & 0xFFFFFFFF))
+        self._buf += _S_TAG_U32.pack(tag & 0xFF, 4, val & 0xFFFFFFFF)
 
     def put_u64(self, tag: int, val: int) -> None:
-        self._buf.append(tag & 0xFF)
-        self._buf.extend(struct.pack("<I", 8))
-        self._buf.extend(struct.pack("<Q", val & 0xFFFFFFFFFFFFFFFF))
+        self._buf += _S_TAG_U64.pack(tag & 0xFF, 8, val & 0xFFFFFFFFFFFFFFFF)
 
     def put_string(self, tag: int, val: str) -> None:
         raw = val.encode("utf-8")
-        self._buf.append(tag & 0xFF)
-        self._buf.extend(struct.pack("<I", len(raw)))
-        self._buf.extend(raw)
+        self._buf += _S_TAG_LEN.pack(tag & 0xFF, len(raw))
+        self._buf += raw
 
     def put_float(self, tag: int, val: float) -> None:
-        bits = struct.pack("<f", val)
-        u32 = struct.unpack("<I", bits)[0]
-        self.put_u32(tag, u32)
+        self._buf += _S_TAG_F32.pack(tag & 0xFF, 4, val)
 
     def put_double(self, tag: int, val: float) -> None:
-        bits = struct.pack("<d", val)
-        u64 = struct.unpack("<Q", bits)[0]
-        self.put_u64(tag, u64)
+        self._buf += _S_TAG_F64.pack(tag & 0xFF, 8, val)
 
     def put_bool(self, tag: int, val: bool) -> None:
-        self.put_u16(tag, 1 if val else 0)
+        self._buf += _S_TAG_U16.pack(tag & 0xFF, 2, 1 if val else 0)
 
     def put_blob(self, tag: int, data: bytes) -> None:
-        self._buf.append(tag & 0xFF)
-        self._buf.extend(struct.pack("<I", len(data)))
-        self._buf.extend(data)
+        self._buf += _S_TAG_LEN.pack(tag & 0xFF, len(data))
+        self._buf += data
+
+    def put_counted_blob(self, tag: int, count: int, raw: bytes) -> None:
+        """Encode a blob of [count_u32][raw], copying *raw* straight into
+        the buffer instead of building the prefixed blob separately."""
+        nbytes = memoryview(raw).nbytes
+        self._buf += _S_TAG_LEN_COUNT.pack(tag & 0xFF, nbytes + 4, count)
+        self._buf += raw
 
     def put_float_array(self, tag: int, arr: List[float]) -> None:
-        """Encode as [count_u32][float0][float1]... wrapped in a blob."""
-        count = len(arr)
-        raw = struct.pack("<I", count)
-        if count > 0:
-            raw += struct.pack(f"<{count}f", *arr)
-        self.put_blob(tag, raw)
+        """Encode as [count_u32][float0][float1]... wrapped in a blob.
+
+        Finite values outside float32 range raise OverflowError.
+        """
+        floats = pack_float32(arr)
+        count = len(floats)
+        self._buf += _S_TAG_LEN_COUNT.pack(tag & 0xFF, 4 + 4 * count, count)
+        self._buf += floats
 
     def take(self) -> bytes:
+        """Return an immutable copy of the encoded fields."""
         return bytes(self._buf)
 
+    def take_buffer(self) -> bytearray:
+        """Hand over the internal buffer without copying it.
+
+        Used by every ``encode_*`` helper, since the transport sends any
+        buffer; the encoder starts empty again afterwards.
+        """
+        buf = self._buf
+        self._buf = bytearray()
+        return buf
+
 
 # ─── Decoder ──────────────────────────────────────────────────────────────────
 
 class PayloadDecoder:
-    """Reads TLV fields from a byte buffer."""
+    """Reads TLV fields from a byte buffer.
 
-    __slots__ = ("_data", "_pos", "_tag", "_len", "_val_offset")
+    *data* may be any buffer (bytes, bytearray, memoryview, mmap); fields
+    are read through a byte view of it, so blobs are never copied.
+    """
+
+    __slots__ = ("_data", "_size", "_pos", "_tag", "_len", "_val_offset")
 
-    def __init__(self, data: bytes) -> None:
-        self._data = data
+    def __init__(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        self._data = memoryview(data).cast("B")
+        self._size = len(self._data)
         self._pos = 0
         self._tag = 0
         self._len = 0
         self._val_offset = 0
 
     def next(self) -> bool:
-        if self._pos + 5 > len(self._data):
+        pos = self._pos
+        if pos + 5 > self._size:
             return False
-        self._tag = self._data[self._pos]
-        self._len = struct.unpack_from("<I", self._data, self._pos + 1)[0]
-        self._val_offset = self._pos + 5
-        if self._val_offset + self._len > len(self._data):
+        self._tag, self._len = _S_TAG_LEN.unpack_from(self._data, pos)
+        self._val_offset = pos + 5
+        end = pos + 5 + self._len
+        if end > self._size:
             return False
-        self._pos = self._val_offset + self._len
+        self._pos = end
         return True
 
     @property
@@ -109,43 +146,83 @@ class PayloadDecoder:
     def as_u16(self) -> int:
         if self._len < 2:
             return 0
-        return struct.unpack_from("<H", self._data, self._val_offset)[0]
+        return _S_U16.unpack_from(self._data, self._val_offset)[0]
 
     def as_u32(self) -> int:
         if self._len < 4:
             return 0
-        return struct.unpack_from("<I", self._data, self._val_offset)[0]
+        return _S_U32.unpack_from(self._data, self._val_offset)[0]
 
     def as_u64(self) -> int:
         if self._len < 8:
             return 0
-        return struct.unpack_from("<Q", self._data, self._val_offset)[0]
+        return _S_U64.unpack_from(self._data, self._val_offset)[0]
 
     def as_string(self) -> str:
-        return self._data[self._val_offset:self._val_offset + self._len].decode("utf-8", errors="replace")
+        return str(self._data[self._val_offset:self._val_offset + self._len], "utf-8", "replace")
 
-    def as_blob(self) -> bytes:
-        return bytes(self._data[self._val_offset:self._val_offset + self._len])
+    def as_blob(self) -> memoryview:
+        """Return the field value as a zero-copy view into the payload."""
+        return self._data[self._val_offset:self._val_offset + self._len]
+
+    def as_blob_bytes(self) -> bytes:
+        """Return the field value as an independent ``bytes`` copy."""
+        return self._data[self._val_offset:self._val_offset + self._len].tobytes()
 
     def as_float(self) -> float:
-        bits = self.as_u32()
-        return struct.unpack("<f", struct.pack("<I", bits))[0]
+        if self._len < 4:
+            return 0.0
+        return _S_F32.unpack_from(self._data, self._val_offset)[0]
 
     def as_double(self) -> float:
-        bits = self.as_u64()
-        return struct.unpack("<d", struct.pack("<Q", bits))[0]
+        if self._len < 8:
+            return 0.0
+        return _S_F64.unpack_from(self._data, self._val_offset)[0]
 
     def as_bool(self) -> bool:
         return self.as_u16() != 0
 
+    def as_float_view(self) -> memoryview:
+        """Return a counted float blob as a float32 memoryview.
+
+        No Python floats are created; ``np.frombuffer`` or
+        ``np.asarray`` can wrap the result directly.  The view aliases the
+        payload on little-endian hosts.
+        """
+        if self._len < 4:
+            return memoryview(array("f"))
+        off = self._val_offset
+        count = _S_U32.unpack_from(self._data, off)[0]
+        if self._len < 4 + count * 4:
+            return memoryview(array("f"))
+        raw = self._data[off + 4:off + 4 + count * 4]
+        if sys.byteorder != "little":
+            floats = array("f", raw.tobytes())
+            floats.byteswap()
+            return memoryview(floats)
+        return raw.cast("f")
+
     def as_float_array(self) -> List[float]:
-        raw = self.as_blob()
-        if len(raw) < 4:
-            return []
-        count = struct.unpack_from("<I", raw, 0)[0]
-        if len(raw) < 4 + count * 4:
-            return []
-        return list(struct.unpack_from(f"<{count}f", raw, 4))
+        return self.as_float_view().tolist()
+
+
+def _field_table(fields: dict) -> tuple:
+    """Expand ``{tag: (key, reader)}`` into a 256-slot tuple indexed by the
+    tag byte, so dispatch is a plain index rather than a hash lookup."""
+    table = [None] * 256
+    for tag, field in fields.items():
+        table[tag] = field
+    return tuple(table)
+
+
+def _decode_fields(data: bytes, result: dict, table: tuple) -> dict:
+    """Fill *result* from a TLV payload using a :func:`_field_table`."""
+    dec = PayloadDecoder(data)
+    while dec.next():
+        field = table[dec._tag]
+        if field is not None:
+            result[field[0]] = field[1](dec)
+    return result
 
 
 # ─── Header encode/decode ─────────────────────────────────────────────────────
@@ -158,8 +235,31 @@ def encode_header(
     session_id: int = 0,
     window_id: int = 0,
 ) -> bytes:
-    return struct.pack(
-        P.HEADER_FMT,
+    return _S_HEADER.pack(
+        P.MAGIC,
+        msg_type,
+        payload_len,
+        seq,
+        request_id,
+        session_id,
+        window_id,
+    )
+
+
+def encode_header_into(
+    out: bytearray,
+    offset: int,
+    msg_type: int,
+    payload_len: int,
+    seq: int = 0,
+    request_id: int = 0,
+    session_id: int = 0,
+    window_id: int = 0,
+) -> None:
+    """Write a header into *out* at *offset* (HEADER_SIZE bytes)."""
+    _S_HEADER.pack_into(
+        out,
+        offset,
         P.MAGIC,
         msg_type,
         payload_len,
@@ -174,7 +274,7 @@ def decode_header(data: bytes) -> Optional[dict]:
     if len(data) < P.HEADER_SIZE:
         return None
     magic, msg_type, payload_len, seq, request_id, session_id, window_id = (
-        struct.unpack_from(P.HEADER_FMT, data, 0)
+        _S_HEADER.unpack_from(data, 0)
     )
     if magic != P.MAGIC:
         return None
@@ -193,24 +293,20 @@ def decode_header(data: bytes) -> Optional[dict]:
 def encode_hello(client_type: str = "python", build: str = "") -> bytes:
     return fb_codec.encode_fb_hello(client_type=client_type, build=build)
 
+_WELCOME_FIELDS = _field_table({
+    P.TAG_SESSION_ID: ("session_id", PayloadDecoder.as_u64),
+    P.TAG_WINDOW_ID: ("window_id", PayloadDecoder.as_u64),
+    P.TAG_PROCESS_ID: ("process_id", PayloadDecoder.as_u64),
+    P.TAG_HEARTBEAT_MS: ("heartbeat_ms", PayloadDecoder.as_u32),
+    P.TAG_MODE: ("mode", PayloadDecoder.as_string),
+})
+
+
 def decode_welcome(data: bytes) -> dict:
     if fb_codec._is_fb(data):
         return fb_codec.decode_fb_welcome(data)
     result = {"session_id": 0, "window_id": 0, "process_id": 0, "heartbeat_ms": 5000, "mode": ""}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        t = dec.tag
-        if t == P.TAG_SESSION_ID:
-            result["session_id"] = dec.as_u64()
-        elif t == P.TAG_WINDOW_ID:
-            result["window_id"] = dec.as_u64()
-        elif t == P.TAG_PROCESS_ID:
-            result["process_id"] = dec.as_u64()
-        elif t == P.TAG_HEARTBEAT_MS:
-            result["heartbeat_ms"] = dec.as_u32()
-        elif t == P.TAG_MODE:
-            result["mode"] = dec.as_string()
-    return result
+    return _decode_fields(data, result, _WELCOME_FIELDS)
 
 
 def encode_req_create_figure(title: str = "", width: int = 1280, height: int = 720) -> bytes:
@@ -222,19 +318,17 @@ def encode_req_create_axes(figure_id: int, rows: int, cols: int, index: int, is_
 def encode_req_add_series(figure_id: int, axes_index: int, series_type: str, label: str = "") -> bytes:
     return fb_codec.encode_fb_req_add_series(figure_id=figure_id, axes_index=axes_index, series_type=series_type, label=label)
 
-def encode_req_set_data(figure_id: int, series_index: int, data: List[float], dtype: int = 0) -> bytes:
+def encode_req_set_data(figure_id: int, series_index: int, data: List[float], dtype: int = P.DTYPE_FLOAT32) -> bytes:
     return fb_codec.encode_fb_req_set_data(figure_id=figure_id, series_index=series_index, data=data, dtype=dtype)
 
-def encode_req_set_data_raw(figure_id: int, series_index: int, raw_bytes: bytes, count: int, dtype: int = 0) -> bytes:
+def encode_req_set_data_raw(figure_id: int, series_index: int, raw_bytes: bytes, count: int, dtype: int = P.DTYPE_FLOAT32) -> bytearray:
     """Encode REQ_SET_DATA with pre-packed float array bytes for zero-copy from numpy."""
     enc = PayloadEncoder()
     enc.put_u64(P.TAG_FIGURE_ID, figure_id)
     enc.put_u32(P.TAG_SERIES_INDEX, series_index)
     enc.put_u16(P.TAG_DTYPE, dtype)
-    # Build the float_array blob: [count_u32][raw float bytes]
-    blob = struct.pack("<I", count) + raw_bytes
-    enc.put_blob(P.TAG_BLOB_INLINE, blob)
-    return enc.take()
+    enc.put_counted_blob(P.TAG_BLOB_INLINE, count, raw_bytes)
+    return enc.take_buffer()
 
 
 def encode_req_set_data_chunked(
@@ -245,8 +339,8 @@ def encode_req_set_data_chunked(
     chunk_index: int,
     chunk_count: int,
     total_count: int,
-    dtype: int = 0,
-) -> bytes:
+    dtype: int = P.DTYPE_FLOAT32,
+) -> bytearray:
     """Encode a single chunk of a chunked REQ_SET_DATA transfer.
 
     For arrays exceeding CHUNK_SIZE, the caller splits the data and sends
@@ -260,22 +354,20 @@ def encode_req_set_data_chunked(
     enc.put_u32(P.TAG_CHUNK_INDEX, chunk_index)
     enc.put_u32(P.TAG_CHUNK_COUNT, chunk_count)
     enc.put_u32(P.TAG_TOTAL_COUNT, total_count)
-    blob = struct.pack("<I", count) + raw_bytes
-    enc.put_blob(P.TAG_BLOB_INLINE, blob)
-    return enc.take()
+    enc.put_counted_blob(P.TAG_BLOB_INLINE, count, raw_bytes)
+    return enc.take_buffer()
 
 
 def encode_req_append_data(figure_id: int, series_index: int, data: List[float]) -> bytes:
     return fb_codec.encode_fb_req_append_data(figure_id=figure_id, series_index=series_index, data=data)
 
-def encode_req_append_data_raw(figure_id: int, series_index: int, raw_bytes: bytes, count: int) -> bytes:
+def encode_req_append_data_raw(figure_id: int, series_index: int, raw_bytes: bytes, count: int) -> bytearray:
     """Encode REQ_APPEND_DATA with pre-packed float array bytes for zero-copy from numpy."""
     enc = PayloadEncoder()
     enc.put_u64(P.TAG_FIGURE_ID, figure_id)
     enc.put_u32(P.TAG_SERIES_INDEX, series_index)
-    blob = struct.pack("<I", count) + raw_bytes
-    enc.put_blob(P.TAG_BLOB_INLINE, blob)
-    return enc.take()
+    enc.put_counted_blob(P.TAG_BLOB_INLINE, count, raw_bytes)
+    return enc.take_buffer()
 
 
 def encode_req_update_property(
@@ -338,21 +430,43 @@ def encode_req_disconnect() -> bytes:
 
 # ─── Request payload decoders (round-trip validation / testing) ───────────────
 
+_SERIES_REF_FIELDS = _field_table({
+    P.TAG_FIGURE_ID: ("figure_id", PayloadDecoder.as_u64),
+    P.TAG_SERIES_INDEX: ("series_index", PayloadDecoder.as_u32),
+})
+_APPEND_DATA_FIELDS = _field_table({
+    P.TAG_FIGURE_ID: ("figure_id", PayloadDecoder.as_u64),
+    P.TAG_SERIES_INDEX: ("series_index", PayloadDecoder.as_u32),
+    P.TAG_BLOB_INLINE: ("data", PayloadDecoder.as_float_array),
+})
+_FIGURE_REF_FIELDS = _field_table({
+    P.TAG_FIGURE_ID: ("figure_id", PayloadDecoder.as_u64),
+})
+_RECONNECT_FIELDS = _field_table({
+    P.TAG_SESSION_ID: ("session_id", PayloadDecoder.as_u64),
+    P.TAG_SESSION_TOKEN: ("session_token", PayloadDecoder.as_string),
+})
+_UPDATE_PROPERTY_FIELDS = _field_table({
+    P.TAG_FIGURE_ID: ("figure_id", PayloadDecoder.as_u64),
+    P.TAG_AXES_INDEX: ("axes_index", PayloadDecoder.as_u32),
+    P.TAG_SERIES_INDEX: ("series_index", PayloadDecoder.as_u32),
+    P.TAG_PROPERTY_NAME: ("prop", PayloadDecoder.as_string),
+    P.TAG_F1: ("f1", PayloadDecoder.as_float),
+    P.TAG_F2: ("f2", PayloadDecoder.as_float),
+    P.TAG_F3: ("f3", PayloadDecoder.as_float),
+    P.TAG_F4: ("f4", PayloadDecoder.as_float),
+    P.TAG_BOOL_VAL: ("bool_val", PayloadDecoder.as_bool),
+    P.TAG_STR_VAL: ("str_val", PayloadDecoder.as_string),
+})
+
+
 def decode_req_append_data(data: bytes) -> dict:
     """Decode REQ_APPEND_DATA payload (FlatBuffers). Returns dict with figure_id, series_index, data."""
     if fb_codec._is_fb(data):
         return fb_codec.decode_fb_req_append_data(data)
     # TLV fallback (legacy)
     result: dict = {"figure_id": 0, "series_index": 0, "data": []}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        if dec.tag == P.TAG_FIGURE_ID:
-            result["figure_id"] = dec.as_u64()
-        elif dec.tag == P.TAG_SERIES_INDEX:
-            result["series_index"] = dec.as_u32()
-        elif dec.tag == P.TAG_BLOB_INLINE:
-            result["data"] = dec.as_float_array()
-    return result
+    return _decode_fields(data, result, _APPEND_DATA_FIELDS)
 
 
 def decode_req_remove_series(data: bytes) -> dict:
@@ -360,13 +474,7 @@ def decode_req_remove_series(data: bytes) -> dict:
     if fb_codec._is_fb(data):
         return fb_codec.decode_fb_req_remove_series(data)
     result: dict = {"figure_id": 0, "series_index": 0}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        if dec.tag == P.TAG_FIGURE_ID:
-            result["figure_id"] = dec.as_u64()
-        elif dec.tag == P.TAG_SERIES_INDEX:
-            result["series_index"] = dec.as_u32()
-    return result
+    return _decode_fields(data, result, _SERIES_REF_FIELDS)
 
 
 def decode_req_close_figure(data: bytes) -> dict:
@@ -374,11 +482,7 @@ def decode_req_close_figure(data: bytes) -> dict:
     if fb_codec._is_fb(data):
         return fb_codec.decode_fb_req_close_figure(data)
     result: dict = {"figure_id": 0}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        if dec.tag == P.TAG_FIGURE_ID:
-            result["figure_id"] = dec.as_u64()
-    return result
+    return _decode_fields(data, result, _FIGURE_REF_FIELDS)
 
 
 def decode_req_reconnect(data: bytes) -> dict:
@@ -386,13 +490,7 @@ def decode_req_reconnect(data: bytes) -> dict:
     if fb_codec._is_fb(data):
         return fb_codec.decode_fb_req_reconnect(data)
     result: dict = {"session_id": 0, "session_token": ""}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        if dec.tag == P.TAG_SESSION_ID:
-            result["session_id"] = dec.as_u64()
-        elif dec.tag == P.TAG_SESSION_TOKEN:
-            result["session_token"] = dec.as_string()
-    return result
+    return _decode_fields(data, result, _RECONNECT_FIELDS)
 
 
 def decode_req_update_property(data: bytes) -> dict:
@@ -402,31 +500,9 @@ def decode_req_update_property(data: bytes) -> dict:
     result: dict = {"figure_id": 0, "axes_index": 0, "series_index": 0,
                     "prop": "", "f1": 0.0, "f2": 0.0, "f3": 0.0, "f4": 0.0,
                     "bool_val": False, "str_val": ""}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        if dec.tag == P.TAG_FIGURE_ID:
-            result["figure_id"] = dec.as_u64()
-        elif dec.tag == P.TAG_AXES_INDEX:
-            result["axes_index"] = dec.as_u32()
-        elif dec.tag == P.TAG_SERIES_INDEX:
-            result["series_index"] = dec.as_u32()
-        elif dec.tag == P.TAG_PROPERTY_NAME:
-            result["prop"] = dec.as_string()
-        elif dec.tag == P.TAG_F1:
-            result["f1"] = dec.as_float()
-        elif dec.tag == P.TAG_F2:
-            result["f2"] = dec.as_float()
-        elif dec.tag == P.TAG_F3:
-            result["f3"] = dec.as_float()
-        elif dec.tag == P.TAG_F4:
-            result["f4"] = dec.as_float()
-        elif dec.tag == P.TAG_BOOL_VAL:
-            result["bool_val"] = dec.as_bool()
-        elif dec.tag == P.TAG_STR_VAL:
-            result["str_val"] = dec.as_string()
-    return result
+    return _decode_fields(data, result, _UPDATE_PROPERTY_FIELDS)
 
-def encode_req_anim_start(figure_id: int, fps: float = 60.0, duration: float = 0.0) -> bytes:
+def encode_req_anim_start(figure_id: int, fps: float = 60.0, duration: float = 0.0) -> bytearray:
     """Encode REQ_ANIM_START — start backend-driven animation.
 
     fps: target frames per second
@@ -436,31 +512,35 @@ def encode_req_anim_start(figure_id: int, fps: float = 60.0, duration: float = 0
     enc.put_u64(P.TAG_FIGURE_ID, figure_id)
     enc.put_float(P.TAG_F1, fps)
     enc.put_float(P.TAG_F2, duration)
-    return enc.take()
+    return enc.take_buffer()
 
 
-def encode_req_anim_stop(figure_id: int) -> bytes:
+def encode_req_anim_stop(figure_id: int) -> bytearray:
     """Encode REQ_ANIM_STOP — stop backend-driven animation."""
     enc = PayloadEncoder()
     enc.put_u64(P.TAG_FIGURE_ID, figure_id)
-    return enc.take()
+    return enc.take_buffer()
+
+
+_ANIM_TICK_FIELDS = _field_table({
+    P.TAG_FIGURE_ID: ("figure_id", PayloadDecoder.as_u64),
+    P.TAG_F1: ("frame_num", PayloadDecoder.as_u32),
+    P.TAG_F2: ("t", PayloadDecoder.as_float),
+    P.TAG_F3: ("dt", PayloadDecoder.as_float),
+})
 
 
 def decode_anim_tick(data: bytes) -> dict:
     """Decode ANIM_TICK from backend. Returns {figure_id, frame_num, t, dt}."""
+    # Ticks arrive every frame; the canonical layout is read with a single
+    # unpack, falling back to the generic TLV walk for anything else.
+    if len(data) == _S_ANIM_TICK.size:
+        (t1, l1, figure_id, t2, l2, frame_num,
+         t3, l3, t, t4, l4, dt) = _S_ANIM_TICK.unpack_from(data)
+        if (t1, l1, t2, l2, t3, l3, t4, l4) == _ANIM_TICK_LAYOUT:
+            return {"figure_id": figure_id, "frame_num": frame_num, "t": t, "dt": dt}
     result = {"figure_id": 0, "frame_num": 0, "t": 0.0, "dt": 0.0}
-    dec = PayloadDecoder(data)
-    while dec.next():
-        t = dec.tag
-        if t == P.TAG_FIGURE_ID:
-            result["figure_id"] = dec.as_u64()
-        elif t == P.TAG_F1:
-            result["frame_num"] = dec.as_u32()
-        elif t == P.TAG_F2:
-            result["t"] = dec.as_float()
-        elif t == P.TAG_F3:
-            result["dt"] = dec.as_float()
-    return result
+    return _decode_fields(data, result, _ANIM_TICK_FIELDS)
 
 
 def decode_blob_release(data: bytes) -> str:
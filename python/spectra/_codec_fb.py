@@ -8,11 +8,13 @@ distinguish it from legacy TLV (0x00 or raw tag byte).
 """
 
 import struct
+from array import array
 from typing import List, Optional, Tuple
 
 import flatbuffers
 
 from . import _protocol as P
+from ._floatpack import pack_float32
 
 # Make absolute imports of the form `from spectra.ipc.fb.X import X` (emitted
 # by `flatc --python` when one FlatBuffers table references another) resolve
@@ -75,15 +77,55 @@ def _is_fb(data: bytes) -> bool:
     return len(data) > 0 and data[0] == P.PAYLOAD_FORMAT_FLATBUFFERS
 
 
+def _float32_vector(builder: flatbuffers.Builder, data: List[float]) -> int:
+    """Write *data* as a [float] vector with one bulk copy.
+
+    Mirrors Builder.CreateNumpyVector without needing numpy: array("f")
+    converts every element in C instead of one PrependFloat32 call each.
+    """
+    raw = pack_float32(data)
+    nbytes = len(raw) * 4
+    builder.StartVector(4, len(raw), 4)
+    builder.head -= nbytes
+    builder.Bytes[builder.head:builder.head + nbytes] = raw
+    builder.vectorNumElems = len(raw)
+    return builder.EndVector()
+
+
+def _unpack_vector(fb, field_offset: int, code: str) -> list:
+    """Read a scalar vector field of table *fb* with one unpack.
+
+    *field_offset* is the vtable offset the generated accessors use and
+    *code* the struct code of the element type; this replaces a Python-level
+    accessor call per element.
+    """
+    tab = fb._tab
+    o = tab.Offset(field_offset)
+    if not o:
+        return []
+    count = tab.VectorLen(o)
+    return list(struct.unpack_from(f"<{count}{code}", tab.Bytes, tab.Vector(o)))
+
+
 def _strip(data: bytes) -> bytes:
     """Remove the 1-byte format prefix."""
     return data[1:]
 
 
+def _root_offset(data: bytes) -> int:
+    """Offset of the FlatBuffer root in *data*, skipping the format prefix.
+
+    Decoders read the table in place at this offset instead of slicing the
+    prefix off, which would copy the whole payload.
+    """
+    return 1 if _is_fb(data) else 0
+
+
 def _finalize(builder: flatbuffers.Builder) -> bytes:
     """Return prefix + finished FlatBuffer bytes."""
-    buf = builder.Output()
-    return FB_PREFIX + bytes(buf)
+    # Output() already returns a fresh slice; concatenating it directly
+    # avoids a second full copy through bytes().
+    return FB_PREFIX + builder.Output()
 
 
 # ─── Encode functions ─────────────────────────────────────────────────────────
@@ -151,10 +193,7 @@ def encode_fb_req_set_data(
 ) -> bytes:
     builder = flatbuffers.Builder(256 + len(data) * 4)
     if data:
-        FBReqSetData.StartDataVector(builder, len(data))
-        for v in reversed(data):
-            builder.PrependFloat32(v)
-        data_off = builder.EndVector()
+        data_off = _float32_vector(builder, data)
     FBReqSetData.Start(builder)
     FBReqSetData.AddFigureId(builder, figure_id)
     FBReqSetData.AddSeriesIndex(builder, series_index)
@@ -171,10 +210,7 @@ def encode_fb_req_append_data(
 ) -> bytes:
     builder = flatbuffers.Builder(256 + len(data) * 4)
     if data:
-        FBReqAppendData.StartDataVector(builder, len(data))
-        for v in reversed(data):
-            builder.PrependFloat32(v)
-        data_off = builder.EndVector()
+        data_off = _float32_vector(builder, data)
     FBReqAppendData.Start(builder)
     FBReqAppendData.AddFigureId(builder, figure_id)
     FBReqAppendData.AddSeriesIndex(builder, series_index)
@@ -197,19 +233,29 @@ def encode_fb_req_update_property(
     bool_val: bool = False,
     str_val: str = "",
 ) -> bytes:
-    builder = flatbuffers.Builder(512)
+    builder = flatbuffers.Builder(128)
     prop_off = builder.CreateString(prop)
     str_off = builder.CreateString(str_val) if str_val else None
+    # Zero/False fields are schema defaults the builder would elide anyway;
+    # a setter typically supplies two or three, so skip the rest outright.
     FBReqUpdProp.Start(builder)
-    FBReqUpdProp.AddFigureId(builder, figure_id)
-    FBReqUpdProp.AddAxesIndex(builder, axes_index)
-    FBReqUpdProp.AddSeriesIndex(builder, series_index)
+    if figure_id:
+        FBReqUpdProp.AddFigureId(builder, figure_id)
+    if axes_index:
+        FBReqUpdProp.AddAxesIndex(builder, axes_index)
+    if series_index:
+        FBReqUpdProp.AddSeriesIndex(builder, series_index)
     FBReqUpdProp.AddProperty(builder, prop_off)
-    FBReqUpdProp.AddF1(builder, f1)
-    FBReqUpdProp.AddF2(builder, f2)
-    FBReqUpdProp.AddF3(builder, f3)
-    FBReqUpdProp.AddF4(builder, f4)
-    FBReqUpdProp.AddBoolVal(builder, bool_val)
+    if f1:
+        FBReqUpdProp.AddF1(builder, f1)
+    if f2:
+        FBReqUpdProp.AddF2(builder, f2)
+    if f3:
+        FBReqUpdProp.AddF3(builder, f3)
+    if f4:
+        FBReqUpdProp.AddF4(builder, f4)
+    if bool_val:
+        FBReqUpdProp.AddBoolVal(builder, bool_val)
     if str_off is not None:
         FBReqUpdProp.AddStrVal(builder, str_off)
     root = builder.EndObject()
@@ -217,27 +263,62 @@ def encode_fb_req_update_property(
     return _finalize(builder)
 
 
+# Scalar fields of ReqUpdatePropertyPayload, split around the property
+# string so fields are added in schema order.  Each setter only supplies
+# the few keys it uses; the rest are schema defaults that the builder would
+# elide anyway, so they are skipped without a call.
+_UPDATE_HEAD_FIELDS = (
+    ("figure_id", FBReqUpdProp.AddFigureId),
+    ("axes_index", FBReqUpdProp.AddAxesIndex),
+    ("series_index", FBReqUpdProp.AddSeriesIndex),
+)
+_UPDATE_TAIL_FIELDS = (
+    ("f1", FBReqUpdProp.AddF1),
+    ("f2", FBReqUpdProp.AddF2),
+    ("f3", FBReqUpdProp.AddF3),
+    ("f4", FBReqUpdProp.AddF4),
+    ("bool_val", FBReqUpdProp.AddBoolVal),
+)
+
+
 def encode_fb_req_update_batch(updates: List[dict]) -> bytes:
-    """Encode REQ_UPDATE_BATCH with nested property updates."""
-    builder = flatbuffers.Builder(1024)
+    """Encode REQ_UPDATE_BATCH with nested property updates.
+
+    Property names (and repeated string values) are written once and shared
+    by every update that uses them, so a batch touching many axes does not
+    re-serialize "xlim"/"ylim"/... per entry.  Only the fields present in
+    each update dict are written.
+    """
+    # Size the builder up front (an update is ~44-68 bytes) so large
+    # batches are not re-copied by repeated buffer doubling.
+    builder = flatbuffers.Builder(256 + 64 * len(updates))
+    strings: dict = {}
+
+    def _shared(s: str) -> int:
+        off = strings.get(s)
+        if off is None:
+            off = strings[s] = builder.CreateString(s)
+        return off
+
+    start = FBReqUpdProp.Start
+    add_prop = FBReqUpdProp.AddProperty
+    end = FBReqUpdProp.End
     offsets = []
     for upd in updates:
-        prop_off = builder.CreateString(upd.get("prop", ""))
+        prop_off = _shared(upd.get("prop", ""))
         str_val = upd.get("str_val", "")
-        str_off = builder.CreateString(str_val) if str_val else None
-        FBReqUpdProp.Start(builder)
-        FBReqUpdProp.AddFigureId(builder, upd.get("figure_id", 0))
-        FBReqUpdProp.AddAxesIndex(builder, upd.get("axes_index", 0))
-        FBReqUpdProp.AddSeriesIndex(builder, upd.get("series_index", 0))
-        FBReqUpdProp.AddProperty(builder, prop_off)
-        FBReqUpdProp.AddF1(builder, upd.get("f1", 0.0))
-        FBReqUpdProp.AddF2(builder, upd.get("f2", 0.0))
-        FBReqUpdProp.AddF3(builder, upd.get("f3", 0.0))
-        FBReqUpdProp.AddF4(builder, upd.get("f4", 0.0))
-        FBReqUpdProp.AddBoolVal(builder, upd.get("bool_val", False))
+        str_off = _shared(str_val) if str_val else None
+        start(builder)
+        for key, add in _UPDATE_HEAD_FIELDS:
+            if key in upd:
+                add(builder, upd[key])
+        add_prop(builder, prop_off)
+        for key, add in _UPDATE_TAIL_FIELDS:
+            if key in upd:
+                add(builder, upd[key])
         if str_off is not None:
             FBReqUpdProp.AddStrVal(builder, str_off)
-        offsets.append(FBReqUpdProp.End(builder))
+        offsets.append(end(builder))
     FBReqUpdBatch.StartUpdatesVector(builder, len(offsets))
     for off in reversed(offsets):
         builder.PrependUOffsetTRelative(off)
@@ -301,8 +382,7 @@ def encode_fb_req_reconnect(session_id: int, session_token: str = "") -> bytes:
 # ─── Decode functions ─────────────────────────────────────────────────────────
 
 def decode_fb_welcome(data: bytes) -> dict:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBWelcome.WelcomePayload.GetRootAs(buf, 0)
+    fb = FBWelcome.WelcomePayload.GetRootAs(data, _root_offset(data))
     return {
         "session_id": fb.SessionId(),
         "window_id": fb.WindowId(),
@@ -313,48 +393,37 @@ def decode_fb_welcome(data: bytes) -> dict:
 
 
 def decode_fb_resp_ok(data: bytes) -> int:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespOk.RespOkPayload.GetRootAs(buf, 0)
+    fb = FBRespOk.RespOkPayload.GetRootAs(data, _root_offset(data))
     return fb.RequestId()
 
 
 def decode_fb_resp_err(data: bytes) -> Tuple[int, int, str]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespErr.RespErrPayload.GetRootAs(buf, 0)
+    fb = FBRespErr.RespErrPayload.GetRootAs(data, _root_offset(data))
     return fb.RequestId(), fb.Code(), (fb.Message() or b"").decode("utf-8", errors="replace")
 
 
 def decode_fb_resp_figure_created(data: bytes) -> Tuple[int, int]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespFigCreated.RespFigureCreatedPayload.GetRootAs(buf, 0)
+    fb = FBRespFigCreated.RespFigureCreatedPayload.GetRootAs(data, _root_offset(data))
     return fb.RequestId(), fb.FigureId()
 
 
 def decode_fb_resp_axes_created(data: bytes) -> Tuple[int, int]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespAxCreated.RespAxesCreatedPayload.GetRootAs(buf, 0)
+    fb = FBRespAxCreated.RespAxesCreatedPayload.GetRootAs(data, _root_offset(data))
     return fb.RequestId(), fb.AxesIndex()
 
 
 def decode_fb_resp_series_added(data: bytes) -> Tuple[int, int]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespSerAdded.RespSeriesAddedPayload.GetRootAs(buf, 0)
+    fb = FBRespSerAdded.RespSeriesAddedPayload.GetRootAs(data, _root_offset(data))
     return fb.RequestId(), fb.SeriesIndex()
 
 
 def decode_fb_resp_figure_list(data: bytes) -> Tuple[int, List[int]]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespFigList.RespFigureListPayload.GetRootAs(buf, 0)
-    ids = []
-    if fb.FigureIdsLength():
-        for i in range(fb.FigureIdsLength()):
-            ids.append(fb.FigureIds(i))
-    return fb.RequestId(), ids
+    fb = FBRespFigList.RespFigureListPayload.GetRootAs(data, _root_offset(data))
+    return fb.RequestId(), _unpack_vector(fb, 6, "Q")
 
 
 def decode_fb_evt_window_closed(data: bytes) -> Tuple[int, int, str]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBEvtWinClosed.EvtWindowClosedPayload.GetRootAs(buf, 0)
+    fb = FBEvtWinClosed.EvtWindowClosedPayload.GetRootAs(data, _root_offset(data))
     return (
         fb.FigureId(),
         fb.WindowId(),
@@ -363,8 +432,7 @@ def decode_fb_evt_window_closed(data: bytes) -> Tuple[int, int, str]:
 
 
 def decode_fb_req_update_batch(data: bytes) -> List[dict]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBReqUpdBatch.ReqUpdateBatchPayload.GetRootAs(buf, 0)
+    fb = FBReqUpdBatch.ReqUpdateBatchPayload.GetRootAs(data, _root_offset(data))
     updates = []
     if fb.UpdatesLength():
         for i in range(fb.UpdatesLength()):
@@ -387,8 +455,7 @@ def decode_fb_req_update_batch(data: bytes) -> List[dict]:
 
 
 def decode_fb_evt_figure_destroyed(data: bytes) -> Tuple[int, str]:
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBEvtFigDestroyed.EvtFigureDestroyedPayload.GetRootAs(buf, 0)
+    fb = FBEvtFigDestroyed.EvtFigureDestroyedPayload.GetRootAs(data, _root_offset(data))
     return fb.FigureId(), (fb.Reason() or b"").decode("utf-8", errors="replace")
 
 
@@ -466,8 +533,7 @@ def encode_fb_req_list_topics() -> bytes:
 
 
 def decode_fb_resp_topic_list(data: bytes):
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespTopicList.RespTopicListPayload.GetRootAs(buf, 0)
+    fb = FBRespTopicList.RespTopicListPayload.GetRootAs(data, _root_offset(data))
     topics = []
     for i in range(fb.TopicsLength()):
         e = fb.Topics(i)
@@ -485,8 +551,7 @@ def decode_fb_resp_topic_list(data: bytes):
 
 
 def decode_fb_resp_subscribe_topic(data: bytes):
-    buf = _strip(data) if _is_fb(data) else data
-    fb = FBRespSubscribeTopic.RespSubscribeTopicPayload.GetRootAs(buf, 0)
+    fb = FBRespSubscribeTopic.RespSubscribeTopicPayload.GetRootAs(data, _root_offset(data))
     return {
         "request_id": fb.RequestId(),
         "series_index": fb.SeriesIndex(),
@@ -508,7 +573,7 @@ def decode_fb_req_append_data(data: bytes) -> dict:
     return {
         "figure_id": fb.FigureId(),
         "series_index": fb.SeriesIndex(),
-        "data": [fb.Data(i) for i in range(fb.DataLength())],
+        "data": _unpack_vector(fb, 8, "f"),
     }
 
 
@@ -44,7 +44,10 @@ No Session(), no figure(), no subplot(), no show() needed.
 from __future__ import annotations
 
 import atexit
+import functools
+import inspect
 import threading
+from collections import deque
 from typing import (
     Any,
     Callable,
@@ -55,6 +58,13 @@ from typing import (
     Union,
 )
 
+from . import _protocol as P
+from . import _codec as codec
+from . import _codec_fb as fb_codec
+from ._animation import FramePacer, ipc_sleep
+from ._log import log
+from ._series import _as_float_array
+
 # Type alias for data that can be list, tuple, or numpy array
 ArrayLike = Union[List[float], Tuple[float, ...], Sequence[float], Any]
 
@@ -62,59 +72,89 @@ ArrayLike = Union[List[float], Tuple[float, ...], Sequence[float], Any]
 def _to_list(data: ArrayLike) -> List[float]:
     """Convert any array-like to list of floats."""
     if isinstance(data, list):
-        return [float(v) for v in data]
+        return list(map(float, data))
     try:
         import numpy as np
         if isinstance(data, np.ndarray):
-            return data.ravel().astype(np.float64).tolist()
+            flat = data.ravel()
+            # tolist() already yields Python floats for any float dtype
+            if flat.dtype.kind != "f":
+                flat = flat.astype(np.float64)
+            return flat.tolist()
     except ImportError:
         pass
-    return [float(v) for v in data]
+    return list(map(float, data))
+
+
+def _to_flat(data: ArrayLike):
+    """Flatten array input to a 1-D view; convert anything else to a float list.
+
+    numpy arrays and float buffer-protocol objects (``array.array``,
+    ``memoryview``) stay arrays, so they reach ``Series.set_data`` /
+    ``set_data_xyz`` without a round-trip through Python floats.
+    """
+    arr = _as_float_array(data)
+    if arr is not None:
+        return arr.ravel()
+    return _to_list(data)
+
+
+_NAMED_COLORS = {
+    "red": (1.0, 0.2, 0.2, 1.0),
+    "r": (1.0, 0.2, 0.2, 1.0),
+    "green": (0.2, 0.8, 0.2, 1.0),
+    "g": (0.2, 0.8, 0.2, 1.0),
+    "blue": (0.2, 0.4, 1.0, 1.0),
+    "b": (0.2, 0.4, 1.0, 1.0),
+    "yellow": (1.0, 0.9, 0.1, 1.0),
+    "y": (1.0, 0.9, 0.1, 1.0),
+    "cyan": (0.0, 0.9, 0.9, 1.0),
+    "c": (0.0, 0.9, 0.9, 1.0),
+    "magenta": (0.9, 0.1, 0.9, 1.0),
+    "m": (0.9, 0.1, 0.9, 1.0),
+    "white": (1.0, 1.0, 1.0, 1.0),
+    "w": (1.0, 1.0, 1.0, 1.0),
+    "black": (0.0, 0.0, 0.0, 1.0),
+    "k": (0.0, 0.0, 0.0, 1.0),
+    "orange": (1.0, 0.5, 0.0, 1.0),
+    "purple": (0.6, 0.2, 0.9, 1.0),
+    "pink": (1.0, 0.4, 0.7, 1.0),
+    "gray": (0.5, 0.5, 0.5, 1.0),
+    "grey": (0.5, 0.5, 0.5, 1.0),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color_str(color: str) -> Optional[Tuple[float, float, float, float]]:
+    """Parse a color name or hex string (cached; inputs repeat heavily)."""
+    lower = color.lower().strip()
+    named = _NAMED_COLORS.get(lower)
+    if named is not None:
+        return named
+    # Hex color
+    if lower.startswith("#") and len(lower) in (7, 9):
+        r = int(lower[1:3], 16) / 255.0
+        g = int(lower[3:5], 16) / 255.0
+        b = int(lower[5:7], 16) / 255.0
+        a = int(lower[7:9], 16) / 255.0 if len(lower) == 9 else 1.0
+        return (r, g, b, a)
+    return None
 
 
 def _parse_color(color: Union[str, Tuple, List, None]) -> Optional[Tuple[float, float, float, float]]:
     """Parse color from name, hex, or tuple."""
     if color is None:
         return None
+    if isinstance(color, str):
+        named = _NAMED_COLORS.get(color)
+        if named is not None:
+            return named
+        return _parse_color_str(color)
     if isinstance(color, (tuple, list)):
         if len(color) == 3:
             return (float(color[0]), float(color[1]), float(color[2]), 1.0)
         elif len(color) == 4:
             return (float(color[0]), float(color[1]), float(color[2]), float(color[3]))
-    if isinstance(color, str):
-        _NAMED = {
-            "red": (1.0, 0.2, 0.2, 1.0),
-            "r": (1.0, 0.2, 0.2, 1.0),
-            "green": (0.2, 0.8, 0.2, 1.0),
-            "g": (0.2, 0.8, 0.2, 1.0),
-            "blue": (0.2, 0.4, 1.0, 1.0),
-            "b": (0.2, 0.4, 1.0, 1.0),
-            "yellow": (1.0, 0.9, 0.1, 1.0),
-            "y": (1.0, 0.9, 0.1, 1.0),
-            "cyan": (0.0, 0.9, 0.9, 1.0),
-            "c": (0.0, 0.9, 0.9, 1.0),
-            "magenta": (0.9, 0.1, 0.9, 1.0),
-            "m": (0.9, 0.1, 0.9, 1.0),
-            "white": (1.0, 1.0, 1.0, 1.0),
-            "w": (1.0, 1.0, 1.0, 1.0),
-            "black": (0.0, 0.0, 0.0, 1.0),
-            "k": (0.0, 0.0, 0.0, 1.0),
-            "orange": (1.0, 0.5, 0.0, 1.0),
-            "purple": (0.6, 0.2, 0.9, 1.0),
-            "pink": (1.0, 0.4, 0.7, 1.0),
-            "gray": (0.5, 0.5, 0.5, 1.0),
-            "grey": (0.5, 0.5, 0.5, 1.0),
-        }
-        lower = color.lower().strip()
-        if lower in _NAMED:
-            return _NAMED[lower]
-        # Hex color
-        if lower.startswith("#") and len(lower) in (7, 9):
-            r = int(lower[1:3], 16) / 255.0
-            g = int(lower[3:5], 16) / 255.0
-            b = int(lower[5:7], 16) / 255.0
-            a = int(lower[7:9], 16) / 255.0 if len(lower) == 9 else 1.0
-            return (r, g, b, a)
     return None
 
 
@@ -124,18 +164,16 @@ class _EasyState:
     """Singleton managing the background session and current figure/axes."""
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
         self._session = None  # type: Optional[Session]
         self._current_fig = None
         self._current_axes = None
         self._current_axes3d = None
         self._current_axes_key = (1, 1, 1)  # (rows, cols, index)
         self._figures: List = []
-        self._pending_show: set = set()  # figure ids needing show()
         self._live_threads: List[threading.Thread] = []
         self._live_stop_events: List[threading.Event] = []
         self._shutting_down = False
-        self._axes_bounds: dict = {}  # id(axes) -> [xmin, xmax, ymin, ymax]
+        self._axes_bounds: dict = {}  # (figure_id, axes_index) -> (xmin, xmax, ymin, ymax)
         self._subplot_cache: dict = {}  # (figure_id, rows, cols, index) -> Axes
         self._pending_knobs: List[dict] = []
         self._interactive_bindings: List = []
@@ -157,15 +195,15 @@ class _EasyState:
             self._current_axes = None
             self._current_axes_key = (1, 1, 1)
             self._figures.append(self._current_fig)
-            self._pending_show.add(id(self._current_fig))
+            self._current_fig._pending_show = True
         return self._current_fig
 
     def _show_if_pending(self):
         """Show the current figure if it hasn't been shown yet."""
         fig = self._current_fig
-        if fig is not None and id(fig) in self._pending_show:
+        if fig is not None and fig._pending_show:
             self._flush_pending_knobs()
-            self._pending_show.discard(id(fig))
+            fig._pending_show = False
             fig.show()
             _ensure_interactive_loop()
 
@@ -188,9 +226,6 @@ class _EasyState:
         """Push queued knob definitions to the backend before the window opens."""
         if not self._pending_knobs:
             return
-        from . import _protocol as P
-        from . import _codec as codec
-
         session = self._ensure_session()
         for spec in self._pending_knobs:
             payload = codec.encode_req_update_property(
@@ -258,7 +293,7 @@ def figure(title: str = "", width: int = 1280, height: int = 720):
     _state._current_axes3d = None
     _state._current_axes_key = (1, 1, 1)
     _state._figures.append(fig)
-    _state._pending_show.add(id(fig))
+    fig._pending_show = True
     return fig
 
 
@@ -369,7 +404,7 @@ def plot(
 
     Returns the Series object for further customization.
     """
-    x, y = _parse_xy_args(args)
+    x, y = _parse_xy_flat(args)
     ax = _state._ensure_axes()
     series = ax.line(x, y, label=label)
     _apply_series_style(series, color=color, width=width, **kwargs)
@@ -396,7 +431,7 @@ def scatter(
 
     Returns the Series object.
     """
-    x, y = _parse_xy_args(args)
+    x, y = _parse_xy_flat(args)
     ax = _state._ensure_axes()
     series = ax.scatter(x, y, label=label)
     _apply_series_style(series, color=color, size=size, **kwargs)
@@ -405,6 +440,69 @@ def scatter(
     return series
 
 
+def _stem_segments(x: List[float], y: List[float]):
+    """Return (x, y) for one baseline-to-point segment per sample,
+    separated by NaN gaps."""
+    n = min(len(x), len(y))
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        nan = float("nan")
+        stem_x = []
+        stem_y = []
+        for xi, yi in zip(x, y):
+            stem_x.extend([xi, xi, nan])
+            stem_y.extend([0.0, yi, nan])
+        return stem_x, stem_y
+
+    sx = np.empty((n, 3))
+    sx[:, 0] = x[:n]
+    sx[:, 1] = sx[:, 0]
+    sx[:, 2] = np.nan
+    sy = np.empty((n, 3))
+    sy[:, 0] = 0.0
+    sy[:, 1] = y[:n]
+    sy[:, 2] = np.nan
+    return sx.ravel(), sy.ravel()
+
+
+def _bar_segments(x: List[float], heights: List[float], hw: float):
+    """Return (x, y) outlining one closed rectangle per bar, separated by
+    NaN gaps."""
+    n = min(len(x), len(heights))
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        nan = float("nan")
+        bx = []
+        by = []
+        for xi, hi in zip(x, heights):
+            # Rectangle: 5 points + NaN separator
+            bx.extend([xi - hw, xi - hw, xi + hw, xi + hw, xi - hw, nan])
+            by.extend([0.0, hi, hi, 0.0, 0.0, nan])
+        return bx, by
+
+    xa = np.asarray(x[:n], dtype=np.float64)
+    left = xa - hw
+    right = xa + hw
+    bx = np.empty((n, 6))
+    bx[:, 0] = left
+    bx[:, 1] = left
+    bx[:, 2] = right
+    bx[:, 3] = right
+    bx[:, 4] = left
+    bx[:, 5] = np.nan
+    by = np.zeros((n, 6))
+    by[:, 1] = heights[:n]
+    by[:, 2] = by[:, 1]
+    by[:, 5] = np.nan
+    return bx.ravel(), by.ravel()
+
+
 def stem(
     *args,
     color: Union[str, Tuple, List, None] = None,
@@ -417,11 +515,7 @@ def stem(
     x, y = _parse_xy_args(args)
     ax = _state._ensure_axes()
     # Draw vertical lines as a line series with NaN gaps
-    stem_x = []
-    stem_y = []
-    for xi, yi in zip(x, y):
-        stem_x.extend([xi, xi, float("nan")])
-        stem_y.extend([0.0, yi, float("nan")])
+    stem_x, stem_y = _stem_segments(x, y)
     line = ax.line(stem_x, stem_y, label=label)
     dots = ax.scatter(x, y, label="")
     c = _parse_color(color)
@@ -433,6 +527,60 @@ def stem(
     return line
 
 
+def _hist_steps(data: ArrayLike, bins: int):
+    """Bin *data* into equal-width bins and return the (x, y) step outline,
+    or None for empty input.
+
+    With numpy the binning runs as array operations that reproduce the
+    pure-Python loop exactly (same bin edges, same truncating index).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        values = _to_list(data)
+        if not values:
+            return None
+        lo = min(values)
+        hi = max(values)
+        if lo == hi:
+            hi = lo + 1.0
+        bin_width = (hi - lo) / bins
+        counts = [0] * bins
+        for v in values:
+            idx = min(int((v - lo) / bin_width), bins - 1)
+            counts[idx] += 1
+
+        # Build step-function x/y
+        step_x = []
+        step_y = []
+        for i in range(bins):
+            edge_l = lo + i * bin_width
+            edge_r = edge_l + bin_width
+            step_x.extend([edge_l, edge_r])
+            step_y.extend([counts[i], counts[i]])
+        return step_x, step_y
+
+    arr = _as_float_array(data)
+    if arr is None:
+        arr = _to_list(data)
+    values = np.asarray(arr, dtype=np.float64).ravel()
+    if values.size == 0:
+        return None
+    lo = float(values.min())
+    hi = float(values.max())
+    if lo == hi:
+        hi = lo + 1.0
+    bin_width = (hi - lo) / bins
+    idx = np.minimum(((values - lo) / bin_width).astype(np.int64), bins - 1)
+    counts = np.bincount(idx, minlength=bins)
+    edge_l = lo + np.arange(bins) * bin_width
+    step_x = np.column_stack((edge_l, edge_l + bin_width)).ravel()
+    step_y = np.repeat(counts, 2).astype(np.float64)
+    return step_x, step_y
+
+
 def hist(
     data: ArrayLike,
     bins: int = 30,
@@ -446,27 +594,10 @@ def hist(
         sp.hist(data)
         sp.hist(data, bins=50, color="orange")
     """
-    values = _to_list(data)
-    if not values:
+    steps = _hist_steps(data, bins)
+    if steps is None:
         return None
-    lo = min(values)
-    hi = max(values)
-    if lo == hi:
-        hi = lo + 1.0
-    bin_width = (hi - lo) / bins
-    counts = [0] * bins
-    for v in values:
-        idx = min(int((v - lo) / bin_width), bins - 1)
-        counts[idx] += 1
-
-    # Build step-function x/y
-    step_x = []
-    step_y = []
-    for i in range(bins):
-        edge_l = lo + i * bin_width
-        edge_r = edge_l + bin_width
-        step_x.extend([edge_l, edge_r])
-        step_y.extend([counts[i], counts[i]])
+    step_x, step_y = steps
 
     ax = _state._ensure_axes()
     series = ax.line(step_x, step_y, label=label)
@@ -493,13 +624,7 @@ def bar(
     """
     xv = _to_list(x)
     hv = _to_list(heights)
-    hw = bar_width / 2.0
-    bx = []
-    by = []
-    for xi, hi in zip(xv, hv):
-        # Rectangle: 5 points + NaN separator
-        bx.extend([xi - hw, xi - hw, xi + hw, xi + hw, xi - hw, float("nan")])
-        by.extend([0.0, hi, hi, 0.0, 0.0, float("nan")])
+    bx, by = _bar_segments(xv, hv, bar_width / 2.0)
 
     ax = _state._ensure_axes()
     series = ax.line(bx, by, label=label)
@@ -807,9 +932,8 @@ def fplot(
     ax = _state._ensure_axes()
 
     if xmin is None or xmax is None:
-        ax_key = (ax._figure_id, ax._index)
-        if ax_key in _state._axes_bounds:
-            bounds = _state._axes_bounds[ax_key]
+        bounds = _state._axes_bounds.get((ax._figure_id, ax._index))
+        if bounds is not None:
             if xmin is None:
                 xmin = bounds[0]
             if xmax is None:
@@ -893,10 +1017,7 @@ def _queue_knob(ax, name: str, value: float, vmin: float, vmax: float) -> None:
     }
     _state._knob_values[name] = float(value)
     fig = _state._current_fig
-    if fig is not None and id(fig) not in _state._pending_show:
-        from . import _protocol as P
-        from . import _codec as codec
-
+    if fig is not None and not fig._pending_show:
         session = _state._ensure_session()
         payload = codec.encode_req_update_property(
             figure_id=spec["figure_id"],
@@ -917,14 +1038,10 @@ def _queue_knob(ax, name: str, value: float, vmin: float, vmax: float) -> None:
 
 
 def _poll_knob_values(session) -> dict:
-    from . import _protocol as P
-    from . import _codec as codec
-
     try:
         resp = session._request(P.REQ_GET_SNAPSHOT, b"")
         payload = resp["payload"]
         if payload and payload[0] == P.PAYLOAD_FORMAT_FLATBUFFERS:
-            from . import _codec_fb as fb_codec
             return fb_codec.decode_fb_snapshot_knobs(payload)
     except Exception:
         pass
@@ -935,9 +1052,6 @@ def _ensure_interactive_loop() -> None:
     if _state._interactive_started or not _state._interactive_bindings:
         return
     _state._interactive_started = True
-    from ._animation import ipc_sleep
-    from ._log import log
-
     stop_event = threading.Event()
     _state._live_stop_events.append(stop_event)
 
@@ -1018,9 +1132,8 @@ def ifplot(
     ax = _state._ensure_axes()
 
     if xmin is None or xmax is None:
-        ax_key = (ax._figure_id, ax._index)
-        if ax_key in _state._axes_bounds:
-            bounds = _state._axes_bounds[ax_key]
+        bounds = _state._axes_bounds.get((ax._figure_id, ax._index))
+        if bounds is not None:
             xmin = xmin if xmin is not None else bounds[0]
             xmax = xmax if xmax is not None else bounds[1]
         else:
@@ -1051,23 +1164,52 @@ def ifplot(
 
 # ─── Auto-fit helper ─────────────────────────────────────────────────────────
 
+def _finite_bounds(vals: ArrayLike) -> Optional[Tuple[float, float]]:
+    """Return (min, max) over the finite values of *vals*, or None if there
+    are none.
+
+    NaN, inf and the +/-1e11 sentinels used by hline/vline are skipped.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        if not isinstance(vals, list):
+            vals = _to_list(vals)
+        finite = [v for v in vals if v == v and abs(v) < 1e11]
+        if not finite:
+            return None
+        return min(finite), max(finite)
+
+    arr = _as_float_array(vals)
+    if arr is None:
+        arr = vals if isinstance(vals, list) else _to_list(vals)
+    arr = np.asarray(arr, dtype=np.float64).ravel()
+    # abs(NaN) < 1e11 is False, so one comparison drops NaN, inf and sentinels
+    finite = arr[np.abs(arr) < 1e11]
+    if finite.size == 0:
+        return None
+    return float(finite.min()), float(finite.max())
+
+
 def _auto_fit_axes(ax, x: List[float], y: List[float]) -> None:
     """Set axis limits to fit ALL series data with 5% padding, ignoring NaN values.
 
     Accumulates bounds across multiple plot() calls on the same axes so that
     earlier series are not pushed out of frame by later ones.
     """
-    finite_x = [v for v in x if v == v and abs(v) < 1e11]  # filter NaN and sentinel hlines/vlines
-    finite_y = [v for v in y if v == v and abs(v) < 1e11]
-    if not finite_x or not finite_y:
+    xb = _finite_bounds(x)
+    yb = _finite_bounds(y)
+    if xb is None or yb is None:
         return
-    new_xmin, new_xmax = min(finite_x), max(finite_x)
-    new_ymin, new_ymax = min(finite_y), max(finite_y)
+    new_xmin, new_xmax = xb
+    new_ymin, new_ymax = yb
 
     # Accumulate with existing bounds for this axes
     ax_key = (ax._figure_id, ax._index)
-    if ax_key in _state._axes_bounds:
-        prev = _state._axes_bounds[ax_key]
+    prev = _state._axes_bounds.get(ax_key)
+    if prev is not None:
         xmin = min(prev[0], new_xmin)
         xmax = max(prev[1], new_xmax)
         ymin = min(prev[2], new_ymin)
@@ -1075,7 +1217,7 @@ def _auto_fit_axes(ax, x: List[float], y: List[float]) -> None:
     else:
         xmin, xmax = new_xmin, new_xmax
         ymin, ymax = new_ymin, new_ymax
-    _state._axes_bounds[ax_key] = [xmin, xmax, ymin, ymax]
+    _state._axes_bounds[ax_key] = (xmin, xmax, ymin, ymax)
 
     # Add 5% padding
     xpad = (xmax - xmin) * 0.05 if xmax != xmin else 0.5
@@ -1090,10 +1232,10 @@ def _auto_fit_axes(ax, x: List[float], y: List[float]) -> None:
 def _auto_fit_axes3d(ax, x: List[float], y: List[float], z: List[float]) -> None:
     """Set 3D axis limits to fit data with 5% padding, ignoring NaN values."""
     def _fit(vals):
-        finite = [v for v in vals if v == v and abs(v) < 1e11]
-        if not finite:
+        bounds = _finite_bounds(vals)
+        if bounds is None:
             return None, None
-        lo, hi = min(finite), max(finite)
+        lo, hi = bounds
         pad = (hi - lo) * 0.05 if hi != lo else 0.5
         return lo - pad, hi + pad
 
@@ -1128,9 +1270,9 @@ def plot3(
         sp.plot3(x, y, z)
         sp.plot3(x, y, z, color="red", label="helix")
     """
-    xv = _to_list(x)
-    yv = _to_list(y)
-    zv = _to_list(z)
+    xv = _to_flat(x)
+    yv = _to_flat(y)
+    zv = _to_flat(z)
     ax = _state._ensure_axes3d()
     series = ax._add_series_3d("line3d", xv, yv, zv, label=label)
     _apply_series_style(series, color=color, width=width)
@@ -1154,9 +1296,9 @@ def scatter3(
         sp.scatter3(x, y, z)
         sp.scatter3(x, y, z, color="blue", size=3)
     """
-    xv = _to_list(x)
-    yv = _to_list(y)
-    zv = _to_list(z)
+    xv = _to_flat(x)
+    yv = _to_flat(y)
+    zv = _to_flat(z)
     ax = _state._ensure_axes3d()
     series = ax._add_series_3d("scatter3d", xv, yv, zv, label=label)
     _apply_series_style(series, color=color, size=size)
@@ -1180,9 +1322,9 @@ def surf(
         Z = np.sin(X) * np.cos(Y)
         sp.surf(X, Y, Z)
     """
-    xv = _to_list(x)
-    yv = _to_list(y)
-    zv = _to_list(z)
+    xv = _to_flat(x)
+    yv = _to_flat(y)
+    zv = _to_flat(z)
     ax = _state._ensure_axes3d()
     series = ax._add_series_3d("surface", xv, yv, zv, label=label or "surface")
     c = _parse_color(color)
@@ -1237,8 +1379,67 @@ def legend(visible: bool = True):
     _current_axes_any().legend(visible)
 
 
+def axes(
+    title: Optional[str] = None,
+    xlabel: Optional[str] = None,
+    ylabel: Optional[str] = None,
+    grid: Optional[bool] = None,
+    legend: Optional[bool] = None,
+    xlim: Optional[Tuple[float, float]] = None,
+    ylim: Optional[Tuple[float, float]] = None,
+):
+    """Configure the current axes in one call.
+
+    Only the given settings are changed. They are sent together as a single
+    REQ_UPDATE_BATCH instead of one message per setter.
+
+    Usage::
+
+        sp.axes(title="Trigonometry", xlabel="x", ylabel="y",
+                grid=True, legend=True)
+        sp.axes(xlim=(0, 10), ylim=(-1, 1))
+
+    Returns the Axes object.
+    """
+    ax = _current_axes_any()
+    with ax.batch() as b:
+        if title is not None:
+            b.set_title(title)
+        if xlabel is not None:
+            b.set_xlabel(xlabel)
+        if ylabel is not None:
+            b.set_ylabel(ylabel)
+        if xlim is not None:
+            b.set_xlim(*xlim)
+        if ylim is not None:
+            b.set_ylim(*ylim)
+        if grid is not None:
+            b.grid(grid)
+        if legend is not None:
+            b.legend(legend)
+    return ax
+
+
 # ─── Live Streaming / Animation ──────────────────────────────────────────────
 
+def batch():
+    """Group data and property updates into a single backend write.
+
+    Usage::
+
+        def update(t, dt):
+            with sp.batch():
+                line1.set_data(x, y1)
+                line2.set_data(x, y2)
+                sp.xlim(x[0], x[-1])
+    """
+    return _state._ensure_session().batch()
+
+
+# live(): frames between y-range rescans of the auto-append window
+_LIVE_YLIM_EVERY = 4
+
+
 def live(
     callback: Callable,
     fps: float = 30.0,
@@ -1267,18 +1468,15 @@ def live(
         sp.live(lambda t: math.sin(t), fps=30, title="Sine Wave")
 
     If callback returns a single number, it's auto-appended to a line series.
+    Each tick runs inside ``batch()``, so all updates made during one frame
+    reach the backend in a single write.
     """
-    import inspect
-
     fig_obj = _state._ensure_figure()
     ax = _state._ensure_axes()
     _state._show_if_pending()
 
     # Notify the backend that this figure is live-streaming at the
     # requested FPS so the render loop runs continuously.
-    from . import _protocol as P
-    from . import _codec as codec
-
     session = _state._ensure_session()
     try:
         payload = codec.encode_req_anim_start(fig_obj._id, fps=fps, duration=duration)
@@ -1286,35 +1484,70 @@ def live(
     except Exception:
         pass  # Best-effort; Python-side pacing still works as fallback
 
-    # Detect callback signature
+    # Detect callback signature once and pick the matching call shape
     sig = inspect.signature(callback)
     nparams = len(sig.parameters)
+    if nparams >= 3:
+        invoke = callback
+    elif nparams >= 2:
+        def invoke(t, dt, ax):
+            return callback(t, dt)
+    else:
+        def invoke(t, dt, ax):
+            return callback(t)
 
     # Check if callback returns a value (auto-append mode)
     # We'll detect this on first call
     auto_series = None
-    auto_t_data = []
-    auto_y_data = []
-    window_size = int(fps * 10)  # 10 seconds of visible data
+    window_size = max(int(fps * 10), 1)  # 10 seconds of visible data
+    # Sliding window: appends past maxlen evict the oldest samples in O(1)
+    auto_t_data = deque(maxlen=window_size)
+    auto_y_data = deque(maxlen=window_size)
 
     stop_event = threading.Event()
     _state._live_stop_events.append(stop_event)
 
     def _loop():
-        nonlocal auto_series, auto_t_data, auto_y_data
-        from ._animation import FramePacer
-        from ._log import log
-
+        nonlocal auto_series
         pacer = FramePacer(fps=fps)
         t = 0.0
         dt = 1.0 / fps
         session = _state._ensure_session()
 
+        # Bind per-frame lookups once; the flags themselves are still read
+        # fresh every tick.
+        state = _state
+        stopped = stop_event.is_set
+        batch = session.batch
+        pace = pacer.pace
+        frame = 0
+
+        def follow_window():
+            """Push the window to the series and scroll the axes with it.
+
+            x tracks the window every frame; the y range is rescanned only
+            every ``_LIVE_YLIM_EVERY`` frames.
+            """
+            nonlocal frame
+            ys = list(auto_y_data)
+            auto_series.set_data(list(auto_t_data), ys)
+            if len(ys) > 1:
+                try:
+                    ax.set_xlim(auto_t_data[0], auto_t_data[-1])
+                    if frame % _LIVE_YLIM_EVERY == 0:
+                        ymin = min(ys)
+                        ymax = max(ys)
+                        margin = max(abs(ymax - ymin) * 0.1, 0.1)
+                        ax.set_ylim(ymin - margin, ymax + margin)
+                    frame += 1
+                except Exception:
+                    pass
+
         log.info("live thread running (count=%d, fps=%.0f)",
                  session._live_thread_count, fps)
         try:
-            while not stop_event.is_set():
-                if _state._shutting_down:
+            while not stopped():
+                if state._shutting_down:
                     log.debug("live thread: shutting down")
                     break
                 if not fig_obj._visible:
@@ -1326,70 +1559,42 @@ def live(
                     break
 
                 try:
-                    # Call with appropriate number of args
-                    if nparams >= 3:
-                        result = callback(t, dt, ax)
-                    elif nparams >= 2:
-                        result = callback(t, dt)
-                    else:
-                        result = callback(t)
-
-                    # Auto-append mode: if callback returns a number
-                    if result is not None and isinstance(result, (int, float)):
-                        if auto_series is None:
-                            auto_series = ax.line([], [], label=title if title != "Live" else "")
-                            try:
-                                ax.set_ylim(-2.0, 2.0)
-                            except Exception:
-                                pass
-                        auto_t_data.append(t)
-                        auto_y_data.append(float(result))
-                        # Sliding window
-                        if len(auto_t_data) > window_size:
-                            auto_t_data = auto_t_data[-window_size:]
-                            auto_y_data = auto_y_data[-window_size:]
-                        auto_series.set_data(auto_t_data, auto_y_data)
-                        if len(auto_t_data) > 1:
-                            try:
-                                ax.set_xlim(auto_t_data[0], auto_t_data[-1])
-                                ymin = min(auto_y_data)
-                                ymax = max(auto_y_data)
-                                margin = max(abs(ymax - ymin) * 0.1, 0.1)
-                                ax.set_ylim(ymin - margin, ymax + margin)
-                            except Exception:
-                                pass
-
-                    # Auto-append mode: if callback returns a tuple/list of numbers
-                    elif result is not None and isinstance(result, (tuple, list)):
-                        if len(result) == 2:
-                            xv, yv = result
+                    # Everything this tick sends goes out as one pipelined
+                    # write instead of a round-trip per request.
+                    with batch():
+                        result = invoke(t, dt, ax)
+
+                        # Auto-append mode: if callback returns a number
+                        if result is not None and isinstance(result, (int, float)):
                             if auto_series is None:
                                 auto_series = ax.line([], [], label=title if title != "Live" else "")
-                            if isinstance(xv, (int, float)):
-                                auto_t_data.append(float(xv))
-                                auto_y_data.append(float(yv))
-                            else:
-                                auto_t_data.extend(_to_list(xv))
-                                auto_y_data.extend(_to_list(yv))
-                            if len(auto_t_data) > window_size:
-                                auto_t_data = auto_t_data[-window_size:]
-                                auto_y_data = auto_y_data[-window_size:]
-                            auto_series.set_data(auto_t_data, auto_y_data)
-                            if len(auto_t_data) > 1:
                                 try:
-                                    ax.set_xlim(auto_t_data[0], auto_t_data[-1])
-                                    ymin = min(auto_y_data)
-                                    ymax = max(auto_y_data)
-                                    margin = max(abs(ymax - ymin) * 0.1, 0.1)
-                                    ax.set_ylim(ymin - margin, ymax + margin)
+                                    ax.set_ylim(-2.0, 2.0)
                                 except Exception:
                                     pass
+                            auto_t_data.append(t)
+                            auto_y_data.append(float(result))
+                            follow_window()
+
+                        # Auto-append mode: if callback returns a tuple/list of numbers
+                        elif result is not None and isinstance(result, (tuple, list)):
+                            if len(result) == 2:
+                                xv, yv = result
+                                if auto_series is None:
+                                    auto_series = ax.line([], [], label=title if title != "Live" else "")
+                                if isinstance(xv, (int, float)):
+                                    auto_t_data.append(float(xv))
+                                    auto_y_data.append(float(yv))
+                                else:
+                                    auto_t_data.extend(_to_list(xv))
+                                    auto_y_data.extend(_to_list(yv))
+                                follow_window()
 
                 except Exception as e:
                     log.warning("live callback error: %s", e)
 
                 t += dt
-                pacer.pace(session)
+                pace(session)
         finally:
             session._live_thread_count -= 1
             log.info("live thread stopped (count=%d)", session._live_thread_count)
@@ -1473,7 +1678,7 @@ def close():
     # Remove from tracking
     if fig in _state._figures:
         _state._figures.remove(fig)
-    _state._pending_show.discard(id(fig))
+    fig._pending_show = False
     # Switch current to the most recent remaining figure, or None
     if _state._figures:
         _state._current_fig = _state._figures[-1]
@@ -1564,6 +1769,24 @@ def _parse_xy_args(args) -> Tuple[List[float], List[float]]:
         return x, y
 
 
+def _parse_xy_flat(args):
+    """Like :func:`_parse_xy_args`, but array input stays a flat array.
+
+    Used by plot() and scatter() so ndarrays and float buffers are packed
+    once by ``Series.set_data`` instead of being boxed into Python floats.
+    """
+    if len(args) == 0:
+        return [], []
+    elif len(args) == 1:
+        y = _to_flat(args[0])
+        if isinstance(y, list):
+            return [float(i) for i in range(len(y))], y
+        import numpy as np
+        return np.arange(y.size, dtype=np.float64), y
+    else:
+        return _to_flat(args[0]), _to_flat(args[1])
+
+
 def _apply_series_style(
     series,
     color=None,
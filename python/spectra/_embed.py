@@ -24,6 +24,8 @@ import os
 from pathlib import Path
 from typing import Optional, Tuple
 
+from ._series import _as_float_array
+
 # ─── Library loading ─────────────────────────────────────────────────────────
 
 _lib: Optional[ctypes.CDLL] = None
@@ -607,18 +609,18 @@ def _load_lib() -> ctypes.CDLL:
 def _to_cfloat(data) -> Tuple[ctypes.POINTER(ctypes.c_float), int, object]:
     """Convert a sequence/ndarray to (float pointer, count, owner).
 
-    For contiguous float32 numpy arrays this is zero-copy; the returned owner
-    must be kept alive by the caller for as long as the pointer is used.
+    For contiguous float32 numpy arrays and float32 buffers (``array.array('f')``,
+    ``memoryview``) this is zero-copy; other float arrays are converted in a
+    single pass. The returned owner must be kept alive by the caller for as
+    long as the pointer is used.
     """
-    try:
+    arr = _as_float_array(data)
+    if arr is not None:
         import numpy as np
 
-        if isinstance(data, np.ndarray):
-            arr = np.ascontiguousarray(data, dtype=np.float32)
-            ptr = arr.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
-            return ptr, arr.size, arr
-    except ImportError:
-        pass
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+        ptr = arr.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        return ptr, arr.size, arr
 
     n = len(data)
     arr = (ctypes.c_float * n)(*data)
@@ -1295,8 +1297,15 @@ class EmbedSurface:
             raise RuntimeError("render_to_buffer failed")
         return bytes(self._buf)
 
-    def render_into(self, buf: ctypes.Array) -> bool:
-        """Render directly into a pre-allocated ctypes buffer (zero-copy)."""
+    def render_into(self, buf) -> bool:
+        """Render directly into a pre-allocated buffer (zero-copy).
+
+        *buf* is a ctypes array or any writable, C-contiguous buffer of at
+        least ``width * height * 4`` bytes — e.g. a ``(H, W, 4)`` uint8 numpy
+        array or a ``bytearray`` that also backs a QImage.
+        """
+        if not isinstance(buf, ctypes.Array):
+            buf = (ctypes.c_uint8 * (self.width * self.height * 4)).from_buffer(buf)
         return bool(self._lib.spectra_embed_render(self._handle, buf))
 
     # ── Phase 5C: rich output helpers ────────────────────────────────────
@@ -1305,16 +1314,10 @@ class EmbedSurface:
         """Render one frame and return an (H, W, 4) uint8 RGBA numpy array."""
         import numpy as np
 
-        w = self.width
-        h = self.height
-        buf_size = w * h * 4
-        if len(self._buf) != buf_size:
-            self._buf = (ctypes.c_uint8 * buf_size)()
-        ok = self._lib.spectra_embed_render(self._handle, self._buf)
-        if not ok:
+        arr = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        if not self.render_into(arr):
             raise RuntimeError("render failed")
-        arr = np.frombuffer(self._buf, dtype=np.uint8, count=buf_size)
-        return arr.reshape(h, w, 4).copy()
+        return arr
 
     def render_pil(self):
         """Render one frame and return a PIL.Image (RGBA)."""
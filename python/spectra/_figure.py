@@ -18,7 +18,10 @@ class Figure:
     All mutations are sent to the backend via IPC.
     """
 
-    __slots__ = ("_session", "_id", "_title", "_axes_list", "_visible", "_shown_once", "_window_id")
+    __slots__ = (
+        "_session", "_id", "_title", "_axes_list", "_visible", "_shown_once",
+        "_window_id", "_pending_show",
+    )
 
     def __init__(self, session: Session, figure_id: int, title: str = "") -> None:
         self._session = session
@@ -28,6 +31,7 @@ class Figure:
         self._visible = False
         self._shown_once = False
         self._window_id: int = 0
+        self._pending_show = False  # easy API: show() deferred until data is ready
 
     @property
     def id(self) -> int:
@@ -0,0 +1,50 @@
+"""Bulk float32 packing shared by the TLV and FlatBuffers encoders.
+
+``array("f")`` converts a whole list in C, but unlike ``struct.pack("<f")``
+it silently stores finite values beyond float32 range as inf. The check
+here restores the struct behaviour: a finite input that lands on inf
+raises OverflowError, while real inf and NaN inputs pass through.
+"""
+
+import math
+import sys
+from array import array
+from typing import List
+
+_OVERFLOW_MSG = "float too large to pack with f format"
+
+
+def pack_float32(data: List[float]) -> array:
+    """Convert *data* to a little-endian ``array("f")``.
+
+    Raises OverflowError for finite values that do not fit in float32,
+    exactly where ``struct.pack("<f", v)`` would.
+    """
+    raw = array("f", data)
+    if raw:
+        _check_range(data, raw)
+    if sys.byteorder != "little":
+        raw.byteswap()
+    return raw
+
+
+def _check_range(data: List[float], raw: array) -> None:
+    """Raise if some finite value in *data* became inf in *raw*."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        inf = math.inf
+        if inf in raw or -inf in raw:
+            for src, dst in zip(data, raw):
+                if math.isinf(dst) and math.isfinite(src):
+                    raise OverflowError(_OVERFLOW_MSG)
+        return
+
+    packed = np.frombuffer(raw, dtype=np.float32)
+    overflow = np.isinf(packed)
+    if overflow.any():
+        src = np.asarray(data, dtype=np.float64)[overflow]
+        if np.isfinite(src).any():
+            raise OverflowError(_OVERFLOW_MSG)
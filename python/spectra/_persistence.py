@@ -106,6 +106,6 @@ def restore_session(session, path: str) -> List[int]:
                 resp = session._request(P.REQ_ADD_SERIES, payload)
                 _, series_index = codec.decode_resp_series_added(resp["payload"])
                 series = Series(session, fig.id, series_index, series_type, label)
-                ax._series_list.append(series)
+                ax._series_by_index[series_index] = series
 
     return new_figure_ids
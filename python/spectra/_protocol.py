@@ -161,5 +161,11 @@ TAG_CHUNK_INDEX = 0xB3
 TAG_CHUNK_COUNT = 0xB4
 TAG_TOTAL_COUNT = 0xB5
 
+# TAG_DTYPE values (mirror SetDataPayload::dtype in message.hpp). The daemon
+# decodes the field but currently always reads the data as float32, so
+# clients must not send narrower encodings such as float16/bfloat16.
+DTYPE_FLOAT32 = 0
+DTYPE_FLOAT64 = 1
+
 # Chunked transfer threshold (128 MiB of raw float data)
 CHUNK_SIZE = 128 * 1024 * 1024
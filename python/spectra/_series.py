@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+import struct
+from array import array
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from . import _protocol as P
 from . import _codec as codec
@@ -10,6 +12,12 @@ from . import _codec as codec
 if TYPE_CHECKING:
     from ._session import Session
 
+_POINT_XY = struct.Struct("<ff")
+
+# Ring-buffer mode lets the backend copy run max_points // 8 points over
+# before the newest max_points are resent, amortising each resend.
+_RING_SLACK_DIVISOR = 8
+
 
 def _to_float_list(data: Union[List[float], "object"]) -> List[float]:
     """Convert data to a list of floats. Supports lists and numpy arrays."""
@@ -27,6 +35,38 @@ def _to_float_list(data: Union[List[float], "object"]) -> List[float]:
     return [float(v) for v in data]
 
 
+def _as_float_array(data: "object") -> "object":
+    """Return an ndarray view of *data*, or None if it is not array-like.
+
+    Accepts numpy arrays as-is and wraps other float buffer-protocol
+    objects (``array.array('d')``, ``memoryview``, ...) without copying,
+    so they take the packed numpy path instead of per-element boxing.
+    Device arrays exposing ``__cuda_array_interface__`` are downloaded
+    with a single bulk host copy: ``.get()`` for CuPy, ``.copy_to_host()``
+    for Numba.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    if isinstance(data, np.ndarray):
+        return data
+    if hasattr(data, "__cuda_array_interface__"):
+        if hasattr(data, "get"):
+            return np.asarray(data.get())
+        if hasattr(data, "copy_to_host"):
+            return np.asarray(data.copy_to_host())
+    if isinstance(data, (list, tuple, str, bytes, bytearray)):
+        return None
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if view.format.lstrip("@=<") not in ("f", "d"):
+        return None
+    return np.asarray(view)
+
+
 def _interleave_xy(
     x: Union[List[float], "object"],
     y: Union[List[float], "object"],
@@ -47,23 +87,53 @@ def _try_interleave_numpy(
     x: Union[List[float], "object"],
     y: Union[List[float], "object"],
 ) -> tuple:
-    """Try to interleave using numpy for zero-copy. Returns (raw_bytes, count) or None."""
-    try:
-        import numpy as np
+    """Try to interleave using numpy for zero-copy. Returns (raw_bytes, count) or None.
 
-        if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
-            xf = np.ascontiguousarray(x, dtype=np.float32)
-            yf = np.ascontiguousarray(y, dtype=np.float32)
-            if xf.shape != yf.shape:
-                return None
-            # Interleave: stack columns then flatten
-            interleaved = np.column_stack((xf, yf)).astype(np.float32)
-            raw = interleaved.tobytes()
-            count = interleaved.size  # total float count
-            return raw, count
-    except ImportError:
-        pass
-    return None
+    ``raw_bytes`` is a byte memoryview over the interleaved float32 block,
+    so encoders copy straight out of it without an intermediate ``bytes``.
+    """
+    xa = _as_float_array(x)
+    ya = _as_float_array(y)
+    if xa is None or ya is None or xa.shape != ya.shape:
+        return None
+    import numpy as np
+
+    # Interleave with a single float32 conversion into a preallocated block
+    interleaved = np.empty((xa.size, 2), dtype=np.float32)
+    interleaved[:, 0] = xa.ravel()
+    interleaved[:, 1] = ya.ravel()
+    # Cast through a 1-D reshape: memoryview refuses to cast a (0, N) shape
+    return memoryview(interleaved.reshape(-1)).cast("B"), interleaved.size
+
+
+def _try_interleave_numpy_xyz(
+    x: Union[List[float], "object"],
+    y: Union[List[float], "object"],
+    z: Union[List[float], "object"],
+) -> tuple:
+    """Try to interleave x/y/z using numpy. Returns (raw_bytes, count) or None.
+
+    ``raw_bytes`` is a byte memoryview, as in :func:`_try_interleave_numpy`.
+
+    Inputs of any shape (e.g. meshgrid output) are flattened; like the list
+    path, the result is truncated to the shortest of the three arrays.
+    """
+    xa = _as_float_array(x)
+    ya = _as_float_array(y)
+    za = _as_float_array(z)
+    if xa is None or ya is None or za is None:
+        return None
+    import numpy as np
+
+    xf = np.ravel(xa)
+    yf = np.ravel(ya)
+    zf = np.ravel(za)
+    n = min(xf.size, yf.size, zf.size)
+    interleaved = np.empty((n, 3), dtype=np.float32)
+    interleaved[:, 0] = xf[:n]
+    interleaved[:, 1] = yf[:n]
+    interleaved[:, 2] = zf[:n]
+    return memoryview(interleaved.reshape(-1)).cast("B"), interleaved.size
 
 
 class Series:
@@ -72,7 +142,15 @@ class Series:
     All mutations are sent to the backend via IPC.
     """
 
-    __slots__ = ("_session", "_figure_id", "_index", "_type", "_label")
+    __slots__ = (
+        "_session",
+        "_figure_id",
+        "_index",
+        "_type",
+        "_label",
+        "_max_points",
+        "_window",
+    )
 
     def __init__(
         self,
@@ -81,12 +159,17 @@ class Series:
         series_index: int,
         series_type: str,
         label: str = "",
+        max_points: Optional[int] = None,
     ) -> None:
         self._session = session
         self._figure_id = figure_id
         self._index = series_index
         self._type = series_type
         self._label = label
+        self._max_points = max_points
+        # Interleaved float32 mirror of the backend data, kept only in
+        # ring-buffer mode so the tail can be resent once it overflows.
+        self._window: Optional[array] = array("f") if max_points is not None else None
 
     @property
     def index(self) -> int:
@@ -104,6 +187,33 @@ class Series:
     def label(self) -> str:
         return self._label
 
+    @property
+    def max_points(self) -> Optional[int]:
+        """Ring-buffer capacity in points, or None for unbounded growth."""
+        return self._max_points
+
+    def _track(self, raw_bytes: bytes, replace: bool) -> Optional[bytes]:
+        """Mirror *raw_bytes* into the ring window.
+
+        Returns the trimmed window to resend with REQ_SET_DATA when the
+        backend copy should be replaced, or None to send *raw_bytes* as-is.
+        The backend never trims on append, so the window may grow
+        ``max_points // 8`` points past ``max_points`` before the newest
+        ``max_points`` are resent: the backend never holds more than
+        ``max_points + max_points // 8`` points, and each resend is
+        amortised over the appends that filled the slack.
+        """
+        window = self._window
+        limit = self._max_points * 2  # floats per full window
+        slack = (self._max_points // _RING_SLACK_DIVISOR) * 2
+        if replace:
+            del window[:]
+        window.frombytes(raw_bytes)
+        if replace or len(window) > limit + slack:
+            del window[: max(0, len(window) - limit)]
+            return window.tobytes()
+        return None
+
     def set_data(
         self,
         x: Union[List[float], "object"],
@@ -114,7 +224,13 @@ class Series:
         For arrays exceeding CHUNK_SIZE (~128 MiB), data is automatically
         split into multiple chunked REQ_SET_DATA messages. The backend
         reassembles chunks before applying to the figure model.
+
+        In ring-buffer mode (``max_points`` set) only the newest
+        ``max_points`` points are sent.
         """
+        if self._window is not None:
+            self._set_window(x, y)
+            return
         # Try numpy fast path
         np_result = _try_interleave_numpy(x, y)
         if np_result is not None:
@@ -139,17 +255,39 @@ class Series:
 
         self._session._request(P.REQ_SET_DATA, payload)
 
+    def _set_window(
+        self,
+        x: Union[List[float], "object"],
+        y: Union[List[float], "object"],
+    ) -> None:
+        np_result = _try_interleave_numpy(x, y)
+        if np_result is not None:
+            raw_bytes = np_result[0]
+        else:
+            raw_bytes = array("f", _interleave_xy(x, y)).tobytes()
+        self._send_window(self._track(raw_bytes, replace=True))
+
+    def _send_window(self, raw_bytes: bytes) -> None:
+        payload = codec.encode_req_set_data_raw(
+            figure_id=self._figure_id,
+            series_index=self._index,
+            raw_bytes=raw_bytes,
+            count=len(raw_bytes) // 4,
+        )
+        self._session._request(P.REQ_SET_DATA, payload)
+
     def _send_chunked(self, raw_bytes: bytes, total_count: int) -> None:
         """Send data in multiple chunks for arrays exceeding CHUNK_SIZE."""
         import math
 
         chunk_size = P.CHUNK_SIZE
         num_chunks = math.ceil(len(raw_bytes) / chunk_size)
+        view = memoryview(raw_bytes)
 
         for i in range(num_chunks):
             start = i * chunk_size
             end = min(start + chunk_size, len(raw_bytes))
-            chunk_bytes = raw_bytes[start:end]
+            chunk_bytes = view[start:end]
             # Each float is 4 bytes
             chunk_float_count = len(chunk_bytes) // 4
 
@@ -169,11 +307,24 @@ class Series:
         x: Union[List[float], "object"],
         y: Union[List[float], "object"],
     ) -> None:
-        """Append x/y data points to this series (streaming)."""
+        """Append x/y data points to this series (streaming).
+
+        In ring-buffer mode the oldest points are discarded once the
+        series holds more than ``max_points + max_points // 8``; the
+        newest ``max_points`` are kept.
+        """
         # Try numpy fast path
         np_result = _try_interleave_numpy(x, y)
+        if np_result is None and self._window is not None:
+            raw = array("f", _interleave_xy(x, y)).tobytes()
+            np_result = (raw, len(raw) // 4)
         if np_result is not None:
             raw_bytes, count = np_result
+            if self._window is not None:
+                trimmed = self._track(raw_bytes, replace=False)
+                if trimmed is not None:
+                    self._send_window(trimmed)
+                    return
             payload = codec.encode_req_append_data_raw(
                 figure_id=self._figure_id,
                 series_index=self._index,
@@ -190,6 +341,27 @@ class Series:
 
         self._session._request(P.REQ_APPEND_DATA, payload)
 
+    def append_point(self, x: float, y: float) -> None:
+        """Append a single (x, y) point (streaming fast path).
+
+        Packs the point straight into the raw float32 blob, skipping the
+        per-call list and array conversions of :meth:`append`. Ring-buffer
+        trimming works as in :meth:`append`.
+        """
+        raw_bytes = _POINT_XY.pack(x, y)
+        if self._window is not None:
+            trimmed = self._track(raw_bytes, replace=False)
+            if trimmed is not None:
+                self._send_window(trimmed)
+                return
+        payload = codec.encode_req_append_data_raw(
+            figure_id=self._figure_id,
+            series_index=self._index,
+            raw_bytes=raw_bytes,
+            count=2,
+        )
+        self._session._request(P.REQ_APPEND_DATA, payload)
+
     def set_data_xyz(
         self,
         x: Union[List[float], "object"],
@@ -197,6 +369,22 @@ class Series:
         z: Union[List[float], "object"],
     ) -> None:
         """Set XYZ data for 3D series. Sends as interleaved [x0,y0,z0, x1,y1,z1, ...]."""
+        # Try numpy fast path
+        np_result = _try_interleave_numpy_xyz(x, y, z)
+        if np_result is not None:
+            raw_bytes, count = np_result
+            if len(raw_bytes) > P.CHUNK_SIZE:
+                self._send_chunked(raw_bytes, count)
+                return
+            payload = codec.encode_req_set_data_raw(
+                figure_id=self._figure_id,
+                series_index=self._index,
+                raw_bytes=raw_bytes,
+                count=count,
+            )
+            self._session._request(P.REQ_SET_DATA, payload)
+            return
+
         xf = _to_float_list(x)
         yf = _to_float_list(y)
         zf = _to_float_list(z)
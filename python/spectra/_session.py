@@ -1,7 +1,7 @@
 """Session class — manages a single connection to the spectra-backend."""
 
 import threading
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Optional, List, TYPE_CHECKING
 
 from . import _protocol as P
 from . import _codec as codec
@@ -16,8 +16,26 @@ from ._blob import BlobStore
 from ._log import log
 
 if TYPE_CHECKING:
+    from ._animation import BackendAnimator
     from ._figure import Figure
 
+# Requests whose response is only an acknowledgement. Inside a batch these
+# are queued and written together instead of waiting on each round-trip.
+_PIPELINED_REQUESTS = frozenset((
+    P.REQ_SET_DATA,
+    P.REQ_APPEND_DATA,
+    P.REQ_UPDATE_PROPERTY,
+    P.REQ_UPDATE_BATCH,
+    P.REQ_REMOVE_SERIES,
+))
+
+# Property updates queued by _queue_property_update() are sent as a single
+# REQ_UPDATE_BATCH once this many accumulate, on the next other request, or
+# by the session's flusher thread _AUTOFLUSH_DELAY seconds after the first
+# one was queued, whichever comes first.
+_AUTOFLUSH_MAX_UPDATES = 64
+_AUTOFLUSH_DELAY = 0.001
+
 
 class Session:
     """A connection to the spectra-backend daemon.
@@ -45,10 +63,16 @@ class Session:
         self._next_request_id: int = 0
         self._lock = threading.Lock()
         self._figures: List["Figure"] = []
-        self._animators: List = []  # BackendAnimator instances
+        self._animators: Dict[int, "BackendAnimator"] = {}  # figure_id -> BackendAnimator
         self._blob_store = BlobStore()
         self._closed = False
         self._live_thread_count = 0  # number of active live threads using the socket
+        self._batch_local = threading.local()  # per-thread queue for batch()
+        self._pending_property_updates: List[dict] = []
+        self._pending_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()  # set while updates wait
+        self._flusher: Optional[threading.Thread] = None
+        self._flush_error: Optional[Exception] = None  # from the flusher
 
         # Connect with retry. When auto_launch is on, re-invoke
         # ensure_backend() on each retry so that a dying backend whose
@@ -122,10 +146,11 @@ class Session:
         self._next_request_id += 1
         return self._next_request_id
 
-    def _request(self, msg_type: int, payload: bytes = b"") -> dict:
+    def _request(self, msg_type: int, payload: bytes = b"") -> Optional[dict]:
         """Send a request and wait for the matching response.
 
-        Returns the response message dict.
+        Returns the response message dict, or None when the request was
+        queued by an open batch() on this thread.
         Raises BackendError if RESP_ERR is received.
 
         Thread-safe: holds the lock for the entire send+recv cycle so that
@@ -134,8 +159,28 @@ class Session:
         """
         if self._transport is None or not self._transport.is_open:
             raise ConnectionError("Not connected to backend")
+        self._raise_flush_error()
+
+        queued = getattr(self._batch_local, "queue", None)
+        if queued is not None:
+            if msg_type in _PIPELINED_REQUESTS:
+                queued.append((msg_type, payload))
+                return None
+            # Keep ordering: anything needing a real response flushes first.
+            self._flush_batch(queued)
 
         with self._lock:
+            deferred = self._take_deferred()
+            if deferred:
+                if msg_type in _PIPELINED_REQUESTS:
+                    # Deferred updates ride along in the same write.
+                    deferred.append((msg_type, payload))
+                    return self._exchange_locked(deferred)
+                # A request with a real response must not fail (or
+                # half-succeed) because of an earlier queued update, so
+                # the queue goes out as its own exchange first.
+                self._exchange_locked(deferred)
+
             req_id = self._next_req_id_unlocked()
             log.debug("_request send type=0x%04X req_id=%d", msg_type, req_id)
             self._transport.send(
@@ -175,17 +220,235 @@ class Session:
                 # Otherwise it's an event or unrelated message — store for later
                 self._handle_event(msg)
 
+    def _flush_batch(self, queued: list) -> None:
+        """Write all queued requests at once, then wait for every ack."""
+        if not queued and not self._has_deferred():
+            return
+        if self._transport is None or not self._transport.is_open:
+            queued.clear()
+            self._forget_sent_texts()
+            raise ConnectionError("Not connected to backend")
+
+        with self._lock:
+            messages = self._take_deferred()
+            messages.extend(queued)
+            queued.clear()
+            if messages:
+                self._exchange_locked(messages)
+
+    def _exchange_locked(self, queued: list) -> Optional[dict]:
+        """Write *queued* requests in one go and collect every response.
+
+        Returns the response to the last request. Caller must hold
+        self._lock. If the backend rejects one of them, every remaining
+        acknowledgement is still read before the first error is raised,
+        naming the request type that failed, so no stale reply is left on
+        the socket.
+        """
+        messages = [
+            (msg_type, payload, self._next_req_id_unlocked())
+            for msg_type, payload in queued
+        ]
+        try:
+            self._transport.send_many(messages, session_id=self._session_id)
+
+            types = {req_id: msg_type for msg_type, _, req_id in messages}
+            last_id = messages[-1][2]
+            last: Optional[dict] = None
+            error: Optional[BackendError] = None
+            pending = set(types)
+            while pending:
+                msg = self._transport.recv()
+                if msg is None:
+                    raise ConnectionError("Backend closed connection")
+
+                hdr = msg["header"]
+                if hdr["type"] == P.RESP_ERR:
+                    rid, code, message = codec.decode_resp_err(msg["payload"])
+                    if rid == 0:
+                        # Cannot tell which request failed; stop waiting
+                        log.error("backend error code=%d msg=%s", code, message)
+                        raise BackendError(code, message)
+                    if rid in pending:
+                        pending.discard(rid)
+                        log.error("backend error code=%d msg=%s (request 0x%04X)",
+                                  code, message, types[rid])
+                        if error is None:
+                            error = BackendError(
+                                code, f"{message} (request 0x{types[rid]:04X})"
+                            )
+                        continue
+
+                rid = hdr["request_id"]
+                if rid not in pending and hdr["type"] == P.RESP_OK:
+                    rid = codec.decode_resp_ok(msg["payload"])
+                if rid in pending:
+                    pending.discard(rid)
+                    if rid == last_id:
+                        last = msg
+                    continue
+
+                self._handle_event(msg)
+            if error is not None:
+                raise error
+        except BaseException:
+            # Queued label/title updates may not have been applied
+            self._forget_sent_texts()
+            raise
+        return last
+
+    def batch(self) -> "_SessionBatchContext":
+        """Pipeline data and property updates into a single socket write.
+
+        Inside the block, acknowledge-only requests (set_data, append,
+        property setters, series removal) issued from the current thread are queued and
+        sent together on exit; their acknowledgements are then collected
+        in one pass. Requests that need a response, such as adding a
+        series, flush the queue first so ordering is preserved.
+
+        A batch may also span a whole FramePacer loop: ``pacer.pace()``
+        flushes the queue before waiting, so each frame is one write.
+
+        Usage::
+
+            with session.batch():
+                line1.set_data(x, y1)
+                line2.set_data(x, y2)
+                ax.set_xlim(x[0], x[-1])
+        """
+        return _SessionBatchContext(self)
+
+    def _queue_property_update(self, update: dict) -> None:
+        """Defer a property update so consecutive setters share one message.
+
+        *update* uses the keys of ``batch_update``. Queued updates are sent
+        as a single REQ_UPDATE_BATCH in the same write as the next
+        acknowledge-only request (or in a write of its own just before a
+        request that needs a response, so its errors surface there), once
+        ``_AUTOFLUSH_MAX_UPDATES`` accumulate, or by the session's flusher
+        thread shortly after the first one was queued, so a burst like
+        set_xlim + set_ylim + set_title costs one round-trip instead of one
+        each. An error from the flusher is raised by the next sync() or
+        request. Inside an open batch() the update joins that batch's queue
+        instead.
+        """
+        self._queue_property_updates([update])
+
+    def _queue_property_updates(self, updates: list) -> None:
+        """Queue several property updates; see _queue_property_update()."""
+        if getattr(self._batch_local, "queue", None) is not None:
+            self._request(P.REQ_UPDATE_BATCH, codec.encode_req_update_batch(updates))
+            return
+        with self._pending_lock:
+            pending = self._pending_property_updates
+            pending.extend(updates)
+            full = len(pending) >= _AUTOFLUSH_MAX_UPDATES
+            if not full:
+                self._schedule_autoflush_unlocked()
+        if full:
+            self._flush_deferred()
+
+    def _schedule_autoflush_unlocked(self) -> None:
+        """Wake the flusher thread, starting it on first use. Caller must
+        hold self._pending_lock."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flusher_loop, daemon=True, name="spectra-flush"
+            )
+            self._flusher.start()
+        self._flush_wakeup.set()
+
+    def _has_deferred(self) -> bool:
+        return bool(self._pending_property_updates)
+
+    def _take_deferred(self) -> list:
+        """Pop queued property updates as a one-message REQ_UPDATE_BATCH
+        list. Caller must hold self._lock so a concurrent flush cannot
+        reorder them against other writes."""
+        if not self._has_deferred():
+            return []
+        with self._pending_lock:
+            updates = self._pending_property_updates
+            self._pending_property_updates = []
+            self._flush_wakeup.clear()
+        if not updates:
+            return []
+        return [(P.REQ_UPDATE_BATCH, codec.encode_req_update_batch(updates))]
+
+    def _flush_deferred(self) -> None:
+        """Send queued property updates now."""
+        if not self._has_deferred():
+            return
+        if self._transport is None or not self._transport.is_open:
+            raise ConnectionError("Not connected to backend")
+        with self._lock:
+            queued = self._take_deferred()
+            if queued:
+                self._exchange_locked(queued)
+
+    def _flusher_loop(self) -> None:
+        """Flush queued property updates off-thread, one long-lived thread
+        per session.
+
+        A failure is kept and re-raised by the next sync() or request, so a
+        rejected setter is not silently lost.
+        """
+        import time
+
+        wakeup = self._flush_wakeup
+        while not self._closed:
+            wakeup.wait()
+            if self._closed:
+                break
+            # Let the rest of the setter burst join this flush
+            time.sleep(_AUTOFLUSH_DELAY)
+            try:
+                self._flush_deferred()
+            except Exception as exc:
+                log.warning("deferred update failed: %s", exc)
+                if self._flush_error is None:
+                    self._flush_error = exc
+
+    def _raise_flush_error(self) -> None:
+        """Re-raise (once) an error hit by the flusher thread."""
+        exc = self._flush_error
+        if exc is not None:
+            self._flush_error = None
+            raise exc
+
+    def _forget_sent_texts(self) -> None:
+        """Clear every axes' record of sent labels and titles.
+
+        Called when queued updates may not have reached the backend (a
+        failed write or a reconnect), so the next setter resends its text
+        instead of being suppressed as a repeat.
+        """
+        for fig in self._figures:
+            for ax in fig._axes_list:
+                ax._texts.clear()
+
+    def _flush_pending(self) -> None:
+        """Send deferred updates and anything queued by an open batch()
+        on the current thread."""
+        queued = getattr(self._batch_local, "queue", None)
+        if queued:
+            self._flush_batch(queued)
+        else:
+            self._flush_deferred()
+
     def _register_animator(self, animator) -> None:
-        """Register a BackendAnimator for ANIM_TICK dispatch."""
-        if animator not in self._animators:
-            self._animators.append(animator)
+        """Register a BackendAnimator for ANIM_TICK dispatch.
+
+        Animators are keyed by figure id so each tick is routed with a single
+        dict lookup; the first animator registered for a figure receives its
+        ticks.
+        """
+        self._animators.setdefault(animator._figure_id, animator)
 
     def _unregister_animator(self, animator) -> None:
         """Unregister a BackendAnimator."""
-        try:
-            self._animators.remove(animator)
-        except ValueError:
-            pass
+        if self._animators.get(animator._figure_id) is animator:
+            del self._animators[animator._figure_id]
 
     def _handle_event(self, msg: dict) -> None:
         """Handle asynchronous events from the backend."""
@@ -201,10 +464,9 @@ class Session:
                     break
         elif hdr["type"] == P.ANIM_TICK:
             tick = codec.decode_anim_tick(msg["payload"])
-            for anim in self._animators:
-                if anim._figure_id == tick["figure_id"]:
-                    anim.handle_tick(tick["t"], tick["dt"], tick["frame_num"])
-                    break
+            anim = self._animators.get(tick["figure_id"])
+            if anim is not None:
+                anim.handle_tick(tick["t"], tick["dt"], tick["frame_num"])
         elif hdr["type"] == P.BLOB_RELEASE:
             blob_name = codec.decode_blob_release(msg["payload"])
             if blob_name:
@@ -266,6 +528,7 @@ class Session:
                             figure_ids.append(inner.as_u64())
                             break
 
+        self._forget_sent_texts()
         self._closed = False
         return {"session_id": self._session_id, "figure_ids": figure_ids}
 
@@ -274,11 +537,25 @@ class Session:
 
         Each item in `updates` is a dict with keys:
             figure_id, axes_index, series_index, prop, f1..f4, bool_val, str_val
+
+        The call does not wait for the acknowledgement: the updates are
+        coalesced with other pending property updates and written together
+        with the next request (or within a millisecond). Use sync() to
+        block until they have been applied. A backend error for them is
+        raised by whichever call flushes them or, when the background
+        flusher sent them, by the next sync() or request.
         """
         if not updates:
             return
-        payload = codec.encode_req_update_batch(updates)
-        self._request(P.REQ_UPDATE_BATCH, payload)
+        self._queue_property_updates(list(updates))
+
+    def sync(self) -> None:
+        """Block until every deferred or batched update has been acknowledged.
+
+        Also raises an error from an earlier background flush.
+        """
+        self._raise_flush_error()
+        self._flush_pending()
 
     def list_figures(self) -> List[int]:
         """Query the backend for all figure IDs in this session."""
@@ -307,12 +584,13 @@ class Session:
         if self._transport is None or not self._transport.is_open:
             return
 
+        self._flush_pending()
+
         # Show all figures that haven't been shown yet
         for fig in self._figures:
             if not fig._visible and not fig._shown_once:
                 fig.show()
 
-        import select
         import time
 
         log.debug("show() blocking, live_threads=%d, figures=%d",
@@ -330,12 +608,7 @@ class Session:
                 continue
 
             # No live threads — do our own event drain.
-            try:
-                ready, _, _ = select.select([self._transport.fileno()], [], [], 0.1)
-            except (ValueError, OSError):
-                break
-
-            if ready:
+            if self._transport.wait_readable(0.1):
                 with self._lock:
                     msg = self._transport.recv()
                 if msg is None:
@@ -355,8 +628,15 @@ class Session:
             return
         self._closed = True
 
+        # Deliver updates still waiting on the flusher, then let it exit
+        try:
+            self._flush_deferred()
+        except Exception:
+            pass
+        self._flush_wakeup.set()
+
         # Stop all animators
-        for anim in list(self._animators):
+        for anim in list(self._animators.values()):
             anim._running = False
         self._animators.clear()
 
@@ -385,3 +665,29 @@ class Session:
             self.close()
         except Exception:
             pass
+
+
+class _SessionBatchContext:
+    """Queues acknowledge-only requests and flushes them as one write."""
+
+    __slots__ = ("_session", "_outer")
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._outer = False
+
+    def __enter__(self) -> "_SessionBatchContext":
+        local = self._session._batch_local
+        # Nested batches share the outermost queue.
+        if getattr(local, "queue", None) is None:
+            local.queue = []
+            self._outer = True
+        return self
+
+    def __exit__(self, *args) -> None:
+        if not self._outer:
+            return
+        local = self._session._batch_local
+        queued = local.queue
+        local.queue = None
+        self._session._flush_batch(queued)
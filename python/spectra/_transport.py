@@ -1,6 +1,8 @@
 """Socket I/O + message framing for the Spectra IPC protocol."""
 
+import errno
 import select
+import selectors
 import socket
 from typing import Optional
 
@@ -9,15 +11,24 @@ from . import _codec as codec
 from ._errors import ConnectionError, ProtocolError
 from ._log import log
 
+# Bytes requested per recv() call. Frames that arrive back to back (e.g. the
+# acks for a pipelined batch) are read with one syscall and split in memory.
+_RECV_CHUNK = 64 * 1024
+
+# Buffers passed to a single sendmsg() call (Linux IOV_MAX is 1024).
+_IOV_MAX = 512
+
 
 class Transport:
     """Wraps a Unix domain socket connection with framed message send/recv."""
 
-    __slots__ = ("_sock", "_seq")
+    __slots__ = ("_sock", "_seq", "_selector", "_rbuf")
 
     def __init__(self, sock: socket.socket) -> None:
         self._sock = sock
         self._seq = 0
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._rbuf = bytearray()  # received bytes not yet returned by recv()
 
     @staticmethod
     def connect(path: str, timeout: float = 5.0) -> "Transport":
@@ -40,6 +51,9 @@ class Transport:
             raise ConnectionError(f"Failed to connect to {path}: {e}") from e
 
     def close(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
         if self._sock is not None:
             try:
                 log.debug("transport closing socket fd=%s", self._sock.fileno())
@@ -60,6 +74,8 @@ class Transport:
         """
         if self._sock is None:
             return False
+        if self._rbuf:
+            return True
         try:
             ready, _, _ = select.select([self._sock], [], [], 0)
             if not ready:
@@ -69,6 +85,32 @@ class Transport:
         except OSError:
             return False
 
+    def wait_readable(self, timeout: float) -> bool:
+        """Block up to `timeout` seconds until the socket has data to read.
+
+        The socket is registered with an OS selector (epoll/kqueue) once and
+        reused, so each wait is a single syscall that returns as soon as data
+        arrives. Returns False on timeout or if the socket is closed, and
+        True without waiting when bytes are already buffered.
+        """
+        if self._sock is None:
+            return False
+        if self._rbuf:
+            return True
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._sock, selectors.EVENT_READ)
+        # EINTR is retried inside select() (PEP 475); only a closed or
+        # invalid descriptor ends the wait early.
+        try:
+            return bool(self._selector.select(max(timeout, 0.0)))
+        except ValueError:
+            return False
+        except OSError as e:
+            if e.errno == errno.EBADF:
+                return False
+            raise
+
     def fileno(self) -> int:
         if self._sock is None:
             return -1
@@ -98,9 +140,8 @@ class Transport:
             window_id=window_id,
         )
 
-        data = header + payload
         try:
-            self._sendall(data)
+            self._sendall_parts((header, payload) if payload else (header,))
             log.debug(
                 "transport send type=0x%04X seq=%d req_id=%d session=%d window=%d payload=%d",
                 msg_type,
@@ -116,6 +157,41 @@ class Transport:
 
         return seq
 
+    def send_many(self, messages: list, session_id: int = 0) -> None:
+        """Send several framed messages with a single write.
+
+        Each item in `messages` is a (msg_type, payload, request_id) tuple.
+        """
+        if self._sock is None:
+            raise ConnectionError("Not connected")
+
+        # All headers share one buffer; each is sent as a slice of it
+        headers = bytearray(P.HEADER_SIZE * len(messages))
+        hview = memoryview(headers)
+        parts = []
+        offset = 0
+        for msg_type, payload, request_id in messages:
+            self._seq += 1
+            codec.encode_header_into(
+                headers,
+                offset,
+                msg_type=msg_type,
+                payload_len=len(payload),
+                seq=self._seq,
+                request_id=request_id,
+                session_id=session_id,
+            )
+            parts.append(hview[offset:offset + P.HEADER_SIZE])
+            offset += P.HEADER_SIZE
+            if payload:
+                parts.append(payload)
+        try:
+            self._sendall_parts(parts)
+            log.debug("transport send_many count=%d parts=%d", len(messages), len(parts))
+        except OSError as e:
+            self.close()
+            raise ConnectionError(f"Send failed: {e}") from e
+
     def recv(self) -> Optional[dict]:
         """Receive a framed message. Returns dict with 'header' and 'payload' keys.
 
@@ -126,11 +202,10 @@ class Transport:
             raise ConnectionError("Not connected")
 
         # Read header
-        header_bytes = self._recvall(P.HEADER_SIZE)
-        if header_bytes is None:
+        if not self._fill(P.HEADER_SIZE):
             return None  # clean close
-
-        hdr = codec.decode_header(header_bytes)
+        rbuf = self._rbuf
+        hdr = codec.decode_header(rbuf)
         if hdr is None:
             raise ProtocolError("Invalid message header (bad magic)")
 
@@ -139,12 +214,15 @@ class Transport:
             raise ProtocolError(f"Payload too large: {payload_len}")
 
         # Read payload
+        end = P.HEADER_SIZE + payload_len
         if payload_len > 0:
-            payload = self._recvall(payload_len)
-            if payload is None:
+            if not self._fill(end):
                 raise ConnectionError("Connection closed during payload read")
+            with memoryview(rbuf) as view:
+                payload = bytes(view[P.HEADER_SIZE:end])
         else:
             payload = b""
+        del rbuf[:end]
 
         log.debug(
             "transport recv type=0x%04X seq=%d req_id=%d session=%d window=%d payload=%d",
@@ -169,17 +247,44 @@ class Transport:
                 raise ConnectionError("Connection closed during send")
             sent += n
 
-    def _recvall(self, nbytes: int) -> Optional[bytes]:
-        """Receive exactly nbytes. Returns None on clean close."""
-        buf = bytearray()
-        while len(buf) < nbytes:
+    def _sendall_parts(self, parts) -> None:
+        """Send a sequence of buffers as gathered writes.
+
+        Payloads are handed to the kernel in place (sendmsg iovecs) instead
+        of first being concatenated into one buffer, which for large data
+        frames saved a full userspace copy.
+        """
+        sendmsg = getattr(self._sock, "sendmsg", None)
+        if sendmsg is None or len(parts) == 1:
+            self._sendall(parts[0] if len(parts) == 1 else b"".join(parts))
+            return
+        views = [memoryview(p).cast("B") for p in parts]
+        while views:
+            batch = views[:_IOV_MAX]
+            n = sendmsg(batch)
+            if n == 0:
+                raise ConnectionError("Connection closed during send")
+            # Drop fully written buffers; trim a partially written one
+            i = 0
+            while i < len(batch) and n >= batch[i].nbytes:
+                n -= batch[i].nbytes
+                i += 1
+            del views[:i]
+            if n:
+                views[0] = views[0][n:]
+
+    def _fill(self, nbytes: int) -> bool:
+        """Buffer at least nbytes. Returns False on clean close before any
+        byte of the message arrived."""
+        rbuf = self._rbuf
+        while len(rbuf) < nbytes:
             try:
-                chunk = self._sock.recv(nbytes - len(buf))
+                chunk = self._sock.recv(max(_RECV_CHUNK, nbytes - len(rbuf)))
             except OSError as e:
                 raise ConnectionError(f"Recv failed: {e}") from e
             if not chunk:
-                if len(buf) == 0:
-                    return None  # clean close
+                if len(rbuf) == 0:
+                    return False  # clean close
                 raise ConnectionError("Connection closed mid-message")
-            buf.extend(chunk)
-        return bytes(buf)
+            rbuf += chunk
+        return True
@@ -195,6 +195,7 @@ if QT_VERSION >= 6:
 
     # QImage formats
     QImage.Format_RGBA8888 = QImage.Format.Format_RGBA8888
+    QImage.Format_RGBX8888 = QImage.Format.Format_RGBX8888
     QImage.Format_ARGB32 = QImage.Format.Format_ARGB32
 
     # QSizePolicy
@@ -206,6 +207,9 @@ if QT_VERSION >= 6:
     Qt.WA_OpaquePaintEvent = Qt.WidgetAttribute.WA_OpaquePaintEvent
     Qt.WA_NoSystemBackground = Qt.WidgetAttribute.WA_NoSystemBackground
 
+    # Timer types
+    Qt.PreciseTimer = Qt.TimerType.PreciseTimer
+
 
 # ─── Compatibility helpers ───────────────────────────────────────────────────
 
@@ -69,25 +69,24 @@ from .._embed import (
     MOD_SHIFT,
     MOD_CONTROL,
     MOD_ALT,
-    KEY_R,
     KEY_G,
     KEY_A,
-    KEY_S,
     KEY_ESCAPE,
 )
 
 
 # ─── Key mapping ─────────────────────────────────────────────────────────────
 
+_BUTTON_MAP = {
+    Qt.LeftButton: MOUSE_LEFT,
+    Qt.RightButton: MOUSE_RIGHT,
+    Qt.MiddleButton: MOUSE_MIDDLE,
+}
+
+
 def _qt_button(btn) -> int:
     """Convert Qt mouse button to Spectra constant."""
-    if btn == Qt.LeftButton:
-        return MOUSE_LEFT
-    if btn == Qt.RightButton:
-        return MOUSE_RIGHT
-    if btn == Qt.MiddleButton:
-        return MOUSE_MIDDLE
-    return 0
+    return _BUTTON_MAP.get(btn, 0)
 
 
 def _qt_mods(mods) -> int:
@@ -102,23 +101,16 @@ def _qt_mods(mods) -> int:
     return result
 
 
-def _qt_key(qt_key) -> int:
-    """Convert Qt key code to Spectra key constant.
+# Qt and GLFW share the same codes for A-Z (65-90) and 0-9 (48-57); build the
+# whole table once so each key event is a single dict lookup.
+_KEY_MAP = {k: k for k in range(int(Qt.Key_A), int(Qt.Key_Z) + 1)}
+_KEY_MAP.update({k: k for k in range(int(Qt.Key_0), int(Qt.Key_9) + 1)})
+_KEY_MAP[int(Qt.Key_Escape)] = KEY_ESCAPE
 
-    Qt and GLFW share the same codes for A-Z (65-90) and 0-9 (48-57).
-    """
-    if Qt.Key_A <= qt_key <= Qt.Key_Z:
-        return qt_key
-    if Qt.Key_0 <= qt_key <= Qt.Key_9:
-        return qt_key
-    _MAP = {
-        Qt.Key_Escape: KEY_ESCAPE,
-        Qt.Key_R: KEY_R,
-        Qt.Key_G: KEY_G,
-        Qt.Key_A: KEY_A,
-        Qt.Key_S: KEY_S,
-    }
-    return _MAP.get(qt_key, 0)
+
+def _qt_key(qt_key) -> int:
+    """Convert Qt key code to Spectra key constant."""
+    return _KEY_MAP.get(qt_key, 0)
 
 
 # ─── SpectraTimer (matplotlib-compatible) ────────────────────────────────────
@@ -289,6 +281,9 @@ class FigureCanvasSpectra(QWidget):
         # Input events mark _dirty but do NOT render directly (prevents stutter).
         self._fps = max(1, fps)
         self._timer = QTimer(self)
+        # Coarse timers may slip up to 5% per tick, which shows as uneven
+        # frame pacing against the display refresh.
+        self._timer.setTimerType(Qt.PreciseTimer)
         self._timer.timeout.connect(self._on_tick)
         self._last_tick = time.monotonic()
         # Always start the timer for responsive input — even without animation.
@@ -434,7 +429,14 @@ class FigureCanvasSpectra(QWidget):
             self._pixel_buf = (ctypes.c_uint8 * buf_size)()
 
         if self._surface.render_into(self._pixel_buf):
-            img = QImage(self._pixel_buf, w, h, w * 4, QImage.Format_RGBA8888)
+            # An opaque background lets Qt blit the frame as RGBX instead of
+            # alpha-blending every pixel in paintEvent.
+            fmt = (
+                QImage.Format_RGBX8888
+                if self._surface.background_alpha >= 1.0
+                else QImage.Format_RGBA8888
+            )
+            img = QImage(self._pixel_buf, w, h, w * 4, fmt)
             # Tell Qt this image is at device-pixel resolution so it
             # scales correctly on HiDPI screens.
             if self._dpr > 1.0:
@@ -28,6 +28,9 @@ Usage::
 
     # Histogram
     spe.histogram(values, bins=50, save="hist.png")
+
+    # Pre-binned histogram (e.g. from np.histogram)
+    spe.histogram_counts(edges, counts, save="hist.png")
 """
 
 from __future__ import annotations
@@ -408,6 +411,35 @@ def render_bar(
                              ylabel=ylabel, theme=theme, label=label, grid=grid)
 
 
+def histogram_counts(
+    edges,
+    counts,
+    *,
+    width: int = 800,
+    height: int = 600,
+    save: Optional[str] = None,
+    title: Optional[str] = None,
+    xlabel: Optional[str] = None,
+    ylabel: Optional[str] = None,
+    theme: Optional[str] = None,
+    label: Optional[str] = None,
+) -> Image:
+    """Render a pre-binned histogram to pixels.
+
+    Takes bin edges and counts (``len(edges) == len(counts) + 1``), such as
+    the output of ``np.histogram``, so only the bins cross into the renderer
+    instead of every sample. Bins are assumed to be evenly spaced.
+
+    Example::
+
+        counts, edges = np.histogram(samples, bins=30)
+        spe.histogram_counts(edges, counts, save="hist.png")
+    """
+    return _render_hist_counts_impl(edges, counts, width=width, height=height,
+                                    save=save, title=title, xlabel=xlabel,
+                                    ylabel=ylabel, theme=theme, label=label)
+
+
 # ─── Full-surface path (supports titles, labels, multi-series) ───────────────
 
 def _render_with_options(
@@ -511,6 +543,42 @@ def _render_histogram_impl(values, *, bins, width, height, save, title,
     return img
 
 
+def _render_hist_counts_impl(edges, counts, *, width, height, save, title,
+                             xlabel=None, ylabel=None, theme=None, label=None) -> Image:
+    """Pre-binned histogram render: one bar per bin, spanning its full width."""
+    from ._embed import EmbedSurface
+
+    nbins = len(counts)
+    if len(edges) != nbins + 1:
+        raise ValueError(
+            f"edges must have len(counts) + 1 entries ({len(edges)} vs {nbins})"
+        )
+    lo = float(edges[0])
+    bin_width = (float(edges[-1]) - lo) / nbins if nbins else 1.0
+    centers = [lo + (i + 0.5) * bin_width for i in range(nbins)]
+
+    surface = EmbedSurface(width, height, theme=theme)
+    fig = surface.figure()
+    ax = fig.subplot(1, 1, 1)
+    ax.bar(centers, counts, label=label).set_bar_width(bin_width)
+
+    if title:
+        ax.set_title(title)
+    if xlabel:
+        ax.set_xlabel(xlabel)
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    ax.auto_fit()
+
+    pixels = surface.render()
+    img = Image(pixels, surface.width, surface.height)
+
+    if save:
+        img.save(save)
+
+    return img
+
+
 def _render_bar_impl(positions, heights, *, width, height, save, title,
                       xlabel=None, ylabel=None, theme=None, label=None, grid=True) -> Image:
     """Bar chart render using native Axes.bar() series."""
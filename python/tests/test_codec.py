@@ -7,7 +7,7 @@ import os
 # Ensure the spectra package is importable
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from spectra._codec import PayloadEncoder, PayloadDecoder, encode_header, decode_header
+from spectra._codec import PayloadEncoder, PayloadDecoder, encode_header, encode_header_into, decode_header
 from spectra._codec import (
     encode_hello,
     decode_welcome,
@@ -88,6 +88,54 @@ class TestPayloadEncoder:
         # 4 (count) + 3*4 (floats) = 16
         assert blob_len == 16
 
+    def test_put_float_array_out_of_range_raises(self):
+        enc = PayloadEncoder()
+        try:
+            enc.put_float_array(0x70, [1.0, 1e40])
+        except OverflowError:
+            pass
+        else:
+            raise AssertionError("1e40 does not fit in float32")
+        try:
+            encode_req_set_data(figure_id=1, series_index=0, data=[-1e40])
+        except OverflowError:
+            pass
+        else:
+            raise AssertionError("-1e40 does not fit in float32")
+
+    def test_pack_float32_rejects_like_struct(self):
+        from spectra._floatpack import pack_float32
+        for v in (3.4028235e38, 3.40282356e38, 3.4028236e38, 1e39, -1e40,
+                  float("inf"), float("nan"), 1e-50):
+            try:
+                struct.pack("<f", v)
+                expected = None
+            except OverflowError:
+                expected = OverflowError
+            try:
+                pack_float32([0.5, v])
+                got = None
+            except OverflowError:
+                got = OverflowError
+            assert got is expected, v
+
+    def test_put_float_array_keeps_inf_and_nan(self):
+        enc = PayloadEncoder()
+        enc.put_float_array(0x70, [float("inf"), float("-inf"), float("nan")])
+        dec = PayloadDecoder(enc.take())
+        assert dec.next()
+        inf, ninf, nan = dec.as_float_array()
+        assert inf == float("inf") and ninf == float("-inf") and nan != nan
+
+    def test_take_buffer_hands_over_without_copy(self):
+        enc = PayloadEncoder()
+        enc.put_u32(0x10, 7)
+        expected = bytes(enc._buf)
+        buf = enc.take_buffer()
+        assert isinstance(buf, bytearray)
+        assert buf == expected
+        assert enc.take() == b""
+
 
 class TestPayloadDecoder:
     def test_roundtrip_u16(self):
@@ -168,6 +216,29 @@ class TestPayloadDecoder:
         dec = PayloadDecoder(b"")
         assert not dec.next()
 
+    def test_float_view(self):
+        enc = PayloadEncoder()
+        enc.put_float_array(0x70, [1.0, -2.5, 3.0])
+        enc.put_blob(0x71, b"\x05\x00")
+        dec = PayloadDecoder(enc.take())
+        assert dec.next()
+        view = dec.as_float_view()
+        assert view.format == "f" and view.tolist() == [1.0, -2.5, 3.0]
+        assert dec.as_float_array() == [1.0, -2.5, 3.0]
+        assert dec.next()
+        assert len(dec.as_float_view()) == 0
+
+    def test_blob_is_zero_copy_view(self):
+        enc = PayloadEncoder()
+        enc.put_blob(0x40, b"\x01\x02\x03")
+        enc.put_string(0x41, "xyz")
+        dec = PayloadDecoder(memoryview(enc.take()))
+        assert dec.next()
+        blob = dec.as_blob()
+        assert isinstance(blob, memoryview) and blob == b"\x01\x02\x03"
+        assert dec.as_blob_bytes() == b"\x01\x02\x03"
+        assert dec.next() and dec.as_string() == "xyz"
+
     def test_skip_unknown_tags(self):
         enc = PayloadEncoder()
         enc.put_u16(0x10, 42)
@@ -204,6 +275,13 @@ class TestHeader:
         assert decoded["session_id"] == 3
         assert decoded["window_id"] == 4
 
+    def test_encode_into_matches_encode(self):
+        out = bytearray(P.HEADER_SIZE + 8)
+        encode_header_into(out, 8, msg_type=P.HELLO, payload_len=5, seq=9, request_id=2)
+        expected = encode_header(msg_type=P.HELLO, payload_len=5, seq=9, request_id=2)
+        assert out[8:] == expected
+        assert out[:8] == bytes(8)
+
     def test_magic_bytes(self):
         hdr = encode_header(msg_type=P.HELLO, payload_len=0)
         assert hdr[0:2] == P.MAGIC
@@ -304,6 +382,19 @@ class TestPythonPayloads:
         assert req_id == 12
         assert idx == 5
 
+    def test_decode_resp_series_added_flatbuffers(self):
+        import flatbuffers
+        from spectra._codec_fb import FB_PREFIX, FBRespSerAdded
+
+        builder = flatbuffers.Builder(64)
+        FBRespSerAdded.Start(builder)
+        FBRespSerAdded.AddRequestId(builder, 21)
+        FBRespSerAdded.AddSeriesIndex(builder, 4)
+        builder.Finish(FBRespSerAdded.End(builder))
+        body = bytes(builder.Output())
+        # Prefixed payloads are read in place at offset 1
+        assert decode_resp_series_added(FB_PREFIX + body) == (21, 4)
+
     def test_decode_resp_err(self):
         enc = PayloadEncoder()
         enc.put_u64(P.TAG_REQUEST_ID, 13)
@@ -324,6 +415,28 @@ class TestPythonPayloads:
         assert req_id == 14
         assert ids == [100, 200]
 
+    def test_decode_resp_figure_list_flatbuffers(self):
+        import flatbuffers
+        from spectra._codec_fb import FB_PREFIX, FBRespFigList
+
+        builder = flatbuffers.Builder(64)
+        FBRespFigList.StartFigureIdsVector(builder, 3)
+        for fid in (7, 2 ** 40, 300):
+            builder.PrependUint64(fid)
+        ids_off = builder.EndVector()
+        FBRespFigList.Start(builder)
+        FBRespFigList.AddRequestId(builder, 15)
+        FBRespFigList.AddFigureIds(builder, ids_off)
+        builder.Finish(FBRespFigList.End(builder))
+        body = bytes(builder.Output())
+        assert decode_resp_figure_list(FB_PREFIX + body) == (15, [300, 2 ** 40, 7])
+
+        builder = flatbuffers.Builder(64)
+        FBRespFigList.Start(builder)
+        FBRespFigList.AddRequestId(builder, 16)
+        builder.Finish(FBRespFigList.End(builder))
+        assert decode_resp_figure_list(FB_PREFIX + bytes(builder.Output())) == (16, [])
+
     def test_decode_resp_ok(self):
         enc = PayloadEncoder()
         enc.put_u64(P.TAG_REQUEST_ID, 15)
@@ -4,6 +4,7 @@ These tests verify the pure-Python logic without requiring a backend connection.
 They test argument parsing, color parsing, data conversion, and API surface.
 """
 
+import math
 import pytest
 import sys
 import os
@@ -12,8 +13,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from spectra._easy import (
     _to_list,
+    _hist_steps,
+    _stem_segments,
+    _bar_segments,
+    _finite_bounds,
+    _to_flat,
     _parse_color,
     _parse_xy_args,
+    _parse_xy_flat,
     _EasyState,
 )
 
@@ -62,6 +69,30 @@ class TestToList:
             pytest.skip("numpy not installed")
 
 
+# ─── _to_flat ────────────────────────────────────────────────────────────────
+
+class TestToFlat:
+    def test_list_falls_back_to_floats(self):
+        assert _to_flat([1, 2]) == [1.0, 2.0]
+
+    def test_numpy_2d_float32_kept(self):
+        np = pytest.importorskip("numpy")
+        arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+        result = _to_flat(arr)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.shape == (6,)
+        assert np.shares_memory(result, arr)
+
+    def test_float_buffer_kept(self):
+        np = pytest.importorskip("numpy")
+        import array
+        buf = array.array("d", [1.0, 2.0, 3.0])
+        result = _to_flat(buf)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [1.0, 2.0, 3.0]
+
+
 # ─── _parse_color ─────────────────────────────────────────────────────────────
 
 class TestParseColor:
@@ -160,6 +191,21 @@ class TestParseXYArgs:
             pytest.skip("numpy not installed")
 
 
+class TestParseXYFlat:
+    def test_lists_unchanged(self):
+        x, y = _parse_xy_flat(([10, 20],))
+        assert x == [0.0, 1.0]
+        assert y == [10.0, 20.0]
+
+    def test_numpy_y_only_stays_array(self):
+        np = pytest.importorskip("numpy")
+        y_in = np.array([[1.0, 2.0], [3.0, 4.0]])
+        x, y = _parse_xy_flat((y_in,))
+        assert isinstance(x, np.ndarray) and isinstance(y, np.ndarray)
+        assert x.tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert np.shares_memory(y, y_in)
+
+
 # ─── _EasyState ──────────────────────────────────────────────────────────────
 
 class TestEasyState:
@@ -207,7 +253,8 @@ class TestAPISurface:
         assert callable(surf)
 
     def test_axes_config(self):
-        from spectra import title, xlabel, ylabel, xlim, ylim, grid, legend
+        from spectra import title, xlabel, ylabel, xlim, ylim, grid, legend, axes
+        assert callable(axes)
         assert callable(title)
         assert callable(xlabel)
         assert callable(ylabel)
@@ -263,6 +310,41 @@ class TestAPISurface:
             assert name in spectra.__all__, f"{name} not in __all__"
 
 
+# ─── sp.axes() ───────────────────────────────────────────────────────────────
+
+class _RecordingSession:
+    def __init__(self):
+        self.batches = []
+
+    def batch_update(self, updates):
+        self.batches.append(list(updates))
+
+
+class TestAxesSetup:
+    def test_single_batched_update(self, monkeypatch):
+        import spectra._easy as easy
+        from spectra._axes import Axes
+
+        session = _RecordingSession()
+        ax = Axes(session, figure_id=3, axes_index=0)
+        monkeypatch.setattr(easy, "_current_axes_any", lambda: ax)
+
+        assert easy.axes(title="T", xlabel="x", grid=True, ylim=(-1, 1)) is ax
+        assert len(session.batches) == 1
+        props = [u["prop"] for u in session.batches[0]]
+        assert props == ["axes_title", "xlabel", "ylim", "grid"]
+        assert all(u["figure_id"] == 3 for u in session.batches[0])
+
+    def test_no_settings_sends_nothing(self, monkeypatch):
+        import spectra._easy as easy
+        from spectra._axes import Axes
+
+        session = _RecordingSession()
+        monkeypatch.setattr(easy, "_current_axes_any", lambda: Axes(session, 1, 0))
+        easy.axes()
+        assert session.batches == []
+
+
 # ─── Backward Compatibility ──────────────────────────────────────────────────
 
 class TestBackwardCompat:
@@ -337,3 +419,39 @@ class TestEdgeCases:
     def test_to_list_mixed_types(self):
         result = _to_list([1, 2.5, True, 0])
         assert result == [1.0, 2.5, 1.0, 0.0]
+
+    def test_hist_steps(self):
+        x, y = _hist_steps([0, 1, 2, 3, 4], 2)
+        assert list(x) == [0.0, 2.0, 2.0, 4.0]
+        assert list(y) == [2.0, 2.0, 3.0, 3.0]
+
+    def test_hist_steps_empty(self):
+        assert _hist_steps([], 10) is None
+
+    def test_hist_steps_numpy_matches_pure_python(self, monkeypatch):
+        np = pytest.importorskip("numpy")
+        data = np.random.default_rng(0).normal(size=5000)
+        x, y = _hist_steps(data, 30)
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        ref_x, ref_y = _hist_steps(data.tolist(), 30)
+        assert x.tolist() == ref_x
+        assert y.tolist() == [float(c) for c in ref_y]
+
+    def test_stem_segments(self):
+        x, y = _stem_segments([1.0, 2.0], [3.0, 4.0])
+        x, y = list(x), list(y)
+        assert x[:2] == [1.0, 1.0] and x[3:5] == [2.0, 2.0]
+        assert y[:2] == [0.0, 3.0] and y[3:5] == [0.0, 4.0]
+        assert math.isnan(x[2]) and math.isnan(y[5])
+
+    def test_bar_segments(self):
+        x, y = _bar_segments([1.0], [5.0], 0.5)
+        x, y = list(x), list(y)
+        assert x[:5] == [0.5, 0.5, 1.5, 1.5, 0.5]
+        assert y[:5] == [0.0, 5.0, 5.0, 0.0, 0.0]
+        assert math.isnan(x[5]) and math.isnan(y[5])
+
+    def test_finite_bounds_skips_nan_and_sentinels(self):
+        vals = [float("nan"), -1e12, 2.0, float("inf"), -3.0, 1e12]
+        assert _finite_bounds(vals) == (-3.0, 2.0)
+        assert _finite_bounds([float("nan"), 1e12]) is None
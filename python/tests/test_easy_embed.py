@@ -138,6 +138,33 @@ class TestRenderMulti:
         assert img
 
 
+@_skip_embed
+class TestHistogramCounts:
+    """Test the histogram_counts() function."""
+
+    def test_from_edges_and_counts(self):
+        from spectra.embed import histogram_counts
+        img = histogram_counts([0.0, 1.0, 2.0, 3.0], [4, 9, 2])
+        assert img
+        assert img.width == 800
+
+    def test_numpy_histogram(self):
+        np = pytest.importorskip("numpy")
+        from spectra.embed import histogram_counts
+        counts, edges = np.histogram(np.linspace(-1.0, 1.0, 500), bins=20)
+        img = histogram_counts(edges, counts, title="Histogram")
+        assert img
+
+
+class TestHistogramCountsValidation:
+    """histogram_counts() argument checks (no library needed)."""
+
+    def test_mismatched_edges_raise(self):
+        from spectra.embed import histogram_counts
+        with pytest.raises(ValueError):
+            histogram_counts([0.0, 1.0], [1, 2, 3])
+
+
 @_skip_embed
 class TestWithOptions:
     """Test rendering with title/xlabel/ylabel options."""
@@ -167,6 +167,21 @@ class TestRendering:
         ok = s.render_into(buf)
         assert ok
 
+    def test_render_into_numpy(self):
+        np = pytest.importorskip("numpy")
+        s = EmbedSurface(64, 64)
+        fig = s.figure()
+        ax = fig.subplot(1, 1, 1)
+        ax.line([0, 1, 2, 3], [0, 1, 4, 9])
+        buf = np.zeros((64, 64, 4), dtype=np.uint8)
+        assert s.render_into(buf)
+        assert np.count_nonzero(buf) > 100
+
+    def test_render_into_too_small(self):
+        s = EmbedSurface(64, 64)
+        with pytest.raises(ValueError):
+            s.render_into(bytearray(16))
+
     def test_multiple_renders(self):
         s = EmbedSurface(64, 64)
         fig = s.figure()
@@ -412,3 +427,36 @@ class TestCallbacks:
         s.set_on_series_selected(None)
         s.set_on_hover(None)
         s.set_on_view_changed(None)
+
+
+# ─── Array conversion (no library needed) ───────────────────────────────────
+
+
+class TestToCFloat:
+    def test_list(self):
+        from spectra._embed import _to_cfloat
+
+        ptr, n, _owner = _to_cfloat([1.0, 2.0, 3.0])
+        assert n == 3
+        assert [ptr[i] for i in range(n)] == [1.0, 2.0, 3.0]
+
+    def test_float32_ndarray_zero_copy(self):
+        np = pytest.importorskip("numpy")
+        from spectra._embed import _to_cfloat
+
+        data = np.arange(4, dtype=np.float32)
+        ptr, n, owner = _to_cfloat(data)
+        assert n == 4
+        assert owner is data
+        assert ctypes.addressof(ptr.contents) == data.ctypes.data
+
+    def test_float32_buffer_zero_copy(self):
+        pytest.importorskip("numpy")
+        import array
+        from spectra._embed import _to_cfloat
+
+        data = array.array("f", [0.5, 1.5])
+        ptr, n, _owner = _to_cfloat(data)
+        assert n == 2
+        assert ctypes.addressof(ptr.contents) == data.buffer_info()[0]
+        assert [ptr[0], ptr[1]] == [0.5, 1.5]
@@ -4,7 +4,7 @@ Tests are organized into suites:
   - TestAppendDataCodec: encode/decode round-trips for REQ_APPEND_DATA
   - TestAppendDataRawCodec: raw bytes path for REQ_APPEND_DATA
   - TestProtocolConstants: new message type constants
-  - TestSeriesHelpers: _interleave_xy, _to_float_list, _try_interleave_numpy
+  - TestSeriesHelpers: _interleave_xy, _to_float_list, _try_interleave_numpy(_xyz)
   - TestConvenienceAPI: module-level sp.figure(), sp.line(), sp.show() etc.
   - TestFigureProxy: Figure proxy properties and methods
   - TestAxesProxy: Axes proxy methods
@@ -35,7 +35,12 @@ from spectra._codec import (
     decode_req_update_property,
 )
 from spectra import _protocol as P
-from spectra._series import _to_float_list, _interleave_xy, _try_interleave_numpy
+from spectra._series import (
+    _to_float_list,
+    _interleave_xy,
+    _try_interleave_numpy,
+    _try_interleave_numpy_xyz,
+)
 
 
 # ─── REQ_APPEND_DATA codec tests ─────────────────────────────────────────────
@@ -176,7 +181,7 @@ class TestProtocolConstants:
 # ─── Series helper tests ─────────────────────────────────────────────────────
 
 class TestSeriesHelpers:
-    """Test _to_float_list, _interleave_xy, _try_interleave_numpy."""
+    """Test _to_float_list, _interleave_xy, _try_interleave_numpy(_xyz)."""
 
     def test_to_float_list_from_list(self):
         assert _to_float_list([1, 2, 3]) == [1.0, 2.0, 3.0]
@@ -220,6 +225,25 @@ class TestSeriesHelpers:
         assert abs(floats[0] - 1.0) < 1e-5
         assert abs(floats[1] - 10.0) < 1e-5
 
+    def test_numpy_interleave_returns_view(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        raw, count = _try_interleave_numpy(np.arange(3.0), np.arange(3.0))
+        assert isinstance(raw, memoryview)
+        assert raw.nbytes == len(raw) == count * 4
+
+    def test_numpy_interleave_empty(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        raw, count = _try_interleave_numpy(np.array([]), np.array([]))
+        assert count == 0 and len(raw) == 0
+        raw, count = _try_interleave_numpy_xyz(np.array([]), np.array([]), np.array([]))
+        assert count == 0 and len(raw) == 0
+
     def test_numpy_interleave_shape_mismatch(self):
         try:
             import numpy as np
@@ -234,6 +258,89 @@ class TestSeriesHelpers:
         result = _try_interleave_numpy([1.0, 2.0], [10.0, 20.0])
         assert result is None
 
+    def test_numpy_interleave_buffer_protocol(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return
+        import array
+        x = array.array("d", [1.0, 2.0])
+        y = memoryview(array.array("f", [10.0, 20.0]))
+        result = _try_interleave_numpy(x, y)
+        assert result is not None
+        raw, count = result
+        assert count == 4
+        assert struct.unpack(f"<{count}f", raw) == (1.0, 10.0, 2.0, 20.0)
+
+    def test_numpy_interleave_device_array(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        class _DeviceArray:
+            # Mimics a CuPy array: device interface plus a host copy via get()
+            __cuda_array_interface__ = {"shape": (2,), "typestr": "<f4", "version": 3}
+
+            def __init__(self, host):
+                self._host = np.asarray(host, dtype=np.float32)
+
+            def get(self):
+                return self._host
+
+        result = _try_interleave_numpy(_DeviceArray([1.0, 2.0]), np.array([3.0, 4.0]))
+        assert result is not None
+        raw, count = result
+        assert struct.unpack(f"<{count}f", raw) == (1.0, 3.0, 2.0, 4.0)
+
+    def test_numpy_interleave_numba_device_array(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        class _NumbaDeviceArray:
+            # Mimics a Numba DeviceNDArray: no get(), host copy via copy_to_host()
+            __cuda_array_interface__ = {"shape": (2,), "typestr": "<f4", "version": 3}
+
+            def __init__(self, host):
+                self._host = np.asarray(host, dtype=np.float32)
+
+            def copy_to_host(self):
+                return self._host
+
+            def __iter__(self):
+                raise AssertionError("device memory must not be iterated")
+
+        result = _try_interleave_numpy(_NumbaDeviceArray([1.0, 2.0]), np.array([3.0, 4.0]))
+        assert result is not None
+        raw, count = result
+        assert struct.unpack(f"<{count}f", raw) == (1.0, 3.0, 2.0, 4.0)
+
+    def test_numpy_interleave_int_buffer_rejected(self):
+        import array
+        result = _try_interleave_numpy(array.array("i", [1, 2]), array.array("i", [3, 4]))
+        assert result is None
+
+    def test_numpy_interleave_xyz_meshgrid(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        X, Y = np.meshgrid(np.arange(3.0), np.arange(2.0))
+        Z = X + 10.0 * Y
+        result = _try_interleave_numpy_xyz(X, Y, Z)
+        assert result is not None
+        raw, count = result
+        assert count == 18  # 6 points * 3 coords
+        floats = struct.unpack(f"<{count}f", raw)
+        assert floats[:6] == (0.0, 0.0, 0.0, 1.0, 0.0, 1.0)
+        assert floats[-3:] == (2.0, 1.0, 12.0)
+
+    def test_numpy_interleave_xyz_non_numpy(self):
+        result = _try_interleave_numpy_xyz([1.0], [2.0], [3.0])
+        assert result is None
+
 
 # ─── Convenience API tests (module-level) ────────────────────────────────────
 
@@ -385,6 +492,84 @@ class TestFigureProxy:
 class TestSeriesProxy:
     """Test Series proxy object properties (without backend)."""
 
+    def test_append_point_payload(self):
+        from spectra._series import Series
+        from spectra._codec import decode_req_append_data
+
+        sent = []
+
+        class _Session:
+            def _request(self, msg_type, payload=b""):
+                sent.append((msg_type, payload))
+
+        s = Series(_Session(), figure_id=7, series_index=2, series_type="line")
+        s.append_point(1.5, -2.0)
+        assert len(sent) == 1
+        msg_type, payload = sent[0]
+        assert msg_type == P.REQ_APPEND_DATA
+        decoded = decode_req_append_data(payload)
+        assert decoded["figure_id"] == 7
+        assert decoded["series_index"] == 2
+        assert decoded["data"] == [1.5, -2.0]
+
+    def test_ring_buffer_trims_to_max_points(self):
+        from spectra._series import Series
+        from spectra._codec import decode_req_append_data as decode_raw
+
+        sent = []
+
+        class _Session:
+            def _request(self, msg_type, payload=b""):
+                sent.append((msg_type, payload))
+
+        s = Series(_Session(), figure_id=1, series_index=0, series_type="line", max_points=3)
+        assert s.max_points == 3
+        for i in range(3):
+            s.append_point(float(i), float(-i))
+        # Below eight points there is no slack: the first overflow resends
+        assert [m for m, _ in sent] == [P.REQ_APPEND_DATA] * 3
+        s.append_point(3.0, -3.0)
+        msg_type, payload = sent[-1]
+        assert msg_type == P.REQ_SET_DATA
+        assert decode_raw(payload)["data"] == [1.0, -1.0, 2.0, -2.0, 3.0, -3.0]
+
+    def test_ring_buffer_bounds_backend_points(self):
+        from spectra._series import Series
+        from spectra._codec import decode_req_append_data as decode_raw
+
+        held = [0]
+        peak = [0]
+
+        class _Session:
+            # Tracks how many points the backend copy holds
+            def _request(self, msg_type, payload=b""):
+                n = len(decode_raw(payload)["data"]) // 2
+                held[0] = n if msg_type == P.REQ_SET_DATA else held[0] + n
+                peak[0] = max(peak[0], held[0])
+
+        s = Series(_Session(), figure_id=1, series_index=0, series_type="line", max_points=64)
+        for i in range(1000):
+            s.append_point(float(i), 0.0)
+        s.append(list(range(50)), [0.0] * 50)
+        assert peak[0] == 64 + 64 // 8
+        assert 64 <= held[0] <= 72
+
+    def test_ring_buffer_set_data_keeps_tail(self):
+        from spectra._series import Series
+        from spectra._codec import decode_req_append_data as decode_raw
+
+        sent = []
+
+        class _Session:
+            def _request(self, msg_type, payload=b""):
+                sent.append((msg_type, payload))
+
+        s = Series(_Session(), figure_id=1, series_index=0, series_type="line", max_points=2)
+        s.set_data([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+        assert decode_raw(sent[-1][1])["data"] == [2.0, 5.0, 3.0, 6.0]
+        s.append([7.0, 8.0, 9.0], [1.0, 1.0, 1.0])
+        assert decode_raw(sent[-1][1])["data"] == [8.0, 1.0, 9.0, 1.0]
+
     def test_series_repr(self):
         from spectra._series import Series
         s = Series.__new__(Series)
@@ -186,7 +186,8 @@ class TestAxesClear:
         ax._session = None
         ax._figure_id = 5
         ax._index = 2
-        ax._series_list = []
+        ax._series_by_index = {}
+        ax._texts = {}
         assert "5" in repr(ax)
         assert "2" in repr(ax)
 
@@ -274,6 +275,35 @@ class TestAnimationModule:
         p = FramePacer(fps=0.0)
         assert abs(p.fps - 1.0) < 0.1
 
+    def test_frame_pacer_absolute_schedule(self):
+        """Work done inside a frame is absorbed by the next wait."""
+        from spectra._animation import FramePacer
+
+        class MockSession:
+            _transport = None
+
+        p = FramePacer(fps=50.0)  # 20 ms frames
+        start = time.monotonic()
+        for _ in range(5):
+            time.sleep(0.01)  # simulated frame work
+            p.pace(MockSession())
+        elapsed = time.monotonic() - start
+        assert 0.095 <= elapsed < 0.14
+
+    def test_frame_pacer_realigns_after_stall(self):
+        from spectra._animation import FramePacer
+
+        class MockSession:
+            _transport = None
+
+        p = FramePacer(fps=100.0)
+        time.sleep(0.05)  # fall five frames behind
+        start = time.monotonic()
+        p.pace(MockSession())  # no wait: already late
+        assert time.monotonic() - start < 0.005
+        p.pace(MockSession())  # next frame is one interval out, not a burst
+        assert time.monotonic() - start >= 0.009
+
     def test_ipc_sleep_no_session(self):
         """ipc_sleep with a mock session that has no transport should fall back to time.sleep."""
         from spectra._animation import ipc_sleep
@@ -286,6 +316,98 @@ class TestAnimationModule:
         elapsed = time.monotonic() - start
         assert elapsed >= 0.009  # at least ~10ms
 
+    def test_ipc_sleep_dispatches_events_until_deadline(self):
+        import socket
+        import threading
+        from spectra._animation import ipc_sleep
+        from spectra._transport import Transport
+
+        a, b = socket.socketpair()
+        peer = Transport(b)
+
+        class MockSession:
+            _lock = threading.Lock()
+            _transport = Transport(a)
+            events = []
+
+            def _handle_event(self, msg):
+                self.events.append(msg["header"]["type"])
+
+        session = MockSession()
+        try:
+            peer.send(P.RESP_OK, b"")
+            start = time.monotonic()
+            ipc_sleep(session, 0.05)
+            elapsed = time.monotonic() - start
+            assert session.events == [P.RESP_OK]
+            assert elapsed >= 0.045
+        finally:
+            session._transport.close()
+            peer.close()
+
+    def test_transport_wait_readable(self):
+        import socket
+        from spectra._transport import Transport
+
+        a, b = socket.socketpair()
+        t = Transport(a)
+        try:
+            assert t.wait_readable(0.0) is False
+            b.sendall(b"x")
+            assert t.wait_readable(1.0) is True
+        finally:
+            t.close()
+            b.close()
+        assert t.wait_readable(0.0) is False
+
+    def test_transport_recv_splits_coalesced_frames(self):
+        import socket
+        from spectra._transport import Transport
+
+        a, b = socket.socketpair()
+        t = Transport(a)
+        peer = Transport(b)
+        try:
+            peer.send_many([(P.RESP_OK, b"", 1), (P.RESP_ERR, b"xyz", 2)])
+            first = t.recv()
+            assert first["header"]["request_id"] == 1
+            # The second frame came in with the first read; it must still
+            # be reported as readable even though the socket is drained.
+            assert t.wait_readable(0.0) is True
+            second = t.recv()
+            assert second["header"]["type"] == P.RESP_ERR
+            assert second["payload"] == b"xyz"
+            assert t.wait_readable(0.0) is False
+        finally:
+            t.close()
+            peer.close()
+
+    def test_transport_send_many_large_payloads(self):
+        import socket
+        import threading
+        from spectra._transport import Transport
+
+        a, b = socket.socketpair()
+        t = Transport(a)
+        peer = Transport(b)
+        # Larger than the socket buffer, so sendmsg writes partially
+        payloads = [bytes([i]) * (300 * 1024) for i in range(3)]
+        received = []
+
+        def reader():
+            for _ in payloads:
+                received.append(peer.recv()["payload"])
+
+        th = threading.Thread(target=reader)
+        th.start()
+        try:
+            t.send_many([(P.REQ_SET_DATA, p, i + 1) for i, p in enumerate(payloads)])
+            th.join(5.0)
+            assert received == payloads
+        finally:
+            t.close()
+            peer.close()
+
 
 # ─── New exports in __init__.py ──────────────────────────────────────────────
 
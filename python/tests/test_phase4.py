@@ -5,6 +5,7 @@ Tests are organized into suites:
   - TestBatchProtocol: protocol constant verification
   - TestReconnectCodec: extended reconnect codec tests
   - TestSessionBatchAPI: Session.batch_update() API presence
+  - TestSessionPipelineBatch: Session.batch() request pipelining
   - TestSessionReconnectAPI: Session.reconnect() API presence
   - TestAxesBatchContext: Axes.batch() context manager
   - TestBatchWireFormat: wire format verification
@@ -72,6 +73,21 @@ class TestBatchCodec:
         assert found["prop"] == "xlabel"
         assert found["str_val"] == "Time (s)"
 
+    def test_encode_shares_repeated_strings(self):
+        one = encode_req_update_batch([
+            dict(figure_id=1, axes_index=0, prop="xlabel", str_val="Time"),
+        ])
+        many = [
+            dict(figure_id=1, axes_index=i, prop="xlabel", str_val="Time")
+            for i in range(50)
+        ]
+        data = encode_req_update_batch(many)
+        # Each extra entry costs only its table, not another copy of the strings
+        assert len(data) < 25 * len(one)
+        decoded = decode_req_update_batch(data)
+        assert [d["axes_index"] for d in decoded] == list(range(50))
+        assert all(d["prop"] == "xlabel" and d["str_val"] == "Time" for d in decoded)
+
     def test_encode_empty_list(self):
         data = encode_req_update_batch([])
         assert data[0] == P.PAYLOAD_FORMAT_FLATBUFFERS
@@ -170,6 +186,318 @@ class TestSessionBatchAPI:
         assert callable(getattr(Session, "batch_update"))
 
 
+class _FakeTransport:
+    """Records writes and acknowledges every request with RESP_OK, or with
+    RESP_ERR for message types listed in ``reject``."""
+
+    is_open = True
+
+    def __init__(self):
+        self.writes = []
+        self._responses = []
+        self.reject = set()
+
+    def _ack(self, msg_type, request_id):
+        if msg_type in self.reject:
+            from spectra._codec import PayloadEncoder
+            enc = PayloadEncoder()
+            enc.put_u64(P.TAG_REQUEST_ID, request_id)
+            enc.put_u32(P.TAG_ERROR_CODE, 7)
+            enc.put_string(P.TAG_ERROR_MESSAGE, "rejected")
+            self._responses.append(
+                {"header": {"type": P.RESP_ERR, "request_id": request_id},
+                 "payload": enc.take()}
+            )
+            return
+        self._responses.append(
+            {"header": {"type": P.RESP_OK, "request_id": request_id}, "payload": b""}
+        )
+
+    def send(self, msg_type, payload=b"", request_id=0, session_id=0, window_id=0):
+        self.writes.append([msg_type])
+        self._ack(msg_type, request_id)
+
+    def send_many(self, messages, session_id=0):
+        self.writes.append([msg_type for msg_type, _, _ in messages])
+        for msg_type, _, request_id in messages:
+            self._ack(msg_type, request_id)
+
+    def recv(self):
+        return self._responses.pop(0)
+
+    def wait_readable(self, timeout):
+        return False
+
+
+def _make_session():
+    import threading
+    from spectra._session import Session
+
+    s = Session.__new__(Session)
+    s._transport = _FakeTransport()
+    s._lock = threading.Lock()
+    s._next_request_id = 0
+    s._session_id = 1
+    s._batch_local = threading.local()
+    s._pending_property_updates = []
+    s._pending_lock = threading.Lock()
+    s._flush_wakeup = threading.Event()
+    s._flusher = None
+    s._flush_error = None
+    s._closed = False
+    s._figures = []
+    s._animators = {}
+    return s
+
+
+def _hold_autoflush(monkeypatch):
+    """Keep the background flusher from firing mid-test."""
+    import spectra._session as session_mod
+    monkeypatch.setattr(session_mod, "_AUTOFLUSH_DELAY", 60.0)
+
+
+class TestSessionPipelineBatch:
+    """Test Session.batch() queues ack-only requests into one write."""
+
+    def test_batch_single_write(self):
+        s = _make_session()
+        with s.batch():
+            assert s._request(P.REQ_SET_DATA, b"a") is None
+            s._request(P.REQ_SET_DATA, b"b")
+            s._request(P.REQ_UPDATE_PROPERTY, b"c")
+            assert s._transport.writes == []
+        assert s._transport.writes == [
+            [P.REQ_SET_DATA, P.REQ_SET_DATA, P.REQ_UPDATE_PROPERTY],
+        ]
+        assert s._transport._responses == []
+
+    def test_response_request_flushes_first(self):
+        s = _make_session()
+        with s.batch():
+            s._request(P.REQ_SET_DATA, b"a")
+            msg = s._request(P.REQ_ADD_SERIES, b"b")
+            assert msg["header"]["request_id"] == 2
+        assert s._transport.writes == [[P.REQ_SET_DATA], [P.REQ_ADD_SERIES]]
+
+    def test_nested_batch_flushes_once(self):
+        s = _make_session()
+        with s.batch():
+            s._request(P.REQ_SET_DATA, b"a")
+            with s.batch():
+                s._request(P.REQ_APPEND_DATA, b"b")
+            assert s._transport.writes == []
+        assert s._transport.writes == [[P.REQ_SET_DATA, P.REQ_APPEND_DATA]]
+
+    def test_no_batch_sends_immediately(self):
+        s = _make_session()
+        s._request(P.REQ_SET_DATA, b"a")
+        assert s._transport.writes == [[P.REQ_SET_DATA]]
+
+    def test_easy_exports_batch(self):
+        import spectra as sp
+        assert callable(sp.batch)
+        assert "batch" in sp.__all__
+
+
+class TestPropertyCoalescing:
+    """Test Axes setters coalescing into one REQ_UPDATE_BATCH."""
+
+    def _axes(self, s):
+        from spectra._axes import Axes
+        return Axes(s, figure_id=1, axes_index=0)
+
+    def test_setters_coalesce_before_next_request(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        s = _make_session()
+        ax = self._axes(s)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(-1, 1)
+        ax.set_title("t")
+        assert s._transport.writes == []
+        s._request(P.REQ_SET_DATA, b"a")
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH, P.REQ_SET_DATA]]
+        assert not s._flush_wakeup.is_set()
+
+    def test_queue_flushes_when_full(self):
+        from spectra._session import _AUTOFLUSH_MAX_UPDATES
+        s = _make_session()
+        ax = self._axes(s)
+        for i in range(_AUTOFLUSH_MAX_UPDATES):
+            ax.grid(i % 2 == 0)
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH]]
+        assert s._pending_property_updates == []
+
+    def test_timer_flushes_idle_queue(self):
+        import time
+        s = _make_session()
+        self._axes(s).set_xlabel("x")
+        deadline = time.monotonic() + 1.0
+        while not s._transport.writes and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH]]
+
+    def test_queue_flushes_alone_before_response_request(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._errors import BackendError
+        s = _make_session()
+        s._transport.reject.add(P.REQ_UPDATE_BATCH)
+        self._axes(s).set_xlim(0, 1)
+        try:
+            s._request(P.REQ_ADD_SERIES, b"a")
+        except BackendError as exc:
+            assert "0x%04X" % P.REQ_UPDATE_BATCH in str(exc)
+        else:
+            raise AssertionError("rejected update batch should raise")
+        # The series was never requested, so none is orphaned
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH]]
+        assert s._transport._responses == []
+
+    def test_rejected_queue_reads_every_ack(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._errors import BackendError
+        s = _make_session()
+        s._transport.reject.add(P.REQ_UPDATE_BATCH)
+        self._axes(s).set_xlim(0, 1)
+        try:
+            s._request(P.REQ_SET_DATA, b"a")
+        except BackendError:
+            pass
+        else:
+            raise AssertionError("rejected update batch should raise")
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH, P.REQ_SET_DATA]]
+        assert s._transport._responses == []
+
+    def test_flusher_thread_is_reused(self):
+        import time
+        s = _make_session()
+        ax = self._axes(s)
+        flushers = []
+        for n, label in enumerate(("a", "b", "c"), 1):
+            ax.set_xlabel(label)
+            flushers.append(s._flusher)
+            deadline = time.monotonic() + 1.0
+            while len(s._transport.writes) < n and time.monotonic() < deadline:
+                time.sleep(0.001)
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH]] * 3
+        assert flushers[0] is flushers[1] is flushers[2]
+        assert flushers[0].is_alive()
+        s._closed = True
+        s._flush_wakeup.set()
+        flushers[0].join(1.0)
+        assert not flushers[0].is_alive()
+
+    def test_flusher_error_raised_by_sync(self):
+        import time
+        from spectra._errors import BackendError
+        s = _make_session()
+        s._transport.reject.add(P.REQ_UPDATE_BATCH)
+        self._axes(s).set_xlim(0, 1)
+        deadline = time.monotonic() + 1.0
+        while s._flush_error is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+        try:
+            s.sync()
+        except BackendError:
+            pass
+        else:
+            raise AssertionError("rejected background flush should raise from sync()")
+        s.sync()  # reported once
+
+    def test_setter_inside_batch_joins_batch(self):
+        s = _make_session()
+        ax = self._axes(s)
+        with s.batch():
+            s._request(P.REQ_SET_DATA, b"a")
+            ax.set_xlim(0, 1)
+        assert s._transport.writes == [[P.REQ_SET_DATA, P.REQ_UPDATE_BATCH]]
+        assert not s._flush_wakeup.is_set()
+
+
+class TestBatchUpdateDeferred:
+    """Test Session.batch_update() returning without waiting for the ack."""
+
+    def test_batch_update_coalesces_until_sync(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        s = _make_session()
+        with Axes(s, figure_id=1, axes_index=0).batch() as b:
+            b.set_xlim(0, 1)
+            b.set_ylim(0, 1)
+        with Axes(s, figure_id=1, axes_index=1).batch() as b:
+            b.grid(True)
+        assert s._transport.writes == []
+        assert len(s._pending_property_updates) == 3
+        s.sync()
+        assert s._transport.writes == [[P.REQ_UPDATE_BATCH]]
+        assert s._transport._responses == []
+
+
+class TestInitialDataDeferred:
+    """Test a new series' initial data being acknowledged by the creating call."""
+
+    def test_set_data_sent_by_creating_call(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        s = _make_session()
+        ax = Axes(s, figure_id=1, axes_index=0)
+        ax.line([0.0, 1.0], [1.0, 2.0])
+        ax.line([0.0, 1.0], [3.0, 4.0])
+        assert s._transport.writes == [
+            [P.REQ_ADD_SERIES],
+            [P.REQ_SET_DATA],
+            [P.REQ_ADD_SERIES],
+            [P.REQ_SET_DATA],
+        ]
+        assert s._transport._responses == []
+
+    def test_rejected_set_data_raises_from_line(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        from spectra._errors import BackendError
+        s = _make_session()
+        s._transport.reject.add(P.REQ_SET_DATA)
+        ax = Axes(s, figure_id=1, axes_index=0)
+        try:
+            ax.line([0.0, 1.0], [1.0, 2.0])
+        except BackendError as exc:
+            assert "0x%04X" % P.REQ_SET_DATA in str(exc)
+        else:
+            raise AssertionError("rejected initial data should raise from line()")
+        assert s._transport._responses == []
+        # The next unrelated request is unaffected
+        s._transport.reject.clear()
+        s._request(P.REQ_LIST_FIGURES, b"")
+
+
+class TestAxesClearPipelined:
+    """Test Axes.clear() removing every series in one write."""
+
+    def test_clear_single_write(self):
+        from spectra._axes import Axes
+        from spectra._series import Series
+        s = _make_session()
+        ax = Axes(s, figure_id=1, axes_index=0)
+        ax._series_by_index = {i: Series(s, 1, i, "line") for i in range(4)}
+        ax.clear()
+        assert s._transport.writes == [[P.REQ_REMOVE_SERIES] * 4]
+        assert s._transport._responses == []
+        assert ax.series == []
+
+
+class TestAxesRemoveSeries:
+    """Test Axes.remove_series() bookkeeping."""
+
+    def test_remove_keeps_order_of_rest(self):
+        from spectra._axes import Axes
+        from spectra._series import Series
+        s = _make_session()
+        ax = Axes(s, figure_id=1, axes_index=0)
+        ax._series_by_index = {i: Series(s, 1, i, "line") for i in range(4)}
+        ax.remove_series(1)
+        ax.remove_series(7)  # unknown index is ignored locally
+        assert [x.index for x in ax.series] == [0, 2, 3]
+
+
 class TestSessionReconnectAPI:
     """Verify Session.reconnect() exists."""
 
@@ -231,7 +559,8 @@ class TestAxesBatchContext:
         ax._session = None
         ax._figure_id = 1
         ax._index = 0
-        ax._series_list = []
+        ax._series_by_index = {}
+        ax._texts = {}
 
         ctx = _AxesBatchContext(ax)
         ctx.set_xlim(0, 10)
@@ -250,7 +579,8 @@ class TestAxesBatchContext:
         ax._session = None
         ax._figure_id = 42
         ax._index = 3
-        ax._series_list = []
+        ax._series_by_index = {}
+        ax._texts = {}
 
         ctx = _AxesBatchContext(ax)
         ctx.set_xlim(0, 10)
@@ -258,6 +588,64 @@ class TestAxesBatchContext:
         assert ctx._updates[0]["figure_id"] == 42
         assert ctx._updates[0]["axes_index"] == 3
 
+    def test_repeated_text_skipped(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        s = _make_session()
+        ax = Axes(s, figure_id=1, axes_index=0)
+        ax.set_xlabel("Time")
+        ax.set_title("T")
+        with ax.batch() as b:
+            b.set_xlabel("Time")
+            b.set_ylabel("V")
+        ax.set_title("T")
+        ax.set_xlim(0, 1)
+        ax.set_xlim(0, 1)
+        props = [u["prop"] for u in s._pending_property_updates]
+        assert props == ["xlabel", "axes_title", "ylabel", "xlim", "xlim"]
+        ax.set_title("U")
+        assert s._pending_property_updates[-1]["str_val"] == "U"
+        s.sync()
+
+    def test_failed_send_resends_text(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        from spectra._figure import Figure
+        s = _make_session()
+        fig = Figure(s, figure_id=1)
+        s._figures.append(fig)
+        ax = Axes(s, figure_id=1, axes_index=0)
+        fig._axes_list.append(ax)
+        ax.set_xlabel("Time")
+
+        def _fail(messages, session_id=0):
+            raise ConnectionError("broken pipe")
+
+        monkeypatch.setattr(s._transport, "send_many", _fail)
+        try:
+            s.sync()
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("sync() should surface the send failure")
+        ax.set_xlabel("Time")
+        assert [u["prop"] for u in s._pending_property_updates] == ["xlabel"]
+
+    def test_reconnect_resends_text(self, monkeypatch):
+        _hold_autoflush(monkeypatch)
+        from spectra._axes import Axes
+        from spectra._figure import Figure
+        s = _make_session()
+        fig = Figure(s, figure_id=1)
+        s._figures.append(fig)
+        ax = Axes(s, figure_id=1, axes_index=0)
+        fig._axes_list.append(ax)
+        ax.set_title("T")
+        s.sync()
+        s.reconnect(session_id=1)
+        ax.set_title("T")
+        assert [u["prop"] for u in s._pending_property_updates] == ["axes_title"]
+
 
 # ─── Batch wire format tests ─────────────────────────────────────────────────
 
@@ -393,3 +781,61 @@ class TestBatchEdgeCases:
             dict(figure_id=1, prop="xlim", f1=0.0, f2=1.0, str_val=""),
         ]
         assert decode_req_update_batch(encode_req_update_batch(updates))[0]["str_val"] == ""
+
+
+class TestPacerFlushesBatch:
+    def test_pace_flushes_open_batch(self):
+        from spectra._animation import FramePacer
+
+        s = _make_session()
+        pacer = FramePacer(fps=1000.0)
+        with s.batch():
+            s._request(P.REQ_APPEND_DATA, b"a")
+            s._request(P.REQ_APPEND_DATA, b"b")
+            assert s._transport.writes == []
+            pacer.pace(s)
+            assert s._transport.writes == [[P.REQ_APPEND_DATA, P.REQ_APPEND_DATA]]
+            s._request(P.REQ_APPEND_DATA, b"c")
+        assert s._transport.writes[-1] == [P.REQ_APPEND_DATA]
+
+
+class TestAnimatorDispatch:
+    """Test ANIM_TICK routing to registered BackendAnimators."""
+
+    def _tick(self, figure_id):
+        from spectra._codec import PayloadEncoder
+        enc = PayloadEncoder()
+        enc.put_u64(P.TAG_FIGURE_ID, figure_id)
+        enc.put_u32(P.TAG_F1, 7)
+        enc.put_float(P.TAG_F2, 0.5)
+        enc.put_float(P.TAG_F3, 0.016)
+        return {"header": {"type": P.ANIM_TICK}, "payload": enc.take()}
+
+    def test_tick_routed_by_figure_id(self):
+        from spectra._animation import BackendAnimator
+
+        s = _make_session()
+        a1 = BackendAnimator(s, figure_id=1)
+        a2 = BackendAnimator(s, figure_id=2)
+        seen = []
+        a1.on_tick = lambda t, dt, n: seen.append(("a1", n))
+        a2.on_tick = lambda t, dt, n: seen.append(("a2", n))
+        s._register_animator(a1)
+        s._register_animator(a2)
+
+        s._handle_event(self._tick(2))
+        s._handle_event(self._tick(3))  # no animator: ignored
+        assert seen == [("a2", 7)]
+
+    def test_unregister_stops_dispatch(self):
+        from spectra._animation import BackendAnimator
+
+        s = _make_session()
+        a = BackendAnimator(s, figure_id=1)
+        seen = []
+        a.on_tick = lambda t, dt, n: seen.append(n)
+        s._register_animator(a)
+        s._unregister_animator(a)
+        s._unregister_animator(a)  # idempotent
+        s._handle_event(self._tick(1))
+        assert seen == []
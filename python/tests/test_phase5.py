@@ -37,7 +37,7 @@ from spectra._codec import (
     decode_blob_release,
 )
 from spectra import _protocol as P
-from spectra._blob import BlobStore, BlobRef, SHM_THRESHOLD, BLOB_TTL, _next_blob_name
+from spectra._blob import BlobStore, BlobRef, SHM_THRESHOLD, BLOB_TTL, _BLOB_TTL_NS, _next_blob_name
 from spectra._animation import BackendAnimator
 from spectra._persistence import save_session, load_session_metadata, restore_session
 
@@ -208,11 +208,68 @@ class TestBlobStore:
         ref = store.create_blob(b"x" * 1024)
         if ref is not None:
             # Force expiry by backdating
-            ref.created_at = ref.created_at - BLOB_TTL - 1
+            ref.created_at_ns = ref.created_at_ns - _BLOB_TTL_NS - 1
             count = store.cleanup_expired()
             assert count >= 1
             assert store.active_count == 0
 
+    def test_cleanup_expired_releases_ref(self):
+        store = BlobStore()
+        ref = store.create_blob(b"x" * 1024)
+        if ref is not None:
+            fresh = store.create_blob(b"y" * 1024)
+            ref.created_at_ns = ref.created_at_ns - _BLOB_TTL_NS - 1
+            assert store.cleanup_expired() == 1
+            assert ref._released
+            assert ref._shm is None
+            assert store.active_count == 1
+            store.cleanup_all()
+            assert fresh._released
+
+    def test_cleanup_expired_stops_at_first_live(self):
+        store = BlobStore()
+        refs = [store.create_blob(b"x" * 64) for _ in range(3)]
+        if refs[0] is not None:
+            for ref in refs[:2]:
+                ref.created_at_ns -= _BLOB_TTL_NS + 1
+            assert store.cleanup_expired() == 2
+            assert store.active_count == 1
+            assert not refs[2]._released
+            store.cleanup_all()
+
+    def test_create_blob_from_array_buffer(self):
+        import array
+        store = BlobStore()
+        values = array.array("f", [1.0, 2.0, 3.0])
+        ref = store.create_blob(values)
+        if ref is not None:
+            # Sized in bytes, not elements, and copied verbatim
+            assert ref.size == 12
+            assert bytes(ref._shm.buf[:12]) == values.tobytes()
+            store.cleanup_all()
+
+    def test_create_blob_non_contiguous(self):
+        store = BlobStore()
+        view = memoryview(b"abcdef")[::2]
+        ref = store.create_blob(view)
+        if ref is not None:
+            assert ref.size == 3
+            assert bytes(ref._shm.buf[:3]) == b"ace"
+            store.cleanup_all()
+
+    def test_create_blob_fast_shm_lifecycle(self):
+        from spectra import _blob
+        if not os.path.isdir(_blob._SHM_DIR):
+            return
+        store = BlobStore()
+        ref = store.create_blob(b"z" * 4096)
+        assert isinstance(ref._shm, _blob._FastShm)
+        path = os.path.join(_blob._SHM_DIR, ref.name.lstrip("/"))
+        with open(path, "rb") as f:
+            assert f.read() == b"z" * 4096
+        store.release_blob(ref.name)
+        assert not os.path.exists(path)
+
 
 class TestBlobRef:
     """Test BlobRef creation and cleanup."""
@@ -233,7 +290,7 @@ class TestBlobRef:
     def test_blob_ref_is_expired(self):
         ref = BlobRef("/test-blob", 1024)
         assert not ref.is_expired
-        ref.created_at = ref.created_at - BLOB_TTL - 1
+        ref.created_at_ns = ref.created_at_ns - _BLOB_TTL_NS - 1
         assert ref.is_expired
 
     def test_blob_name_uniqueness(self):
@@ -242,6 +299,21 @@ class TestBlobRef:
             names.add(_next_blob_name())
         assert len(names) == 100
 
+    def test_blob_name_unique_across_threads(self):
+        import threading
+        names = []
+
+        def worker():
+            names.extend(_next_blob_name() for _ in range(500))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        assert len(set(names)) == 2000
+        assert all(n.startswith(f"/spectra-blob-{os.getpid()}-") for n in names)
+
 
 class TestBlobProtocol:
     """Verify blob protocol constants."""
@@ -314,6 +386,15 @@ class TestAnimationCodec:
         assert abs(result["t"] - 1.5) < 0.01
         assert abs(result["dt"] - 0.016) < 0.001
 
+    def test_decode_anim_tick_reordered_fields(self):
+        enc = PayloadEncoder()
+        enc.put_float(P.TAG_F3, 0.5)
+        enc.put_u32(P.TAG_F1, 3)
+        enc.put_u64(P.TAG_FIGURE_ID, 9)
+        enc.put_float(P.TAG_F2, 2.0)
+        result = decode_anim_tick(enc.take())
+        assert result == {"figure_id": 9, "frame_num": 3, "t": 2.0, "dt": 0.5}
+
     def test_decode_blob_release(self):
         enc = PayloadEncoder()
         enc.put_string(P.TAG_BLOB_SHM, "/spectra-blob-123-1")
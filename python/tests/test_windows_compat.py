@@ -173,6 +173,36 @@ class TestFindBackendBinary:
                     assert result == bin_path
 
 
+class TestBackendMain:
+    """Test the spectra-backend console script exec path."""
+
+    def test_binary_lookup_is_cached(self):
+        from spectra import _cli
+        with tempfile.NamedTemporaryFile() as f:
+            with mock.patch.object(_cli, "_CACHED_BINARY", None), \
+                 mock.patch("spectra._launcher._find_backend_binary",
+                            return_value=f.name) as find:
+                assert _cli._backend_binary() == f.name
+                assert _cli._backend_binary() == f.name
+                assert find.call_count == 1
+
+    @mock.patch("spectra._cli._platform.system", return_value="Linux")
+    def test_execve_strips_python_env(self, _system):
+        from spectra import _cli
+        env = {"PYTHONDONTWRITEBYTECODE": "1", "PIP_INDEX_URL": "x",
+               "SPECTRA_DEBUG_LOG": "/tmp/log", "HOME": "/home/u"}
+        with mock.patch.dict(os.environ, env, clear=True), \
+             mock.patch.object(sys, "argv", ["spectra-backend", "--socket", "s"]), \
+             mock.patch.object(_cli, "_backend_binary", return_value="/opt/spectra-backend"), \
+             mock.patch.object(_cli.os, "execve") as execve:
+            _cli.backend_main()
+        execve.assert_called_once_with(
+            "/opt/spectra-backend",
+            ["/opt/spectra-backend", "--socket", "s"],
+            {"SPECTRA_DEBUG_LOG": "/tmp/log", "HOME": "/home/u"},
+        )
+
+
 class TestCanConnect:
     """Test _can_connect handles missing AF_UNIX gracefully."""
 